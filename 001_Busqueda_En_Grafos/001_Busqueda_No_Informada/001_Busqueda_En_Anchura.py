@@ -1,4 +1,5 @@
-from collections import deque #Importamos deque para usarlo como cola
+from grafo_csr import GrafoCSR #Grafo compacto: nodos como enteros y aristas en arreglos
+from recorrido import recorrido_anchura #Motor de recorrido con visitados en un bytearray
 
 #Este metodo comienza desde lo amplio, es decir, le da prioridad a lo amplio antes que a lo profundo.
 #Ejemplo de la lista de un grafo:
@@ -14,23 +15,17 @@ grafo = {
 }
 
 def busqueda_en_anchura(grafo, nodo_inicial): #Funcion de busqueda en anchura
-    queue = deque([nodo_inicial])  # Cola para los nodos por visitar
+    # Acepta el diccionario de siempre o un GrafoCSR; internamente se trabaja con ids enteros
+    g = GrafoCSR.desde(grafo)
 
-    visitados = []  # Conjunto para los nodos ya visitados
+    # El motor usa una cola (deque) y marca cada nodo en un bytearray al meterlo a la cola,
+    # asi preguntar "ya fue visitado?" cuesta O(1) en lugar de recorrer la lista de visitados
+    visitados = recorrido_anchura(g, g.id(nodo_inicial))
 
-    while queue: #Mientras que la cola no este vacia
-        nodo_actual = queue.popleft()  # Sacar el primer nodo de la cola
-
-        if nodo_actual not in visitados:  # Si el nodo no ha sido visitado
-            visitados.append(nodo_actual)  # Marcar como visitado y lo agrega
-
-            vecinos = grafo[nodo_actual]  # Obtener los vecinos del nodo actual
-            for vecino in vecinos:  # Para cada vecino
-                if vecino not in visitados:  # Si no ha sido visitado
-                    queue.append(vecino)  # Agregar a la cola
-
-    return visitados
+    return g.a_nombres(visitados) # Traducimos los ids a los nombres originales
 
 #Comenzando la busqueda en anchura desde el nodo 'A':
-result = busqueda_en_anchura(grafo, 'A')
+# El diccionario se convierte a CSR una sola vez y el GrafoCSR se reutiliza en cada búsqueda
+grafo_csr = GrafoCSR.desde(grafo)
+result = busqueda_en_anchura(grafo_csr, 'A')
 print("Recorrido en anchura:", result)
\ No newline at end of file
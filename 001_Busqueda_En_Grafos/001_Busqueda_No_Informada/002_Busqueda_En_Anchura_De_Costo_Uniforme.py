@@ -1,7 +1,8 @@
 # El objetivo de este algoritmo es encontrar el camino con menor costo total
 # Ahora cada vecino debe de tener un costo.
 
-import heapq  # Importamos heapq para usarlo como una cola de prioridad
+from grafo_csr import GrafoCSR  # Grafo compacto: nodos como enteros y aristas (con pesos) en arreglos
+from recorrido import costo_uniforme  # Motor de costo uniforme con cola de prioridad indexada
 
 # El grafo ahora incluye el "costo" para ir de un nodo a otro
 # Formato: 'Nodo': [('Vecino1', costo1), ('Vecino2', costo2), ...]
@@ -17,56 +18,27 @@ grafo_con_costos = {
 
 
 def busqueda_costo_uniforme(grafo, nodo_inicial):
+    # Acepta el diccionario de siempre o un GrafoCSR; internamente se trabaja con ids enteros
+    g = GrafoCSR.desde(grafo)
+
+    # El motor (recorrido.costo_uniforme) se diferencia de la búsqueda en anchura en que:
     # --- Diferencia 1: La cola de prioridad ---
-    # Almacena tuplas: (costo_acumulado, nodo)
-    # Empezamos con costo 0 para el nodo inicial.
-    priority_queue = [(0, nodo_inicial)]
-    
+    #     Guarda cada nodo una sola vez con su costo acumulado como prioridad,
+    #     y siempre saca el nodo con el MENOR costo acumulado.
     # --- Diferencia 2: Almacén de costos ---
-    # Un diccionario para llevar el costo mínimo encontrado
-    # hasta ahora para llegar a cada nodo.
-    costos = {nodo_inicial: 0}
-    
-    # --- Diferencia 3: Almacén de recorrido ---
-    # Guardaremos el orden en que visitamos los nodos
-    # (sacamos de la cola de prioridad)
-    recorrido = []
-    
-    # Usar un set() es más eficiente para buscar
-    visitados = set() 
-
-    while priority_queue: # Mientras la cola de prioridad no esté vacía
-        
-        # --- Diferencia 4: Sacar de la cola ---
-        # Sacamos el nodo con el MENOR costo acumulado
-        costo_actual, nodo_actual = heapq.heappop(priority_queue)
-
-        # Si ya lo visitamos (por un camino anterior más corto), lo ignoramos
-        if nodo_actual in visitados:
-            continue
-            
-        # Lo marcamos como visitado y lo agregamos al recorrido
-        visitados.add(nodo_actual)
-        recorrido.append(nodo_actual)
-
-        # Exploramos los vecinos
-        for vecino, peso_arista in grafo[nodo_actual]:
-            if vecino not in visitados:
-                # Calculamos el nuevo costo para llegar a ese vecino
-                nuevo_costo = costo_actual + peso_arista
-                
-                # --- Diferencia 5: Lógica de actualización ---
-                # Si no lo habíamos alcanzado O encontramos un camino MÁS BARATO
-                if vecino not in costos or nuevo_costo < costos[vecino]:
-                    # Actualizamos su costo mínimo
-                    costos[vecino] = nuevo_costo
-                    # Agregamos al vecino a la cola de prioridad con su nuevo costo
-                    heapq.heappush(priority_queue, (nuevo_costo, vecino))
+    #     Lleva el costo mínimo encontrado hasta ahora para llegar a cada nodo.
+    # --- Diferencia 3: Lógica de actualización ---
+    #     Si encontramos un camino MÁS BARATO hacia un vecino, bajamos su prioridad (decrease-key).
+    recorrido, distancias = costo_uniforme(g, g.id(nodo_inicial))
 
-    return recorrido, costos
+    # Traducimos los ids a los nombres originales (solo los nodos alcanzados tienen costo)
+    costos = {g.nombre(nodo): costo for nodo, costo in enumerate(distancias) if costo != float('inf')}
+    return g.a_nombres(recorrido), costos
 
 # --- Ejecutando la búsqueda ---
-recorrido_ucs, costos_finales = busqueda_costo_uniforme(grafo_con_costos, 'A')
+# El diccionario se convierte a CSR una sola vez y el GrafoCSR se reutiliza en cada búsqueda
+grafo_csr = GrafoCSR.desde(grafo_con_costos)
+recorrido_ucs, costos_finales = busqueda_costo_uniforme(grafo_csr, 'A')
 
 print("Recorrido en Costo Uniforme:", recorrido_ucs)
 print("Costos finales desde 'A':", costos_finales)
\ No newline at end of file
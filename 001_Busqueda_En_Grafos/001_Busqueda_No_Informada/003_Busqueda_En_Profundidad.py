@@ -1,4 +1,6 @@
 # No necesitamos deque, una lista normal de Python funciona como pila (stack)
+from grafo_csr import GrafoCSR # Grafo compacto: nodos como enteros y aristas en arreglos
+from recorrido import recorrido_profundidad # Motor de recorrido con visitados en un bytearray
 
 # Usamos el mismo grafo
 grafo = {
@@ -12,26 +14,17 @@ grafo = {
 }
 
 def busqueda_en_profundidad(grafo, nodo_inicial):
-    # En lugar de 'queue' (cola), la llamamos 'stack' (pila)
-    stack = [nodo_inicial]  ### <-- CAMBIO 1: De deque() a una lista []
+    # Acepta el diccionario de siempre o un GrafoCSR; internamente se trabaja con ids enteros
+    g = GrafoCSR.desde(grafo)
 
-    visitados = []
+    # En lugar de 'queue' (cola), el motor usa un 'stack' (pila): saca el último elemento (pop)
+    # Los visitados se marcan en un bytearray indexado por id, asi la consulta es O(1)
+    visitados = recorrido_profundidad(g, g.id(nodo_inicial))
 
-    while stack: # Mientras la pila no esté vacía
-        # Sacamos el último elemento de la pila (en vez de el primero)
-        nodo_actual = stack.pop()  ### <-- CAMBIO 2: De popleft() a pop()
-
-        if nodo_actual not in visitados:
-            visitados.append(nodo_actual)
-
-            vecinos = grafo[nodo_actual]
-            # Agregamos los vecinos a la pila
-            for vecino in vecinos:
-                if vecino not in visitados:
-                    stack.append(vecino)
-
-    return visitados
+    return g.a_nombres(visitados)
 
 # Comenzando la búsqueda en profundidad desde el nodo 'A':
-result = busqueda_en_profundidad(grafo, 'A')
+# El diccionario se convierte a CSR una sola vez y el GrafoCSR se reutiliza en cada búsqueda
+grafo_csr = GrafoCSR.desde(grafo)
+result = busqueda_en_profundidad(grafo_csr, 'A')
 print("Recorrido en profundidad:", result)
\ No newline at end of file
@@ -1,3 +1,6 @@
+from grafo_csr import GrafoCSR # Grafo compacto: nodos como enteros y aristas en arreglos
+from recorrido import recorrido_profundidad # Motor de recorrido con visitados en un bytearray
+
 # Usamos el mismo grafo
 grafo = {
     'A': ['B', 'C', 'D'], #A tiene tres vecinos: B, C y D
@@ -10,48 +13,35 @@ grafo = {
 }
 
 def busqueda_profundidad_limitada(grafo, nodo_inicial, limite):
-    # La pila ahora guarda tuplas: (nodo, profundidad)
-    # Empezamos en el nodo inicial, en profundidad 0
-    stack = [(nodo_inicial, 0)]  # Se le agrega el 0 como profundidad inicial
-
-    visitados = [] # Lista de nodos visitados
-
-    while stack: # Mientras la pila no esté vacía
-        # Sacamos tanto el nodo como su profundidad actual
-        nodo_actual, profundidad = stack.pop() ### <-- CAMBIO 2
-
-        if nodo_actual not in visitados:
-            visitados.append(nodo_actual)
+    g = GrafoCSR.desde(grafo) # Acepta el diccionario de siempre o un GrafoCSR
 
-            #Implementacion del limite de profundidad
-            # Solo exploramos los vecinos SI AÚN NO HEMOS LLEGADO AL LÍMITE
-            if profundidad < limite:  ### <-- CAMBIO 3
-                vecinos = grafo[nodo_actual]
-                for vecino in vecinos:
-                    if vecino not in visitados:
-                        # Añadimos el vecino con la profundidad incrementada
-                        stack.append((vecino, profundidad + 1)) 
+    # La pila del motor guarda tuplas: (nodo, profundidad), empezando en profundidad 0
+    # Solo se exploran los vecinos SI AÚN NO HEMOS LLEGADO AL LÍMITE
+    # Los visitados se marcan en un bytearray indexado por id, asi la consulta es O(1)
+    visitados = recorrido_profundidad(g, g.id(nodo_inicial), limite)
 
-    return visitados
+    return g.a_nombres(visitados)
 
 #Probando el algoritmo con diferentes límites:
+# El diccionario se convierte a CSR una sola vez y el GrafoCSR se reutiliza en cada búsqueda
+grafo_csr = GrafoCSR.desde(grafo)
 
 print("--- Límite = 0 ---")
 # Solo debe visitar el nodo inicial
-result_0 = busqueda_profundidad_limitada(grafo, 'A', 0)
+result_0 = busqueda_profundidad_limitada(grafo_csr, 'A', 0)
 print(result_0)
 
 print("\n--- Límite = 1 ---")
 # Debe visitar 'A' y sus vecinos directos
-result_1 = busqueda_profundidad_limitada(grafo, 'A', 1)
+result_1 = busqueda_profundidad_limitada(grafo_csr, 'A', 1)
 print(result_1)
 
 print("\n--- Límite = 2 ---")
 # Debe visitar 'A', sus vecinos, y los vecinos de sus vecinos
-result_2 = busqueda_profundidad_limitada(grafo, 'A', 2)
+result_2 = busqueda_profundidad_limitada(grafo_csr, 'A', 2)
 print(result_2)
 
 print("\n--- Límite = 3 ---")
 # Ahora sí debería alcanzar el grafo completo
-result_3 = busqueda_profundidad_limitada(grafo, 'A', 3)
+result_3 = busqueda_profundidad_limitada(grafo_csr, 'A', 3)
 print(result_3)
\ No newline at end of file
@@ -1,36 +1,22 @@
-
+from grafo_csr import GrafoCSR # Grafo compacto: nodos como enteros y aristas en arreglos
+from recorrido import iter_dfs # Recorrido en profundidad como generador
 
 def busqueda_profundidad_limitada_DLS(grafo, nodo_inicial, nodo_objetivo, limite):
     """
     Esta es la función DLS (Depth Limited Search), pero ahora devuelve True si encuentra
     el objetivo dentro del límite, y False si no lo encuentra.
+    Acepta el diccionario de siempre o un GrafoCSR.
     """
-    # La pila guarda tuplas: (nodo, profundidad)
-    stack = [(nodo_inicial, 0)]
-    
-    # Usamos un 'set' para los visitados para evitar ciclos y
-    # no visitar el mismo nodo múltiples veces en la misma búsqueda.
-    visitados = set()
-
-    while stack:
-        nodo_actual, profundidad = stack.pop()
-
-        # --- Verificación del Objetivo ---
-        if nodo_actual == nodo_objetivo:
-            return True  # ¡Encontrado!
-
-        if nodo_actual not in visitados:
-            visitados.add(nodo_actual)
-
-            # Solo exploramos si no hemos llegado al límite
-            if profundidad < limite:
-                vecinos = grafo[nodo_actual]
-                # Invertimos los vecinos para que el stack los saque
-                # en el mismo orden que en el algoritmo de ejemplo anterior (B, C, D)
-                for vecino in reversed(vecinos): 
-                    if vecino not in visitados:
-                        stack.append((vecino, profundidad + 1))
-                        
+    # El generador hace el recorrido con la pila de tuplas (nodo, profundidad) y los visitados.
+    # en_orden=True invierte los vecinos para que el stack los saque
+    # en el mismo orden que en el algoritmo de ejemplo anterior (B, C, D).
+    # El predicado solo deja pasar al objetivo y max_nodos=1 corta en cuanto aparece.
+    encontrados = iter_dfs(grafo, nodo_inicial, limite=limite, en_orden=True,
+                           predicado=lambda nodo: nodo == nodo_objetivo, max_nodos=1)
+
+    for _ in encontrados:
+        return True  # ¡Encontrado!
+
     return False # No se encontró en este límite
 
 # --- 2. El nuevo algoritmo IDDFS ---
@@ -41,35 +27,146 @@ grafo = {
     'D': [], 'E': [], 'F': ['G'], 'G': []
 }
 
-def busqueda_profundidad_iterativa_IDDFS(grafo, nodo_inicial, nodo_objetivo):
+def dls_contando(grafo, nodo_inicial, nodo_objetivo, limite):
     """
-    Esta es la función principal de IDDFS.
-    Llama a DLS en un bucle, aumentando el límite.
+    DLS clásico que además cuenta los nodos visitados y dice si el límite cortó algo.
+    Los visitados son solo los del camino actual (un nodo se suelta al regresar de él), así un nodo
+    alcanzado primero por un camino largo se vuelve a probar por uno corto y el objetivo aparece en
+    su profundidad mínima, igual que en el modo incremental.
+    Devuelve (encontrado, nodos_visitados, cortado):
+      - nodos_visitados: cuántas veces se llegó a un nodo (contando repeticiones por caminos distintos)
+      - cortado: algún nodo a profundidad 'limite' tiene un vecino fuera de su camino,
+        así que con un límite mayor todavía puede aparecer algo nuevo
     """
-    
+    g = GrafoCSR.desde(grafo)
+    inicio, objetivo = g.id(nodo_inicial), g.id(nodo_objetivo)
+    if inicio is None:
+        return False, 0, False
+    if inicio == objetivo:
+        return True, 1, False
+
+    en_camino = bytearray(len(g))  # Nodos del camino actual
+    visitados, cortado = 1, False
+    if limite == 0:
+        return False, visitados, any(vecino != inicio for vecino in g.vecinos(inicio))
+    en_camino[inicio] = 1
+    camino = [(inicio, iter(g.vecinos(inicio)))]  # Cada nodo del camino con los vecinos que le faltan
+
+    while camino:
+        nodo, pendientes = camino[-1]
+        vecino = next(pendientes, None)
+        if vecino is None:
+            en_camino[nodo] = 0  # Se regresa de 'nodo': otro camino puede volver a pasar por él
+            camino.pop()
+            continue
+        if en_camino[vecino]:
+            continue
+        visitados += 1
+        if vecino == objetivo:
+            return True, visitados, False
+        if len(camino) == limite:
+            # 'vecino' está en el límite: no se expande, solo se ve si tiene a dónde seguir
+            cortado = cortado or any(not en_camino[v] and v != vecino for v in g.vecinos(vecino))
+        else:
+            en_camino[vecino] = 1
+            camino.append((vecino, iter(g.vecinos(vecino))))
+    return False, visitados, cortado
+
+
+def busqueda_profundidad_iterativa_IDDFS(grafo, nodo_inicial, nodo_objetivo,
+                                         reutilizar_frontera=True, max_frontera=1_000_000, conteos=None):
+    """
+    Esta es la función principal de IDDFS. Aumenta el límite de profundidad 0, 1, 2, ...
+      - reutilizar_frontera=True: guarda la frontera de profundidad d (los nodos recién alcanzados)
+        y en la siguiente iteración solo expande esa capa nueva, en vez de repetir todo desde el inicio.
+      - max_frontera: presupuesto de memoria; si la frontera crece más que esto se descarta y se
+        vuelve a la estrategia clásica de llamar a DLS desde cero en cada límite.
+      - conteos: lista opcional donde se agrega (limite, nodos_visitados) por cada iteración.
+    """
+    # Convertimos una sola vez para no repetir la conversión en cada límite
+    g = GrafoCSR.desde(grafo)
+    inicio, objetivo = g.id(nodo_inicial), g.id(nodo_objetivo)
+
     # Empezamos a buscar con límite 0, luego 1, 2, ...
     limite = 0
-    
-    while True: # Este bucle simula el incremento "infinito"
-        print(f"--- Intentando con Límite = {limite} ---")
-        
-        # Llamamos a nuestro DLS
-        if busqueda_profundidad_limitada_DLS(grafo, nodo_inicial, nodo_objetivo, limite):
-            # Si DLS devuelve True, lo encontramos
+
+    # --- Modo incremental: la frontera de la profundidad anterior se conserva ---
+    if reutilizar_frontera:
+        visitado = bytearray(len(g))  # Nodos ya alcanzados en alguna iteración anterior
+        visitado[inicio] = 1
+        frontera = [inicio]  # Nodos a profundidad exactamente igual a 'limite'
+
+        while frontera:
+            print(f"--- Intentando con Límite = {limite} (nodos nuevos: {len(frontera)}) ---")
+            if conteos is not None:
+                conteos.append((limite, len(frontera)))
+
+            if objetivo is not None and visitado[objetivo]:
+                print(f"¡Éxito! Nodo '{nodo_objetivo}' encontrado en la profundidad {limite}.")
+                return (nodo_objetivo, limite)
+
+            if len(frontera) > max_frontera:
+                # La frontera ya no cabe en el presupuesto: la soltamos y seguimos como IDDFS clásico.
+                # Hasta este límite ya sabemos que el objetivo no está, así que seguimos con el próximo.
+                print(f"La frontera supera {max_frontera} nodos, se vuelve a la estrategia clásica.")
+                frontera = visitado = None
+                limite += 1
+                break
+
+            # Expandimos solo la capa nueva para obtener la de profundidad limite + 1
+            nueva_frontera = []
+            for nodo in frontera:
+                for vecino in g.vecinos(nodo):
+                    if not visitado[vecino]:
+                        visitado[vecino] = 1
+                        nueva_frontera.append(vecino)
+            frontera = nueva_frontera
+            limite += 1
+
+        if frontera is not None:
+            # La frontera se vació: ya no queda ningún nodo alcanzable por explorar
+            print(f"Nodo '{nodo_objetivo}' no encontrado.")
+            return None
+
+    # --- Modo clásico: DLS desde cero en cada límite ---
+    while True:
+        encontrado, visitados, cortado = dls_contando(g, nodo_inicial, nodo_objetivo, limite)
+        print(f"--- Intentando con Límite = {limite} (nodos visitados: {visitados}) ---")
+        if conteos is not None:
+            conteos.append((limite, visitados))
+
+        if encontrado:
+            # Si DLS lo encuentra, terminamos
             print(f"¡Éxito! Nodo '{nodo_objetivo}' encontrado en la profundidad {limite}.")
             return (nodo_objetivo, limite)
-        
-        # aquí solo se aumenta el límite.
-        if limite > len(grafo): # Una simple guarda para no ir al infinito
-             print(f"Nodo '{nodo_objetivo}' no encontrado.")
-             return None
+
+        # Si el límite no cortó ningún camino, DLS ya vio todo lo alcanzable y el objetivo no está.
+        # Un camino del DLS no repite nodos, así que con limite >= len(g) nunca hay corte.
+        if not cortado or limite >= len(g):
+            print(f"Nodo '{nodo_objetivo}' no encontrado.")
+            return None
 
         limite += 1 # Incrementamos el límite para la próxima iteración
 
 # --- Ejecutando la búsqueda ---
+# El diccionario se convierte a CSR una sola vez y el GrafoCSR se reutiliza en cada búsqueda
+grafo_csr = GrafoCSR.desde(grafo)
 
 print("Buscando el nodo 'G'...")
-busqueda_profundidad_iterativa_IDDFS(grafo, 'A', 'G')
+busqueda_profundidad_iterativa_IDDFS(grafo_csr, 'A', 'G')
 
 print("\nBuscando el nodo 'Z' (no existe)...")
-busqueda_profundidad_iterativa_IDDFS(grafo, 'A', 'Z')
\ No newline at end of file
+busqueda_profundidad_iterativa_IDDFS(grafo_csr, 'A', 'Z')
+
+print("\nBuscando el nodo 'G' con la estrategia clásica (reinicio en cada límite)...")
+busqueda_profundidad_iterativa_IDDFS(grafo_csr, 'A', 'G', reutilizar_frontera=False)
+
+# Grafo con dos caminos a C: por A-B-C la D queda a profundidad 3, pero por A-C está a profundidad 2.
+# Las dos estrategias deben encontrarla en la profundidad mínima
+grafo_corte = GrafoCSR.desde({'A': ['B', 'C'], 'B': ['C'], 'C': ['D'], 'D': []})
+print("\nBuscando 'D' en un grafo con dos caminos a C (estrategia incremental)...")
+assert busqueda_profundidad_iterativa_IDDFS(grafo_corte, 'A', 'D') == ('D', 2)
+print("\nLo mismo con la estrategia clásica...")
+assert busqueda_profundidad_iterativa_IDDFS(grafo_corte, 'A', 'D', reutilizar_frontera=False) == ('D', 2)
+print("\nLo mismo con max_frontera=0 (se pasa a la estrategia clásica de inmediato)...")
+assert busqueda_profundidad_iterativa_IDDFS(grafo_corte, 'A', 'D', max_frontera=0) == ('D', 2)
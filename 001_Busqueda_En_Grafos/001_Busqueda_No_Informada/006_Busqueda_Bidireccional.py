@@ -1,4 +1,6 @@
-from collections import deque
+import heapq # Cola de prioridad para la versión con pesos
+from array import array # Arreglos compactos indexados por id (padres y distancias)
+from grafo_csr import GrafoCSR # Grafo compacto: nodos como enteros y aristas en arreglos
 
 # Algoritmo de Búsqueda Bidireccional
 #La caracteristica principal de este algoritmo es que realiza dos búsquedas simultáneas:
@@ -22,7 +24,10 @@ def crear_grafo_inverso(g):
     """
     Invierte todas las 'flechas' del grafo.
     Si A -> C, en el inverso C -> A.
+    Si recibe un GrafoCSR devuelve su inverso en formato CSR.
     """
+    if isinstance(g, GrafoCSR):
+        return g.inverso()
     g_inverso = {nodo: [] for nodo in g} # Inicializa el nuevo grafo
     for nodo_origen, vecinos in g.items():
         for nodo_destino in vecinos:
@@ -35,68 +40,167 @@ def crear_grafo_inverso(g):
 def reconstruir_camino(padres_inicio, padres_fin, nodo_encuentro):
     """
     Une los dos caminos en el punto de encuentro.
+    padres_inicio y padres_fin son arreglos indexados por id (-1 = sin padre).
+    Cada nodo se agrega al final de una lista, así el costo es O(largo del camino).
     """
-    camino = [nodo_encuentro]
-    
-    # 1. Reconstruye el camino desde el INICIO hasta el encuentro
+    # 1. Reconstruye el camino desde el encuentro hasta el INICIO y luego lo invierte
+    camino = []
     temp = nodo_encuentro
-    while padres_inicio[temp] is not None:
-        camino.insert(0, padres_inicio[temp]) # Añade al *principio* de la lista
+    while temp != -1:
+        camino.append(temp) # Añade al *final* de la lista (O(1))
         temp = padres_inicio[temp]
-        
-    # 2. Reconstruye el camino desde el FIN hasta el encuentro
-    temp = nodo_encuentro
-    while padres_fin[temp] is not None:
-        camino.append(padres_fin[temp]) # Añade al *final* de la lista
+    camino.reverse()
+
+    # 2. Continúa desde el encuentro hasta el FIN
+    temp = padres_fin[nodo_encuentro]
+    while temp != -1:
+        camino.append(temp) # Añade al *final* de la lista
         temp = padres_fin[temp]
-        
+
     return camino
 
-# --- 3. Implementacio del algoritmo de Búsqueda Bidireccional ---
+# --- 3. Búsqueda bidireccional sin pesos (BFS por capas) ---
+
+def _expandir_capa(g, frontera, padres, distancias, distancias_otro):
+    """
+    Expande una capa completa de una de las dos búsquedas.
+    Devuelve la nueva frontera y el mejor encuentro (costo_total, nodo) encontrado en la capa.
+    """
+    nueva_frontera = []
+    mejor = None
+    for nodo in frontera:
+        for vecino in g.vecinos(nodo):
+            if distancias[vecino] < 0: # Primera vez que este lado alcanza al vecino
+                padres[vecino] = nodo
+                distancias[vecino] = distancias[nodo] + 1
+                nueva_frontera.append(vecino)
+                # ¿La otra búsqueda ya alcanzó este nodo? Entonces las dos se encontraron
+                if distancias_otro[vecino] >= 0:
+                    total = distancias[vecino] + distancias_otro[vecino]
+                    if mejor is None or total < mejor[0]:
+                        mejor = (total, vecino)
+    return nueva_frontera, mejor
+
+
+def _bidireccional_sin_pesos(g, g_inverso, inicio, objetivo):
+    n = len(g)
+    padres_inicio, padres_fin = array('i', [-1]) * n, array('i', [-1]) * n
+    dist_inicio, dist_fin = array('q', [-1]) * n, array('q', [-1]) * n
+    dist_inicio[inicio], dist_fin[objetivo] = 0, 0
+    frontera_inicio, frontera_fin = [inicio], [objetivo]
+
+    while frontera_inicio and frontera_fin: # Mientras ambos exploradores tengan dónde buscar
+        # Siempre se mueve el explorador con la frontera MÁS PEQUEÑA (es el paso más barato).
+        # Se expande la capa completa: así el primer encuentro ya es un camino más corto.
+        if len(frontera_inicio) <= len(frontera_fin):
+            frontera_inicio, encuentro = _expandir_capa(g, frontera_inicio, padres_inicio, dist_inicio, dist_fin)
+            lado = "INICIO"
+        else:
+            # Hacia "atrás" usando el grafo inverso
+            frontera_fin, encuentro = _expandir_capa(g_inverso, frontera_fin, padres_fin, dist_fin, dist_inicio)
+            lado = "FIN"
+        if encuentro is not None:
+            return encuentro[1], padres_inicio, padres_fin, lado
+
+    return None, padres_inicio, padres_fin, None
+
+# --- 4. Búsqueda bidireccional con pesos (Dijkstra bidireccional) ---
+
+def _bidireccional_con_pesos(g, g_inverso, inicio, objetivo):
+    n = len(g)
+    infinito = float('inf')
+    padres = (array('i', [-1]) * n, array('i', [-1]) * n)
+    distancias = (array('d', [infinito]) * n, array('d', [infinito]) * n)
+    cerrado = (bytearray(n), bytearray(n))
+    grafos = (g, g_inverso)
+    distancias[0][inicio], distancias[1][objetivo] = 0, 0
+    colas = ([(0, inicio)], [(0, objetivo)])
+
+    mejor_costo, encuentro, lado_encuentro = infinito, None, None
+    while colas[0] and colas[1]:
+        # Regla de parada: ningún camino que falte por descubrir puede ser más barato que el mejor ya visto
+        if colas[0][0][0] + colas[1][0][0] >= mejor_costo:
+            break
+
+        # Se expande el lado con menos nodos en su cola de prioridad
+        lado = 0 if len(colas[0]) <= len(colas[1]) else 1
+        otro = 1 - lado
+        costo_actual, nodo_actual = heapq.heappop(colas[lado])
+        if cerrado[lado][nodo_actual]:
+            continue # Entrada vieja de la cola (ya se encontró un camino más barato)
+        cerrado[lado][nodo_actual] = 1
+
+        for vecino, peso in grafos[lado].aristas(nodo_actual):
+            nuevo_costo = costo_actual + peso
+            if nuevo_costo < distancias[lado][vecino]:
+                distancias[lado][vecino] = nuevo_costo
+                padres[lado][vecino] = nodo_actual
+                heapq.heappush(colas[lado], (nuevo_costo, vecino))
+            # Cada arista que toca algo alcanzado por el otro lado es un camino candidato
+            total = distancias[lado][vecino] + distancias[otro][vecino]
+            if total < mejor_costo:
+                mejor_costo, encuentro = total, vecino
+                lado_encuentro = "INICIO" if lado == 0 else "FIN"
+
+    return encuentro, padres[0], padres[1], lado_encuentro, mejor_costo
+
+def _inverso_con_ids(g, grafo_inverso):
+    """
+    Inverso de g con los mismos ids. Solo con un GrafoCSR el inverso queda guardado entre llamadas
+    (g.inverso()); un diccionario de inverso se traduce a CSR en cada llamada con los ids de g.
+    """
+    if grafo_inverso is None:
+        return g.inverso()
+    if isinstance(grafo_inverso, GrafoCSR):
+        return grafo_inverso
+    origenes, destinos = array('i'), array('i')
+    pesos = None if g.pesos is None else array(g.pesos.typecode if isinstance(g.pesos, array) else 'd')
+    for nodo, vecinos in grafo_inverso.items():
+        if isinstance(vecinos, dict):
+            vecinos = vecinos.items()
+        for vecino in vecinos:
+            vecino, peso = vecino if isinstance(vecino, tuple) else (vecino, 1)
+            u, v = g.id(nodo), g.id(vecino)
+            if u is None or v is None:
+                raise ValueError(f"el grafo inverso tiene una arista {nodo} -> {vecino} con nodos que no están en el grafo")
+            origenes.append(u)
+            destinos.append(v)
+            if pesos is not None:
+                pesos.append(peso)
+    return GrafoCSR.desde_aristas(len(g), origenes, destinos, pesos, g.nombres, g.indices)
+
+# --- 5. Implementacio del algoritmo de Búsqueda Bidireccional ---
 
 def busqueda_bidireccional(grafo, grafo_inverso, nodo_inicial, nodo_objetivo):
-    
-    # --- Configuración para la búsqueda DESDE EL INICIO ---
-    queue_inicio = deque([nodo_inicial])
-    # Guardamos {nodo: padre} para reconstruir el camino
-    padres_inicio = {nodo_inicial: None} 
-    
-    # --- Configuración para la búsqueda DESDE EL FIN ---
-    queue_fin = deque([nodo_objetivo])
-    # Guardamos {nodo: padre} para reconstruir el camino
-    padres_fin = {nodo_objetivo: None}
-
-    while queue_inicio and queue_fin: # Mientras ambos exploradores tengan dónde buscar
-
-        # ---PASO 1: Mover el explorador del INICIO ---
-        nodo_actual_i = queue_inicio.popleft()
-        
-        # Comprobación de encuentro
-        if nodo_actual_i in padres_fin:
-            print(f"¡Encuentro en el nodo {nodo_actual_i} (explorado desde INICIO)!")
-            return reconstruir_camino(padres_inicio, padres_fin, nodo_actual_i)
-            
-        # Explorar vecinos hacia adelante
-        for vecino in grafo[nodo_actual_i]:
-            if vecino not in padres_inicio:
-                padres_inicio[vecino] = nodo_actual_i
-                queue_inicio.append(vecino)
-                
-        # ---PASO 2: Mover el explorador del FIN ---
-        nodo_actual_f = queue_fin.popleft()
-        
-        # Comprobación de encuentro
-        if nodo_actual_f in padres_inicio:
-            print(f"¡Encuentro en el nodo {nodo_actual_f} (explorado desde FIN)!")
-            return reconstruir_camino(padres_inicio, padres_fin, nodo_actual_f)
-            
-        # Explorar vecinos "hacia atrás" usando el grafo inverso
-        for vecino_inverso in grafo_inverso[nodo_actual_f]:
-            if vecino_inverso not in padres_fin:
-                padres_fin[vecino_inverso] = nodo_actual_f
-                queue_fin.append(vecino_inverso)
-
-    return "No se encontró camino"
+    """
+    Busca el camino más corto realizando dos búsquedas a la vez (desde el inicio y desde el fin).
+      - Siempre avanza la búsqueda cuya frontera es más pequeña.
+      - Si el grafo tiene pesos usa Dijkstra bidireccional (camino de costo mínimo).
+      - grafo_inverso puede ser None (se calcula con g.inverso()), un GrafoCSR o un diccionario.
+    Acepta el diccionario de siempre o un GrafoCSR. Solo un GrafoCSR evita repetir trabajo entre
+    llamadas: con un diccionario, cada llamada lo convierte a CSR y vuelve a calcular su inverso.
+    """
+    # Internamente se trabaja con ids enteros; el inverso tiene que compartir los ids del grafo
+    g = GrafoCSR.desde(grafo)
+    g_inverso = _inverso_con_ids(g, grafo_inverso)
+    inicio, objetivo = g.id(nodo_inicial), g.id(nodo_objetivo)
+    if inicio is None or objetivo is None:
+        return "No se encontró camino"
+    if inicio == objetivo:
+        return [nodo_inicial]
+
+    if g.pesos is None:
+        encuentro, padres_inicio, padres_fin, lado = _bidireccional_sin_pesos(g, g_inverso, inicio, objetivo)
+        mensaje = ""
+    else:
+        encuentro, padres_inicio, padres_fin, lado, costo = _bidireccional_con_pesos(g, g_inverso, inicio, objetivo)
+        mensaje = f" con costo total {costo}"
+
+    if encuentro is None:
+        return "No se encontró camino"
+
+    print(f"¡Encuentro en el nodo {g.nombre(encuentro)} (explorado desde {lado}){mensaje}!")
+    return g.a_nombres(reconstruir_camino(padres_inicio, padres_fin, encuentro))
 
 # --- Ejecución ---
 
@@ -105,12 +209,27 @@ grafo_inv = crear_grafo_inverso(grafo)
 print("Grafo Original:", grafo)
 print("Grafo Inverso:", grafo_inv)
 
+# El grafo se convierte a CSR una sola vez: su inverso queda guardado en él y lo usan las dos búsquedas
+grafo_csr = GrafoCSR.desde(grafo)
+grafo_inv_csr = crear_grafo_inverso(grafo_csr)
+
 # 2. Ejecutamos la búsqueda
 print("\n--- Iniciando Búsqueda Bidireccional de 'A' a 'G' ---")
-camino_encontrado = busqueda_bidireccional(grafo, grafo_inv, 'A', 'G')
+camino_encontrado = busqueda_bidireccional(grafo_csr, grafo_inv_csr, 'A', 'G')
 
 print("\nCamino más corto:", camino_encontrado)
 
 print("\n--- Buscando de 'A' a 'D' ---")
-camino_corto = busqueda_bidireccional(grafo, grafo_inv, 'A', 'D')
-print("\nCamino más corto:", camino_corto)
\ No newline at end of file
+camino_corto = busqueda_bidireccional(grafo_csr, grafo_inv_csr, 'A', 'D')
+print("\nCamino más corto:", camino_corto)
+
+# 3. Con pesos: Dijkstra bidireccional (el inverso se calcula una sola vez y queda guardado)
+grafo_con_costos = GrafoCSR.desde({
+    'A': [('B', 1), ('C', 4)],
+    'B': [('C', 1), ('D', 6)],
+    'C': [('D', 2)],
+    'D': []
+})
+print("\n--- Buscando de 'A' a 'D' con costos ---")
+camino_costos = busqueda_bidireccional(grafo_con_costos, None, 'A', 'D')
+print("\nCamino de menor costo:", camino_costos)
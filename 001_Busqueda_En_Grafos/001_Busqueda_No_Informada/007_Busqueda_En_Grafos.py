@@ -1,4 +1,5 @@
-from collections import deque
+from grafo_csr import GrafoCSR # Grafo compacto: nodos como enteros y aristas en arreglos
+from recorrido import iter_bfs # Recorrido en anchura como generador (acepta dict o GrafoCSR)
 
 # Algoritmo de Búsqueda en Grafos (Genérico)
 # La característica principal de este algoritmo es que evita entrar en un bucle infinito de nodos ya visitados
@@ -12,53 +13,37 @@ grafo = {
 
 def busqueda_en_grafos_generica(grafo, nodo_inicial, nodo_objetivo):
     
-    # 1. La FRONTERA (la estructura que define el tipo de búsqueda)
-    #    Usaremos una COLA (deque) para hacer una búsqueda tipo BFS.
-    frontera = deque([nodo_inicial])
-    
-    # 2. El conjunto de EXPLORADOS (LA CLAVE de "Búsqueda en Grafos")
-    #    Usamos un 'set' porque es más rápido para buscar.
-    explorados = set()
-    
-    padres = {nodo_inicial: None} # Para reconstruir el camino luego
-
-    while frontera: # Mientras haya nodos por explorar
-        
-        # a. Sacar un nodo de la frontera
-        nodo_actual = frontera.popleft() # .popleft() -> COLA (BFS)
-                                         # .pop()     -> PILA (DFS)
-
-        # b. ¿Es el objetivo?
+    # 1. La FRONTERA (la estructura que define el tipo de búsqueda) vive dentro del generador:
+    #    iter_bfs usa una COLA (deque) -> BFS;  iter_dfs usaría una PILA -> DFS.
+    # 2. El ESTADO de cada nodo (LA CLAVE de "Búsqueda en Grafos") también:
+    #    un bytearray indexado por id marca los nodos que ya están en la frontera o en explorados,
+    #    así ningún nodo entra dos veces y la consulta cuesta O(1).
+    padres = {} # Para reconstruir el camino luego
+
+    # a. El generador nos va entregando cada nodo que saca de la frontera, con su padre
+    for nodo_actual, _, padre in iter_bfs(grafo, nodo_inicial):
+        padres[nodo_actual] = padre # Guardamos su padre
+
+        # b. ¿Es el objetivo? Al salir del bucle el generador deja de explorar
         if nodo_actual == nodo_objetivo:
             print(f"¡Objetivo '{nodo_objetivo}' encontrado!")
             
             # Reconstruir camino desde el inicial hasta el objetivo
             camino = []
             while nodo_actual is not None:
-                camino.insert(0, nodo_actual)
+                camino.append(nodo_actual)
                 nodo_actual = padres[nodo_actual]
+            camino.reverse() # Lo armamos del objetivo al inicio, así que lo invertimos
             return camino
 
-        # c. Añadir el nodo a EXPLORADOS
-        explorados.add(nodo_actual)
-
-        # d. Encontrar vecinos
-        for vecino in grafo[nodo_actual]:
-            
-            # e. ¡LA REGLA DE BÚSQUEDA EN GRAFOS!
-            #    Si el vecino NO está en EXPLORADOS y NO está en la FRONTERA, entonces...
-            if vecino not in explorados and vecino not in frontera:
-                
-                # ...lo añadimos a la frontera para visitarlo después.
-                frontera.append(vecino)
-                padres[vecino] = nodo_actual # Guardamos su padre
-
     return "Objetivo no encontrado"
 
 # --- Ejecución ---
+# El diccionario se convierte a CSR una sola vez y el GrafoCSR se reutiliza en cada búsqueda
+grafo_csr = GrafoCSR.desde(grafo)
 print("--- Ejecutando Búsqueda en Grafos (con base BFS) ---")
-camino_encontrado = busqueda_en_grafos_generica(grafo, 'A', 'G')
+camino_encontrado = busqueda_en_grafos_generica(grafo_csr, 'A', 'G')
 print(f"Camino: {camino_encontrado}")
 
-camino_encontrado_2 = busqueda_en_grafos_generica(grafo, 'A', 'D')
+camino_encontrado_2 = busqueda_en_grafos_generica(grafo_csr, 'A', 'D')
 print(f"\nCamino: {camino_encontrado_2}")
\ No newline at end of file
@@ -0,0 +1,83 @@
+# Micro-benchmark de colas de prioridad con la carga típica de UCS / A*:
+# muchas inserciones, muchas mejoras de prioridad (decrease-key) y extraer hasta vaciar.
+#   - heapq:                 cada mejora mete un duplicado; al extraer se saltan las entradas viejas
+#   - queue.PriorityQueue:   igual que heapq, pero con un candado en cada put/get
+#   - ColaPrioridadIndexada: cada elemento vive una sola vez y su prioridad se baja en su lugar
+#
+# Uso: python benchmark_cola_prioridad.py [num_elementos]   (por defecto 200000)
+
+import heapq
+import random
+import sys
+import time
+from queue import PriorityQueue
+
+from cola_prioridad import ColaPrioridadIndexada
+
+MEJORAS_POR_ELEMENTO = 4  # Como en un grafo denso: cada nodo mejora su costo varias veces
+
+
+def operaciones(n, semilla=0):
+    """Secuencia de (elemento, prioridad) con prioridades que van bajando para cada elemento."""
+    rng = random.Random(semilla)
+    secuencia = [(e, rng.randint(10 ** 6, 2 * 10 ** 6)) for e in range(n)]
+    for _ in range(MEJORAS_POR_ELEMENTO):
+        secuencia.extend((e, rng.randint(0, 10 ** 6)) for e in rng.sample(range(n), n))
+    return secuencia
+
+
+def con_heapq(secuencia):
+    cola, mejor = [], {}
+    for e, p in secuencia:
+        if p < mejor.get(e, float('inf')):
+            mejor[e] = p
+            heapq.heappush(cola, (p, e))
+    maximo = len(cola)
+    extraidos = 0
+    while cola:
+        p, e = heapq.heappop(cola)
+        if p != mejor[e]:
+            continue  # Entrada vieja
+        extraidos += 1
+    return extraidos, maximo
+
+
+def con_priority_queue(secuencia):
+    cola, mejor = PriorityQueue(), {}
+    for e, p in secuencia:
+        if p < mejor.get(e, float('inf')):
+            mejor[e] = p
+            cola.put((p, e))
+    maximo = cola.qsize()
+    extraidos = 0
+    while not cola.empty():
+        p, e = cola.get()
+        if p != mejor[e]:
+            continue
+        extraidos += 1
+    return extraidos, maximo
+
+
+def con_cola_indexada(secuencia):
+    cola = ColaPrioridadIndexada()
+    for e, p in secuencia:
+        cola.disminuir(e, p)
+    maximo = len(cola)
+    extraidos = 0
+    while cola:
+        cola.extraer()
+        extraidos += 1
+    return extraidos, maximo
+
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+secuencia = operaciones(n)
+print(f"{n} elementos, {len(secuencia)} operaciones de inserción/mejora\n")
+for nombre, funcion in [("heapq (duplicados)", con_heapq),
+                        ("queue.PriorityQueue", con_priority_queue),
+                        ("ColaPrioridadIndexada", con_cola_indexada)]:
+    inicio = time.perf_counter()
+    extraidos, maximo = funcion(secuencia)
+    segundos = time.perf_counter() - inicio
+    assert extraidos == n
+    print(f"{nombre:<24} {segundos:8.3f} s   entradas en la cola: {maximo}")
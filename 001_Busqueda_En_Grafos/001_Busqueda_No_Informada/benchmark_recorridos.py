@@ -0,0 +1,48 @@
+# Benchmark de los recorridos en anchura y profundidad
+# Con 'visitados' como lista cada consulta es O(n) y el recorrido es cuadrático.
+# Con el motor de recorrido.py (bytearray indexado por id) el tiempo por arista debe quedarse
+# casi constante desde 10^3 hasta 10^7 nodos, es decir, el crecimiento es lineal.
+#
+# Uso: python benchmark_recorridos.py [exponente_maximo]   (por defecto 7 -> 10^7 nodos)
+
+import sys
+import time
+from array import array
+
+from grafo_csr import GrafoCSR
+from recorrido import recorrido_anchura, recorrido_profundidad
+
+GRADO = 3  # Aristas que salen de cada nodo
+
+
+def grafo_sintetico(n):
+    """
+    Grafo disperso de n nodos con GRADO aristas por nodo, construido directamente en CSR.
+    La arista u -> u + 1 garantiza que todo el grafo es alcanzable desde el nodo 0.
+    """
+    offsets = array('q', range(0, GRADO * n + 1, GRADO))
+    destinos = array('i')
+    for u in range(n):
+        destinos.extend(((u + 1) % n, (2 * u + 1) % n, (7 * u + 3) % n))
+    return GrafoCSR(offsets, destinos)
+
+
+def medir(funcion, g):
+    inicio = time.perf_counter()
+    orden = funcion(g, 0)
+    segundos = time.perf_counter() - inicio
+    assert len(orden) == len(g)  # Todos los nodos deben visitarse exactamente una vez
+    return segundos
+
+
+exponente_maximo = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+
+print(f"{'nodos':>10} {'aristas':>10} {'anchura (s)':>12} {'ns/arista':>10} {'profundidad (s)':>16} {'ns/arista':>10}")
+for exponente in range(3, exponente_maximo + 1):
+    n = 10 ** exponente
+    g = grafo_sintetico(n)
+    m = g.num_aristas()
+    t_anchura = medir(recorrido_anchura, g)
+    t_profundidad = medir(recorrido_profundidad, g)
+    print(f"{n:>10} {m:>10} {t_anchura:>12.3f} {1e9 * t_anchura / m:>10.0f} "
+          f"{t_profundidad:>16.3f} {1e9 * t_profundidad / m:>10.0f}")
@@ -0,0 +1,146 @@
+# Cola de prioridad indexada (montículo binario con "decrease-key")
+# heapq no permite bajar la prioridad de un elemento que ya está en la cola, por eso los scripts
+# meten entradas duplicadas y luego ignoran las viejas. queue.PriorityQueue, además, toma un candado
+# (lock) en cada put/get aunque todo corra en un solo hilo.
+#
+# Esta cola guarda, junto al montículo, la posición de cada elemento. Así se puede:
+#   - saber si un elemento está en la cola en O(1)
+#   - actualizar su prioridad en O(log n) sin crear duplicados
+# Los empates se resuelven por orden de llegada (el primero en entrar sale primero).
+
+
+class ColaPrioridadIndexada:
+    """
+    Montículo binario de mínimos con posición por elemento. Sin candados: pensado para un solo hilo.
+    Los elementos deben poder usarse como claves de diccionario (nombres o ids de nodos).
+    """
+
+    __slots__ = ('_monticulo', '_posicion', '_contador')
+
+    def __init__(self):
+        self._monticulo = []  # Lista de entradas [prioridad, orden_de_llegada, elemento]
+        self._posicion = {}   # elemento -> índice de su entrada en el montículo
+        self._contador = 0    # Desempate estable: cada inserción recibe un número creciente
+
+    def __len__(self):
+        return len(self._monticulo)
+
+    def __bool__(self):
+        return bool(self._monticulo)
+
+    def __contains__(self, elemento):
+        return elemento in self._posicion
+
+    def prioridad(self, elemento):
+        """Prioridad actual de un elemento que está en la cola."""
+        return self._monticulo[self._posicion[elemento]][0]
+
+    def insertar(self, elemento, prioridad):
+        """
+        Agrega el elemento, o actualiza su prioridad si ya estaba (subirla o bajarla).
+        Devuelve True si la cola cambió.
+        """
+        if elemento in self._posicion:
+            i = self._posicion[elemento]
+            entrada = self._monticulo[i]
+            if prioridad == entrada[0]:
+                return False
+            anterior = entrada[0]
+            entrada[0] = prioridad
+            if prioridad < anterior:
+                self._subir(i)
+            else:
+                self._bajar(i)
+            return True
+
+        self._monticulo.append([prioridad, self._contador, elemento])
+        self._contador += 1
+        self._posicion[elemento] = len(self._monticulo) - 1
+        self._subir(len(self._monticulo) - 1)
+        return True
+
+    def disminuir(self, elemento, prioridad):
+        """
+        Inserta el elemento o baja su prioridad (decrease-key). Si la nueva prioridad no es
+        mejor que la actual no hace nada. Devuelve True si la cola cambió.
+        """
+        i = self._posicion.get(elemento)
+        if i is None:
+            i = len(self._monticulo)
+            self._monticulo.append([prioridad, self._contador, elemento])
+            self._contador += 1
+        else:
+            entrada = self._monticulo[i]
+            if prioridad >= entrada[0]:
+                return False
+            entrada[0] = prioridad
+        self._subir(i)  # Bajar la prioridad solo puede mover la entrada hacia arriba
+        return True
+
+    def ver_minimo(self):
+        """(elemento, prioridad) con la menor prioridad, sin sacarlo."""
+        prioridad, _, elemento = self._monticulo[0]
+        return elemento, prioridad
+
+    def extraer(self):
+        """Saca y devuelve (elemento, prioridad) con la menor prioridad."""
+        monticulo = self._monticulo
+        ultimo = monticulo.pop()
+        if monticulo:
+            prioridad, _, elemento = monticulo[0]
+            monticulo[0] = ultimo
+            self._posicion[ultimo[2]] = 0
+            self._bajar(0)
+        else:
+            prioridad, _, elemento = ultimo
+        del self._posicion[elemento]
+        return elemento, prioridad
+
+    def eliminar(self, elemento):
+        """Quita un elemento cualquiera de la cola."""
+        i = self._posicion.pop(elemento)
+        monticulo = self._monticulo
+        ultimo = monticulo.pop()
+        if i < len(monticulo):
+            monticulo[i] = ultimo
+            self._posicion[ultimo[2]] = i
+            self._subir(i)
+            self._bajar(self._posicion[ultimo[2]])
+
+    # --- Operaciones internas del montículo ---
+    # Las entradas son listas [prioridad, orden, elemento]: Python las compara por prioridad y,
+    # en caso de empate, por orden de llegada (que nunca se repite), sin llegar a comparar elementos.
+
+    def _subir(self, i):
+        monticulo, posicion = self._monticulo, self._posicion
+        entrada = monticulo[i]
+        while i > 0:
+            padre = (i - 1) >> 1
+            otro = monticulo[padre]
+            if otro < entrada:
+                break
+            monticulo[i] = otro
+            posicion[otro[2]] = i
+            i = padre
+        monticulo[i] = entrada
+        posicion[entrada[2]] = i
+
+    def _bajar(self, i):
+        monticulo, posicion = self._monticulo, self._posicion
+        n = len(monticulo)
+        entrada = monticulo[i]
+        while True:
+            hijo = 2 * i + 1
+            if hijo >= n:
+                break
+            derecho = hijo + 1
+            if derecho < n and monticulo[derecho] < monticulo[hijo]:
+                hijo = derecho
+            otro = monticulo[hijo]
+            if entrada < otro:
+                break
+            monticulo[i] = otro
+            posicion[otro[2]] = i
+            i = hijo
+        monticulo[i] = entrada
+        posicion[entrada[2]] = i
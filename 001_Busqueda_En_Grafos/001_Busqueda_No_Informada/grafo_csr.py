@@ -0,0 +1,173 @@
+# Grafo compacto en formato CSR (Compressed Sparse Row)
+# Los scripts de esta carpeta representan el grafo como un diccionario de listas con nombres de texto.
+# Eso es muy claro para ejemplos pequeños, pero cada arista cuesta cientos de bytes y cada
+# consulta de vecinos tiene que calcular el hash de una cadena.
+#
+# En formato CSR cada nodo es un entero (0, 1, 2, ...) y todas las aristas viven en arreglos planos:
+#   - offsets[u] .. offsets[u + 1]  -> rango de posiciones de las aristas que salen de u
+#   - destinos[i]                   -> nodo destino de la arista i (entero de 32 bits)
+#   - pesos[i]                      -> costo de la arista i (opcional)
+#
+# Ejemplo con el grafo de siempre (A=0, B=1, C=2, ...):
+#   offsets  = [0, 3, 3, 5, 5, 5, 6, 6]
+#   destinos = [1, 2, 3, 4, 5, 6]
+
+from array import array  # Arreglos compactos de tipos numéricos (sin objetos por elemento)
+
+
+class GrafoCSR:
+    """
+    Grafo dirigido con nodos enteros y aristas en arreglos CSR.
+    Los nombres originales de los nodos se guardan aparte para poder traducir ida y vuelta.
+    """
+
+    __slots__ = ('nombres', 'indices', 'offsets', 'destinos', 'pesos', '_inverso')
+
+    def __init__(self, offsets, destinos, pesos=None, nombres=None, indices=None):
+        # offsets, destinos y pesos pueden ser array.array, listas o arreglos de NumPy
+        self.offsets = offsets
+        self.destinos = destinos
+        self.pesos = pesos
+        # Si no hay nombres, el nombre de cada nodo es su propio id entero
+        self.nombres = nombres
+        if indices is None and nombres is not None:
+            indices = {nombre: i for i, nombre in enumerate(nombres)}
+        self.indices = indices
+        self._inverso = None
+
+    # --- 1. Construcción ---
+
+    @classmethod
+    def desde_diccionario(cls, grafo):
+        """
+        Convierte el formato de los scripts a CSR. Acepta los tres formatos usados en el repositorio:
+          {'A': ['B', 'C']}                  -> sin pesos
+          {'A': [('B', 5), ('C', 2)]}        -> con pesos (lista de tuplas)
+          {'A': {'B': 5, 'C': 2}}            -> con pesos (diccionario)
+        """
+        # Los nodos que solo aparecen como destino también reciben un id
+        nombres = list(grafo)
+        indices = {nombre: i for i, nombre in enumerate(nombres)}
+        con_pesos = False
+        pesos_enteros = True  # Si todos los costos son enteros se guardan como enteros
+        for vecinos in grafo.values():
+            if isinstance(vecinos, dict):
+                vecinos = vecinos.items()
+            for vecino in vecinos:
+                if isinstance(vecino, tuple):
+                    con_pesos = True
+                    pesos_enteros = pesos_enteros and isinstance(vecino[1], int)
+                    vecino = vecino[0]
+                if vecino not in indices:
+                    indices[vecino] = len(nombres)
+                    nombres.append(vecino)
+
+        offsets = array('q', [0])
+        destinos = array('i')
+        pesos = None
+        if con_pesos:
+            pesos = array('q') if pesos_enteros else array('d')
+        for nombre in nombres:
+            vecinos = grafo.get(nombre, ())
+            if isinstance(vecinos, dict):
+                vecinos = vecinos.items()
+            for vecino in vecinos:
+                if isinstance(vecino, tuple):
+                    vecino, peso = vecino
+                else:
+                    peso = 1
+                destinos.append(indices[vecino])
+                if pesos is not None:
+                    pesos.append(peso)
+            offsets.append(len(destinos))
+
+        return cls(offsets, destinos, pesos, nombres)
+
+    @classmethod
+    def desde_aristas(cls, num_nodos, origenes, destinos, pesos=None, nombres=None, indices=None):
+        """
+        Construye el grafo directamente desde listas de aristas (origen[i] -> destino[i]).
+        Es la forma de cargar grafos enormes sin pasar nunca por un diccionario.
+        Las aristas de cada nodo conservan el orden en que aparecen.
+        """
+        # Conteo por nodo origen (ordenamiento por conteo, O(V + E))
+        offsets = array('q', [0]) * (num_nodos + 1)
+        for u in origenes:
+            offsets[u + 1] += 1
+        for u in range(num_nodos):
+            offsets[u + 1] += offsets[u]
+
+        siguiente = array('q', offsets[:num_nodos])
+        destinos_csr = array('i', [0]) * len(destinos)
+        pesos_csr = None
+        if pesos is not None:
+            tipo = pesos.typecode if isinstance(pesos, array) else 'd'
+            pesos_csr = array(tipo, [0]) * len(destinos)
+        for i, u in enumerate(origenes):
+            posicion = siguiente[u]
+            destinos_csr[posicion] = destinos[i]
+            if pesos_csr is not None:
+                pesos_csr[posicion] = pesos[i]
+            siguiente[u] = posicion + 1
+
+        return cls(offsets, destinos_csr, pesos_csr, nombres, indices)
+
+    @classmethod
+    def desde(cls, grafo):
+        """Devuelve el mismo grafo si ya es CSR; si es un diccionario lo convierte."""
+        if isinstance(grafo, cls):
+            return grafo
+        return cls.desde_diccionario(grafo)
+
+    # --- 2. Traducción entre nombres e ids ---
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def id(self, nombre):
+        """Id entero de un nodo, o None si el nodo no existe en el grafo."""
+        if self.indices is None:
+            return nombre if isinstance(nombre, int) and 0 <= nombre < len(self) else None
+        return self.indices.get(nombre)
+
+    def nombre(self, u):
+        """Nombre original del nodo u."""
+        return u if self.nombres is None else self.nombres[u]
+
+    def a_nombres(self, ids):
+        """Traduce una secuencia de ids a la lista de nombres originales."""
+        if self.nombres is None:
+            return list(ids)
+        nombres = self.nombres
+        return [nombres[u] for u in ids]
+
+    # --- 3. Consultas de aristas ---
+
+    def vecinos(self, u):
+        """Ids de los vecinos de u (una rebanada contigua del arreglo de destinos)."""
+        return self.destinos[self.offsets[u]:self.offsets[u + 1]]
+
+    def aristas(self, u):
+        """Pares (vecino, peso) de las aristas que salen de u. Sin pesos, cada arista cuesta 1."""
+        inicio, fin = self.offsets[u], self.offsets[u + 1]
+        if self.pesos is None:
+            return [(v, 1) for v in self.destinos[inicio:fin]]
+        return zip(self.destinos[inicio:fin], self.pesos[inicio:fin])
+
+    def num_aristas(self):
+        return len(self.destinos)
+
+    def inverso(self):
+        """Grafo con todas las flechas invertidas. Se calcula una sola vez y se guarda."""
+        if self._inverso is None:
+            origenes = array('i')
+            for u in range(len(self)):
+                origenes.extend([u] * (self.offsets[u + 1] - self.offsets[u]))
+            self._inverso = GrafoCSR.desde_aristas(len(self), self.destinos, origenes,
+                                                   self.pesos, self.nombres, self.indices)
+            self._inverso._inverso = self
+        return self._inverso
+
+    def a_diccionario(self):
+        """Vuelve al formato de diccionario de listas (útil para imprimir ejemplos pequeños)."""
+        return {self.nombre(u): [self.nombre(v) for v in self.vecinos(u)] for u in range(len(self))}
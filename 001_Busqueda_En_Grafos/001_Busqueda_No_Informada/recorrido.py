@@ -0,0 +1,154 @@
+# Motor de recorridos para los scripts de búsqueda no informada
+# Los scripts originales guardan 'visitados' en una lista y preguntan 'vecino not in visitados'.
+# Esa pregunta recorre toda la lista (O(n)), así que el recorrido completo termina siendo cuadrático.
+#
+# Aquí los nodos son ids enteros de un GrafoCSR, y el estado de cada nodo vive en un bytearray
+# indexado por id: preguntar o marcar un nodo es un solo acceso a memoria (O(1)).
+#
+# Los recorridos son generadores: entregan cada nodo (con su profundidad y su padre) en cuanto
+# se visita, así quien los usa puede detenerse cuando quiera sin construir la lista completa.
+
+from array import array  # Arreglo compacto para el orden de visita
+from collections import deque  # Cola para la búsqueda en anchura
+
+from cola_prioridad import ColaPrioridadIndexada  # Cola de prioridad con "decrease-key"
+from grafo_csr import GrafoCSR
+
+
+# --- 1. Generadores internos (trabajan solo con ids) ---
+
+def _anchura_ids(g, inicio, limite=None):
+    """
+    Recorrido en anchura. Entrega tuplas (id, profundidad, id_padre) en orden de visita.
+    Cada nodo se marca al entrar a la cola, así nunca entra dos veces (O(V + E)).
+    """
+    offsets, destinos = g.offsets, g.destinos  # Referencias locales: acceso más rápido en el bucle
+    descubierto = bytearray(len(g))  # 0 = nunca visto, 1 = ya está (o estuvo) en la cola
+    descubierto[inicio] = 1
+    queue = deque([(inicio, 0, None)])
+
+    while queue:
+        nodo_actual, profundidad, padre = queue.popleft()
+        yield nodo_actual, profundidad, padre
+
+        if limite is not None and profundidad >= limite:
+            continue
+        for i in range(offsets[nodo_actual], offsets[nodo_actual + 1]):
+            vecino = destinos[i]
+            if not descubierto[vecino]:
+                descubierto[vecino] = 1
+                queue.append((vecino, profundidad + 1, nodo_actual))
+
+
+def _profundidad_ids(g, inicio, limite=None, en_orden=False):
+    """
+    Recorrido en profundidad (opcionalmente limitado). Entrega tuplas (id, profundidad, id_padre).
+    Igual que en los scripts, un nodo se marca como visitado al salir de la pila.
+    """
+    offsets, destinos = g.offsets, g.destinos
+    visitado = bytearray(len(g))  # 0 = no visitado, 1 = visitado
+    stack = [(inicio, 0, None)]
+
+    while stack:
+        nodo_actual, profundidad, padre = stack.pop()
+        if visitado[nodo_actual]:
+            continue
+        visitado[nodo_actual] = 1
+        yield nodo_actual, profundidad, padre
+
+        if limite is not None and profundidad >= limite:
+            continue
+        rango = range(offsets[nodo_actual], offsets[nodo_actual + 1])
+        for i in (reversed(rango) if en_orden else rango):
+            vecino = destinos[i]
+            if not visitado[vecino]:
+                stack.append((vecino, profundidad + 1, nodo_actual))
+
+
+def _filtrar(g, recorrido, predicado, max_nodos):
+    """Traduce ids a nombres, aplica el predicado y corta al llegar a max_nodos."""
+    if max_nodos is not None and max_nodos <= 0:
+        return
+    entregados = 0
+    for nodo, profundidad, padre in recorrido:
+        nombre = g.nombre(nodo)
+        if predicado is not None and not predicado(nombre):
+            continue
+        yield nombre, profundidad, (None if padre is None else g.nombre(padre))
+        entregados += 1
+        if entregados == max_nodos:
+            return  # Al salir del generador se libera la cola/pila del recorrido
+
+
+# --- 2. API de recorridos por streaming ---
+
+def iter_bfs(grafo, inicio, limite=None, predicado=None, max_nodos=None):
+    """
+    Generador de búsqueda en anchura. Entrega (nodo, profundidad, padre) al visitar cada nodo.
+      - grafo: diccionario de siempre o GrafoCSR; inicio y los nodos entregados usan sus nombres
+      - limite: no se expanden nodos a esa profundidad o más (None = sin límite)
+      - predicado: si se da, solo se entregan los nodos para los que devuelve True
+      - max_nodos: se detiene después de entregar esa cantidad de nodos
+    Un diccionario se convierte a CSR en cada llamada (O(V + E)): para varias búsquedas sobre el
+    mismo grafo conviene convertirlo una vez con GrafoCSR.desde y pasar el GrafoCSR.
+    """
+    g = GrafoCSR.desde(grafo)
+    return _filtrar(g, _anchura_ids(g, g.id(inicio), limite), predicado, max_nodos)
+
+
+def iter_dfs(grafo, inicio, limite=None, predicado=None, max_nodos=None, en_orden=False):
+    """
+    Generador de búsqueda en profundidad. Mismos parámetros que iter_bfs, y además:
+      - en_orden: si es True los vecinos se apilan al revés para visitarlos en el orden de la lista
+    """
+    g = GrafoCSR.desde(grafo)
+    return _filtrar(g, _profundidad_ids(g, g.id(inicio), limite, en_orden), predicado, max_nodos)
+
+
+# --- 3. Recorridos completos (orden de visita como arreglo de ids) ---
+
+def recorrido_anchura(g, inicio):
+    """Recorrido en anchura completo sobre un GrafoCSR. Devuelve los ids en orden de visita."""
+    return array('i', (nodo for nodo, _, _ in _anchura_ids(g, inicio)))
+
+
+def recorrido_profundidad(g, inicio, limite=None, en_orden=False):
+    """
+    Recorrido en profundidad completo (opcionalmente limitado) sobre un GrafoCSR.
+    Devuelve los ids en orden de visita.
+    """
+    return array('i', (nodo for nodo, _, _ in _profundidad_ids(g, inicio, limite, en_orden)))
+
+
+# --- 4. Costo uniforme (Dijkstra) ---
+
+def costo_uniforme(g, inicio):
+    """
+    Búsqueda de costo uniforme completa sobre un GrafoCSR (si no tiene pesos, cada arista cuesta 1).
+    Devuelve (orden, distancias):
+      - orden: ids en el orden en que salen de la cola de prioridad
+      - distancias: lista indexada por id con el costo mínimo desde inicio (inf si no se alcanza)
+    """
+    offsets, destinos, pesos = g.offsets, g.destinos, g.pesos
+    distancias = [float('inf')] * len(g)
+    distancias[inicio] = 0
+    cerrado = bytearray(len(g))  # 1 = ya salió de la cola con su costo definitivo
+    cola = ColaPrioridadIndexada()
+    cola.insertar(inicio, 0)
+    orden = array('i')
+
+    while cola:
+        nodo_actual, costo_actual = cola.extraer()  # Sin duplicados: nunca sale un nodo ya cerrado
+        cerrado[nodo_actual] = 1
+        orden.append(nodo_actual)
+
+        for i in range(offsets[nodo_actual], offsets[nodo_actual + 1]):
+            vecino = destinos[i]
+            if cerrado[vecino]:
+                continue
+            nuevo_costo = costo_actual + (1 if pesos is None else pesos[i])
+            if nuevo_costo < distancias[vecino]:
+                distancias[vecino] = nuevo_costo
+                cola.disminuir(vecino, nuevo_costo)
+
+    return orden, distancias
@@ -24,26 +24,27 @@ heuristica = {
     'G': 0
 }
 
-from queue import PriorityQueue  # Cola con prioridad para ordenar por heurística
+from busqueda_informada import ColaPrioridadIndexada # Cola de prioridad sin candados y con "decrease-key"
+from busqueda_informada import heuristica_memorizada # Heurística como diccionario o como función h(nodo)
 
 def busqueda_voraz(grafo, heuristica, inicio, objetivo): # Función de búsqueda voraz primero el mejor
-    # Cola de prioridad: guarda tuplas (heurística, nodo)
-    frontera = PriorityQueue() # Inicializa la frontera, la cual ordena los nodos por su valor heurístico
-    frontera.put((heuristica[inicio], inicio)) # Agrega el nodo inicial a la frontera
+    # La heurística puede ser el diccionario de siempre o una función (p. ej. la heurística ALT de landmarks_alt.py)
+    h = heuristica_memorizada(heuristica)
+
+    # Cola de prioridad: cada nodo aparece una sola vez, con su heurística como prioridad
+    frontera = ColaPrioridadIndexada() # Inicializa la frontera, la cual ordena los nodos por su valor heurístico
+    frontera.insertar(inicio, h(inicio)) # Agrega el nodo inicial a la frontera
     
     visitados = set() # Conjunto de nodos visitados
     padres = {inicio: None} # Diccionario para reconstruir el camino, el diccionario hace refencia al nodo padre de cada nodo
 
     print("=== Búsqueda Voraz Primero el Mejor ===\n")
     
-    while not frontera.empty(): # Mientras haya nodos en la frontera
-        _, actual = frontera.get() # Obtener el nodo con la heurística más baja
-        
-        if actual in visitados: # Si ya fue visitado,
-            continue # saltar al siguiente
+    while frontera: # Mientras haya nodos en la frontera
+        actual, _ = frontera.extraer() # Obtener el nodo con la heurística más baja (empates: el primero en llegar)
         visitados.add(actual) # Marcar el nodo como visitado
         
-        print(f"Explorando nodo: {actual} (h={heuristica[actual]})")
+        print(f"Explorando nodo: {actual} (h={h(actual)})")
         
         if actual == objetivo: # Si se alcanza el objetivo
             print("\nObjetivo alcanzado!")
@@ -51,10 +52,10 @@ def busqueda_voraz(grafo, heuristica, inicio, objetivo): # Función de búsqueda
 
         # Agregar vecinos a la frontera según su heurística
         for vecino in grafo[actual]: # Iterar sobre los vecinos del nodo actual
-            if vecino not in visitados: # Si el vecino no ha sido visitado
-                frontera.put((heuristica[vecino], vecino)) # Agregar a la frontera con su valor heurístico
+            if vecino not in visitados and vecino not in frontera: # Si el vecino no ha sido visitado ni está ya en la frontera
+                frontera.insertar(vecino, h(vecino)) # Agregar a la frontera con su valor heurístico
                 padres[vecino] = actual # Registrar el padre del vecino
-                print(f"  Se agrega a la frontera: {vecino} (h={heuristica[vecino]})") # Agregar vecino a la frontera
+                print(f"  Se agrega a la frontera: {vecino} (h={h(vecino)})") # Agregar vecino a la frontera
 
         print()
 
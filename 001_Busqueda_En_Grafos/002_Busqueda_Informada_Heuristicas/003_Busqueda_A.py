@@ -2,7 +2,7 @@
 # La búsqueda A* utiliza tanto el costo acumulado desde el nodo inicial como una función heurística para estimar el costo total hasta el objetivo.
 # En cada paso, elige el nodo con el valor más bajo de f(n) = g(n) + h(n), donde g(n) es el costo desde el inicio hasta el nodo n, y h(n) es la heurística estimada desde n hasta el objetivo.
 
-from queue import PriorityQueue # Esta librería permite manejar una cola de prioridad, de manera que los elementos con menor valor tengan mayor prioridad.
+from busqueda_informada import a_estrella # A* con conjunto cerrado, heurística memorizada y estadísticas
 
 
 # Grafo con costos por cada arista, los aristas en un grafo representan conexiones entre nodos con un costo
@@ -27,52 +27,33 @@ heuristica = {
     'G': 0
 }
 
-def busqueda_a_estrella(grafo, heuristica, inicio, objetivo): # Función de búsqueda A*
-    # Cola de prioridad: (f, nodo)
-    frontera = PriorityQueue() # Inicializa la frontera
-    frontera.put((0, inicio)) # Agrega el nodo inicial con f=0
-    
-    # Costos desde el inicio hasta cada nodo
-    costo_g = {inicio: 0}
-    
-    # Para reconstruir el camino final
-    padres = {inicio: None}
-
-    print("=== Búsqueda A* (A estrella) ===\n")
-
-    while not frontera.empty(): # Mientras haya nodos en la frontera
-        f_actual, actual = frontera.get() # Obtener el nodo con el f más bajo
-        print(f"Explorando nodo: {actual} (f={f_actual}, g={costo_g[actual]}, h={heuristica[actual]})") # Mostrar nodo actual y sus valores f, g, h
-
-        # Verificar si alcanzamos el objetivo
-        if actual == objetivo: # Si se alcanza el objetivo
-            print("\nObjetivo alcanzado!")
-            break
-
-        for vecino, costo in grafo[actual].items(): # Iterar sobre los vecinos y sus costos
-            nuevo_costo_g = costo_g[actual] + costo # Calcular nuevo costo g
-            f_vecino = nuevo_costo_g + heuristica[vecino] # Calcular f(n) = g(n) + h(n)
-
-            # Si es la primera vez que visitamos el nodo o encontramos un camino más barato
-            if vecino not in costo_g or nuevo_costo_g < costo_g[vecino]: # Si encontramos un camino más barato
-                costo_g[vecino] = nuevo_costo_g # Actualizar costo g
-                frontera.put((f_vecino, vecino)) # Agregar/actualizar en la frontera
-                padres[vecino] = actual # Registrar el padre del vecino
-                print(f"  Se agrega/actualiza {vecino}: g={nuevo_costo_g}, h={heuristica[vecino]}, f={f_vecino}") # Mostrar detalles del vecino agregado
-
-        print()
-
-    # Reconstruir camino
-    camino = [] # Lista para el camino óptimo
-    nodo = objetivo # Comenzar desde el objetivo
-    while nodo is not None: # Mientras no lleguemos al inicio
-        camino.insert(0, nodo) # Insertar el nodo al inicio del camino
-        nodo = padres.get(nodo) # Mover al padre del nodo
-    
-    return camino, costo_g.get(objetivo, float('inf')) # Devolver el camino y el costo total
+def busqueda_a_estrella(grafo, heuristica, inicio, objetivo, reabrir=True, max_expansiones=None, tamano_cache=100_000): # Función de búsqueda A*
+    """
+    Búsqueda A*: en cada paso expande el nodo de la frontera con menor f(n) = g(n) + h(n).
+      - heuristica: diccionario {nodo: h} o función h(nodo); la función se memoriza en una caché
+        LRU de tamano_cache entradas, así no se recalcula cada vez que se genera el mismo nodo.
+      - Los nodos expandidos van a un conjunto cerrado. Si aparece un camino más barato hacia un
+        nodo cerrado (heurística inconsistente), se reabre solo si reabrir=True.
+      - max_expansiones: presupuesto de nodos expandidos antes de rendirse.
+    En lugar de imprimir, devuelve (camino, costo, estadisticas), donde estadisticas tiene los
+    campos expandidos, generados, max_frontera y reabiertos.
+    """
+    return a_estrella(grafo, heuristica, inicio, objetivo, reabrir, max_expansiones, tamano_cache)
 
 # Ejemplo de ejecución
-camino, costo_total = busqueda_a_estrella(grafo, heuristica, 'A', 'G') 
-print("\nCamino óptimo encontrado:", " → ".join(camino)) # Mostrar el camino óptimo encontrado
+print("=== Búsqueda A* (A estrella) ===\n")
+camino, costo_total, estadisticas = busqueda_a_estrella(grafo, heuristica, 'A', 'G')
+print("Camino óptimo encontrado:", " → ".join(camino)) # Mostrar el camino óptimo encontrado
 print("Costo total del camino:", costo_total) # Mostrar el costo total del camino encontrado
+print("Estadísticas:", estadisticas) # Nodos expandidos, generados, tamaño máximo de la frontera, reabiertos
+
+# La heurística también puede ser una función, por ejemplo calculada a partir de coordenadas
+coordenadas = {'A': (0, 0), 'B': (1, 2), 'C': (2, 1), 'D': (0, 3), 'E': (2, 3), 'F': (3, 1), 'G': (4, 2)}
+
+def distancia_a_G(nodo): # Distancia en línea recta hasta 'G', escalada para no sobreestimar
+    (x1, y1), (x2, y2) = coordenadas[nodo], coordenadas['G']
+    return 0.5 * ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
 
+camino, costo_total, estadisticas = busqueda_a_estrella(grafo, distancia_a_G, 'A', 'G', tamano_cache=1024)
+print("\nCon heurística calculada:", " → ".join(camino), "| costo:", costo_total)
+print("Estadísticas:", estadisticas)
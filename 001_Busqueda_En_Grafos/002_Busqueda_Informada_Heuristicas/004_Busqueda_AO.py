@@ -27,38 +27,149 @@ grafo = {
 # Heurísticas iniciales (estimación de costo restante)
 h = {'A': 5, 'B': 4, 'C': 3, 'D': 2, 'E': 0, 'F': 0, 'G': 0}
 
-# Función principal AO*
-def ao_star(nodo):
-    print(f"\nEvaluando nodo: {nodo}")
+def costo_conector(conector, costo):
+    # Un conector AND cuesta la suma de (costo de la arista + costo estimado del hijo)
+    return sum(c + costo[hijo] for hijo, c in conector)
 
-    # Si es un nodo terminal, regresamos su heurística
-    if not grafo[nodo]:
-        print(f"  Nodo {nodo} es terminal (h={h[nodo]})")
-        return h[nodo]
+def ao_star(grafo, h, inicio):
+    """
+    AO* sobre un grafo AND-OR. No modifica 'grafo' ni 'h'.
+      - Tabla de costos revisados, nodos resueltos y conector marcado (mejor opción) por nodo:
+        cada subproblema se expande una sola vez aunque lo compartan varios padres.
+      - Las revisiones de costo suben solo por los padres cuyo conector marcado contiene al nodo.
+      - Un conector cuyo hijo ya depende (por conectores marcados) del propio nodo no se puede marcar:
+        un ciclo nunca resuelve nada, así el grafo solución marcado siempre es acíclico.
+    Devuelve (costo, grafo_solucion, nodos_expandidos), donde grafo_solucion es {nodo: [hijos elegidos]}.
+    """
+    costo = {inicio: h[inicio]}  # Costos revisados (empiezan con la heurística)
+    marcado = {}                 # nodo -> índice del mejor conector
+    resueltos = set()            # Nodos cuya solución ya está completa
+    expandidos = set()
+    padres = {}                  # hijo -> padres que lo tienen en algún conector
 
-    costos_ramas = [] # Lista para almacenar costos de cada rama
+    def buscar_punta():
+        # Recorre el grafo solución marcado desde el inicio y devuelve un nodo sin expandir
+        if inicio not in expandidos:
+            return inicio
+        pila, vistos = [inicio], {inicio}
+        while pila:
+            nodo = pila.pop()
+            for hijo, _ in grafo[nodo][marcado[nodo]]:
+                if hijo in resueltos or hijo in vistos:
+                    continue
+                if hijo not in expandidos:
+                    return hijo
+                vistos.add(hijo)
+                pila.append(hijo)
+        return None
 
-    # Evaluar cada conexión (puede ser AND o OR)
-    for conexion in grafo[nodo]: # Cada conexión puede ser un conjunto de nodos (AND) o un solo nodo (OR)
-        costo_total = 0 # Costo total para esta conexión
-        nombres_hijos = [] # Nombres de los hijos en esta conexión
+    def ancestros_marcados(nodo):
+        # Nodos desde los que se baja hasta 'nodo' por conectores marcados (incluido él mismo).
+        # Se sube por 'padres' una sola vez por revisión: son los mismos nodos a los que la revisión
+        # puede propagarse, en lugar de un recorrido hacia abajo por cada hijo de cada conector
+        vistos, pila = {nodo}, [nodo]
+        while pila:
+            actual = pila.pop()
+            for padre in padres.get(actual, ()):
+                if padre not in vistos and padre in marcado and \
+                        any(hijo == actual for hijo, _ in grafo[padre][marcado[padre]]):
+                    vistos.add(padre)
+                    pila.append(padre)
+        return vistos
 
-        # Cada conexión puede tener varios hijos (AND)
-        for (hijo, costo) in conexion: # Iterar sobre los hijos de la conexión
-            costo_total += costo + ao_star(hijo) # Sumar costo del hijo y su heurística
-            nombres_hijos.append(hijo) # Agregar el nombre del hijo
+    def revisar(nodo):
+        # Recalcula costo y conector marcado de 'nodo'; devuelve True si algo cambió
+        antes = (costo.get(nodo), marcado.get(nodo), nodo in resueltos)
+        if not grafo[nodo]:
+            costo[nodo] = h[nodo]  # Nodo terminal: se resuelve con su heurística
+            resueltos.add(nodo)
+        else:
+            # Un hijo sin conector marcado no baja a ningún lado: solo hace falta subir si hay alguno marcado
+            if any(hijo in marcado for conector in grafo[nodo] for hijo, _ in conector):
+                prohibidos = ancestros_marcados(nodo)
+            else:
+                prohibidos = {nodo}
+            opciones = [(costo_conector(conector, costo), i) for i, conector in enumerate(grafo[nodo])
+                        if not any(hijo in prohibidos for hijo, _ in conector)]
+            mejor_costo, mejor = min(opciones, default=(float('inf'), None))
+            costo[nodo] = mejor_costo
+            if mejor is None:
+                marcado.pop(nodo, None)
+            else:
+                marcado[nodo] = mejor
+                if all(hijo in resueltos for hijo, _ in grafo[nodo][mejor]):
+                    resueltos.add(nodo)
+        return antes != (costo.get(nodo), marcado.get(nodo), nodo in resueltos)
 
-        costos_ramas.append((costo_total, nombres_hijos)) # Almacenar el costo total y los nombres de los hijos
+    while inicio not in resueltos and costo[inicio] != float('inf'):
+        punta = buscar_punta()
+        if punta is None:
+            break
 
-    # Seleccionar la rama con menor costo total
-    mejor_costo, mejor_rama = min(costos_ramas, key=lambda x: x[0]) # Elegir la rama con el costo mínimo
-    h[nodo] = mejor_costo  # Actualizar heurística del nodo
+        # 1. Expandir la punta: sus hijos entran a la tabla con su heurística
+        if punta not in expandidos:
+            expandidos.add(punta)
+            for conector in grafo[punta]:
+                for hijo, _ in conector:
+                    padres.setdefault(hijo, set()).add(punta)
+                    costo.setdefault(hijo, h[hijo])
+            for conector in grafo[punta]:
+                for hijo, _ in conector:
+                    if not grafo[hijo]:
+                        revisar(hijo)  # Los terminales quedan resueltos de inmediato
 
-    print(f"  Nodo {nodo} actualiza h = {mejor_costo}, usando hijos {mejor_rama}") # Mostrar actualización de heurística
-    return mejor_costo # Devolver el mejor costo encontrado
+        # 2. Revisar costos hacia arriba, solo por los padres que tienen marcado al nodo que cambió
+        por_revisar = [punta]
+        pendientes = {punta}
+        while por_revisar:
+            nodo = por_revisar.pop()
+            pendientes.discard(nodo)
+            if not revisar(nodo):
+                continue
+            for padre in padres.get(nodo, ()):
+                if padre in marcado and padre not in pendientes and \
+                        any(hijo == nodo for hijo, _ in grafo[padre][marcado[padre]]):
+                    pendientes.add(padre)
+                    por_revisar.append(padre)
+
+    # Grafo solución: se siguen los conectores marcados desde el inicio
+    solucion = {}
+    pila = [inicio] if inicio in resueltos else []
+    while pila:
+        nodo = pila.pop()
+        if nodo in solucion:
+            continue
+        hijos = [hijo for hijo, _ in grafo[nodo][marcado[nodo]]] if grafo[nodo] else []
+        solucion[nodo] = hijos
+        pila.extend(hijos)
+
+    return costo[inicio], solucion, len(expandidos)
 
 
 # Ejecución del algoritmo AO*
 print("=== Búsqueda AO* (AND-OR A estrella) ===")
-costo_total = ao_star('A')
+costo_total, solucion, expandidos = ao_star(grafo, h, 'A')
 print("\n Costo total estimado para resolver A:", costo_total)
+print(" Grafo solución:", solucion)
+print(" Nodos expandidos:", expandidos)
+
+# Subproblemas compartidos: P1 y P2 necesitan S, que se resuelve una sola vez
+grafo_compartido = {
+    'R': [[('P1', 1), ('P2', 1)]],
+    'P1': [[('S', 1)], [('T', 5)]],
+    'P2': [[('S', 2)]],
+    'S': [[('U', 1), ('V', 1)]],
+    'T': [], 'U': [], 'V': []
+}
+h_compartido = {'R': 0, 'P1': 0, 'P2': 0, 'S': 0, 'T': 0, 'U': 0, 'V': 0}
+costo_total, solucion, expandidos = ao_star(grafo_compartido, h_compartido, 'R')
+print("\nCon subproblemas compartidos -> costo:", costo_total, "| solución:", solucion, "| expandidos:", expandidos)
+
+# Con ciclo: X -> Y -> X no resuelve nada, así que se usa la alternativa X -> Z
+grafo_ciclo = {
+    'X': [[('Y', 1)], [('Z', 4)]],
+    'Y': [[('X', 1)]],
+    'Z': []
+}
+costo_total, solucion, expandidos = ao_star(grafo_ciclo, {'X': 0, 'Y': 0, 'Z': 0}, 'X')
+print("Con ciclo -> costo:", costo_total, "| solución:", solucion)
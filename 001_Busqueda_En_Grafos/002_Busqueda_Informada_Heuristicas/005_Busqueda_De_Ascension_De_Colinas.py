@@ -5,6 +5,8 @@
 
 import random
 
+from busqueda_local import ascension_con_reinicios # Reinicios aleatorios repartidos en varios procesos
+
 
 grafo = {
     'A': {'B': 6, 'C': 3},
@@ -66,6 +68,35 @@ def ascension_de_colinas(grafo, heuristica, inicio, objetivo): # Función de bú
 
     return camino # Devolver el camino seguido
 
-# Ejemplo de ejecución
-camino = ascension_de_colinas(grafo, heuristica, 'A', 'G')
-print("Camino seguido:", " → ".join(camino))
+# --- Ascensión de colinas con reinicios aleatorios (en paralelo) ---
+# Una sola escalada se queda en el primer óptimo local. Si se repite desde muchos estados iniciales
+# al azar, basta con que una de ellas llegue a la meta; como las escaladas son independientes,
+# se reparten entre procesos (una por núcleo).
+# Paisaje de ejemplo: 8 reinas. Estado = fila de la reina de cada columna; valor = pares que se atacan.
+N_REINAS = 8
+
+def reinas_inicial(rng): # Tablero al azar (una reina por columna)
+    return tuple(rng.randrange(N_REINAS) for _ in range(N_REINAS))
+
+def reinas_vecinos(estado): # Mover una reina a otra fila de su misma columna
+    return [estado[:c] + (f,) + estado[c + 1:]
+            for c in range(N_REINAS) for f in range(N_REINAS) if f != estado[c]]
+
+def reinas_valor(estado): # Número de pares de reinas que se atacan (0 = meta)
+    return sum(1 for i in range(N_REINAS) for j in range(i + 1, N_REINAS)
+               if estado[i] == estado[j] or abs(estado[i] - estado[j]) == j - i)
+
+
+if __name__ == '__main__': # Necesario para ProcessPoolExecutor en Windows / macOS
+    # Ejemplo de ejecución
+    camino = ascension_de_colinas(grafo, heuristica, 'A', 'G')
+    print("Camino seguido:", " → ".join(camino))
+
+    print("\n=== 8 reinas: ascensión de colinas con reinicios aleatorios ===")
+    camino, valor, estadisticas = ascension_con_reinicios(
+        reinas_inicial, reinas_vecinos, reinas_valor, reinicios=64, semilla=42, meta=0)
+    print(f"Mejor valor: {valor} ataques | tablero final: {camino[-1]} | pasos: {len(camino) - 1}")
+    for est in estadisticas:
+        print(f"  Trabajador {est.trabajador}: {est.escaladas} escaladas, {est.pasos} pasos, "
+              f"{est.evaluaciones} evaluaciones, mejor = {est.mejor_valor}, {est.segundos:.3f} s"
+              + (" (se detuvo: otro trabajador llegó a la meta)" if est.detenido else ""))
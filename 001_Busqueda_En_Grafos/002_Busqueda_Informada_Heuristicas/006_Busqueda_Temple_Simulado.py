@@ -10,6 +10,8 @@
 import math
 import random
 
+from temple_incremental import temple_incremental # Temple con costo incremental y varios esquemas de enfriamiento
+
 grafo = {
     'A': ['B', 'C'],
     'B': ['D', 'E'],
@@ -69,3 +71,53 @@ def temple_simulado(grafo, heuristica, inicio, objetivo, temperatura_inicial=100
 camino, mejor = temple_simulado(grafo, heuristica, 'A', 'G')
 print("Camino recorrido:", " → ".join(camino))
 print("Mejor nodo encontrado:", mejor)
+
+# --- Temple simulado con evaluación incremental ---
+# Problema de calendarización: repartir tareas entre máquinas para que las cargas queden parejas.
+# Costo = suma de los cuadrados de las cargas. Mover una tarea solo cambia la carga de DOS máquinas,
+# así que la diferencia de costo se calcula en O(1) en lugar de recalcular todas las cargas.
+print("\n=== Temple simulado incremental: reparto de tareas en máquinas ===")
+generador = random.Random(1)
+NUM_MAQUINAS = 20
+duraciones = [generador.randint(1, 100) for _ in range(2000)]
+asignacion = [generador.randrange(NUM_MAQUINAS) for _ in duraciones] # Máquina de cada tarea
+cargas = [0] * NUM_MAQUINAS
+for tarea, maquina in enumerate(asignacion):
+    cargas[maquina] += duraciones[tarea]
+
+def proponer(rng): # Movimiento = (tarea, máquina destino)
+    return rng.randrange(len(duraciones)), rng.randrange(NUM_MAQUINAS)
+
+def delta(movimiento): # Solo cambian la máquina de origen y la de destino
+    tarea, destino = movimiento
+    origen, p = asignacion[tarea], duraciones[tarea]
+    if origen == destino:
+        return 0
+    return (cargas[origen] - p) ** 2 + (cargas[destino] + p) ** 2 - cargas[origen] ** 2 - cargas[destino] ** 2
+
+def aplicar(movimiento):
+    tarea, destino = movimiento
+    cargas[asignacion[tarea]] -= duraciones[tarea]
+    cargas[destino] += duraciones[tarea]
+    asignacion[tarea] = destino
+
+def copiar():
+    return list(asignacion)
+
+costo_inicial = sum(c * c for c in cargas)
+carga_ideal = sum(duraciones) / NUM_MAQUINAS
+print(f"Carga ideal por máquina: {carga_ideal:.1f} | cargas iniciales entre {min(cargas)} y {max(cargas)}")
+
+mejor_asignacion, mejor_costo, traza = temple_incremental(
+    costo_inicial, proponer, delta, aplicar, copiar, temperatura_inicial=5000,
+    enfriamiento='adaptativo', alfa=0.9, pasos_por_temperatura=2000, temperatura_minima=0.5, semilla=3)
+
+cargas_finales = [0] * NUM_MAQUINAS
+for tarea, maquina in enumerate(mejor_asignacion):
+    cargas_finales[maquina] += duraciones[tarea]
+assert sum(c * c for c in cargas_finales) == mejor_costo # El costo acumulado por deltas es exacto
+print(f"Cargas finales entre {min(cargas_finales)} y {max(cargas_finales)} (costo {costo_inicial} → {mejor_costo})")
+print("Traza de aceptación (cada 5 etapas):")
+for etapa in traza[::5]:
+    print(f"  paso {etapa.paso:>7}  T={etapa.temperatura:9.2f}  aceptados={etapa.tasa_aceptacion:6.1%}  "
+          f"costo={etapa.costo_actual}  mejor={etapa.mejor_costo}")
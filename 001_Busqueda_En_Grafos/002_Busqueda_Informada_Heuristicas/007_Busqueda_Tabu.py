@@ -9,6 +9,11 @@
 # - Complejidad: La gestión de la lista tabú y la selección de parámetros adecuados pueden aumentar la complejidad del algoritmo.
 # - No garantiza la optimalidad: Aunque puede escapar de óptimos locales, no garantiza encontrar la solución óptima global.
 
+import random
+from collections import Counter
+
+from busqueda_local import MemoriaTabu, busqueda_tabu_atributos # Memoria tabú O(1) y motor genérico
+
 #Implementacion de grafo y heuristica
 grafo = {
     'A': ['B', 'C', 'D'],
@@ -34,7 +39,7 @@ heuristica = {
 def busqueda_tabu(grafo, heuristica, inicio, objetivo, tamaño_tabu=3, max_iter=20): # Función de búsqueda tabú
     actual = inicio # Nodo actual comienza en el nodo de inicio
     mejor = actual # Mejor nodo encontrado
-    lista_tabu = []  # Memoria de nodos prohibidos
+    lista_tabu = MemoriaTabu(tamaño_tabu)  # Memoria de nodos prohibidos (anillo + conjunto: todo en O(1))
     camino = [actual] # Lista para registrar el camino seguido
 
     print("=== Búsqueda Tabú ===\n")
@@ -64,10 +69,8 @@ def busqueda_tabu(grafo, heuristica, inicio, objetivo, tamaño_tabu=3, max_iter=
         print(f"Vecinos no tabú: {candidatos}")
         print(f"Mejor vecino elegido: {mejor_vecino} (h={heuristica[mejor_vecino]})\n")
 
-        # Actualizar lista tabú
-        lista_tabu.append(actual)
-        if len(lista_tabu) > tamaño_tabu:
-            lista_tabu.pop(0)
+        # Actualizar lista tabú (si ya está llena, el nodo más viejo sale solo)
+        lista_tabu.agregar(actual)
 
         # Mover al mejor vecino
         actual = mejor_vecino
@@ -82,11 +85,46 @@ def busqueda_tabu(grafo, heuristica, inicio, objetivo, tamaño_tabu=3, max_iter=
             print("Objetivo alcanzado!\n")
             break
 
-    print("Lista Tabú final:", lista_tabu)
+    print("Lista Tabú final:", list(lista_tabu))
     print("Camino recorrido:", " → ".join(camino))
     print("Mejor nodo encontrado:", mejor, f"(h={heuristica[mejor]})")
 
     return camino, mejor # Devolver el camino seguido y el mejor nodo encontrado
 
-# Ejemplo de ejecución
-camino, mejor = busqueda_tabu(grafo, heuristica, 'A', 'G')
+# --- Búsqueda tabú sobre atributos de movimientos ---
+# En problemas grandes no se prohíben estados completos sino ATRIBUTOS de los movimientos.
+# Ejemplo: N reinas. Movimiento = (columna, fila nueva); atributo tabú = la columna que se movió,
+# así esa reina no puede volver a moverse durante 'tenencia' iteraciones.
+N_REINAS = 30
+
+def reinas_movimientos(estado):
+    return [(c, f) for c in range(N_REINAS) for f in range(N_REINAS) if f != estado[c]]
+
+def reinas_vecino(estado, movimiento):
+    columna, fila = movimiento
+    return estado[:columna] + (fila,) + estado[columna + 1:]
+
+def reinas_valor(estado): # Pares de reinas que se atacan, contando reinas por fila y por diagonal
+    filas, diag1, diag2 = Counter(estado), Counter(), Counter()
+    for c, f in enumerate(estado):
+        diag1[f - c] += 1
+        diag2[f + c] += 1
+    return sum(k * (k - 1) // 2 for cuenta in (filas, diag1, diag2) for k in cuenta.values())
+
+def reinas_columna(movimiento):
+    return movimiento[0]
+
+
+if __name__ == '__main__': # Necesario si se usan varios procesos en Windows / macOS
+    # Ejemplo de ejecución
+    camino, mejor = busqueda_tabu(grafo, heuristica, 'A', 'G')
+
+    print(f"\n=== Búsqueda tabú: {N_REINAS} reinas ===")
+    generador = random.Random(0)
+    inicial = tuple(generador.randrange(N_REINAS) for _ in range(N_REINAS))
+    print("Ataques iniciales:", reinas_valor(inicial))
+    estado, valor, est = busqueda_tabu_atributos(
+        inicial, reinas_movimientos, reinas_vecino, reinas_valor, reinas_columna,
+        tenencia=10, max_iter=500, peso_frecuencia=0.1, meta=0)
+    print(f"Ataques finales: {valor} | iteraciones: {est.iteraciones} | evaluaciones: {est.evaluaciones} | "
+          f"movimientos tabú descartados: {est.bloqueados} | aspiraciones: {est.aspiraciones}")
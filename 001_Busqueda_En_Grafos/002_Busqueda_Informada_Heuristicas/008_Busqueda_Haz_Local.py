@@ -11,6 +11,13 @@
 # Sin embargo, una de sus desventajas es quepuede quedarse atrapado en óptimos locales, ya que no explora soluciones más lejanas que podrían ser mejores.
 # Otra deventaja es que requiere mas memoria y calculos.
 
+import heapq
+import random
+
+import numpy as np # Heurística vectorizada para evaluar miles de estados a la vez
+
+from busqueda_local import busqueda_haz # Motor de haz por lotes, sin duplicados y con selección parcial
+
 #Implementacion de grafo y heuristica
 grafo = {
     'A': ['B', 'C', 'D'],
@@ -54,16 +61,15 @@ def busqueda_haz_local(grafo, heuristica, estados_iniciales, objetivo, k=2, max_
             print(f"Vecinos de {estado}: {vecinos}") # Mostrar vecinos
             nuevos_estados.extend(vecinos) # Agregar vecinos a la lista de nuevos estados
 
+        nuevos_estados = list(dict.fromkeys(nuevos_estados)) # Quitar repetidos (conservando el orden)
+
         # Si no hay nuevos estados, detener
         if not nuevos_estados:
             print("⚠️ No hay más vecinos, fin de búsqueda.\n")
             break
 
-        # Ordenar los nuevos estados por su heurística
-        nuevos_estados = sorted(nuevos_estados, key=lambda n: heuristica[n])
-
-        # Seleccionar los mejores k estados
-        haz = nuevos_estados[:k]
+        # Seleccionar los mejores k estados (sin ordenar toda la lista, mismo resultado que sorted(...)[:k])
+        haz = heapq.nsmallest(k, nuevos_estados, key=lambda n: heuristica[n])
 
         print(f"Estados seleccionados para el siguiente haz: {haz}")
         print(f"Heurísticas: {[heuristica[h] for h in haz]}\n")
@@ -80,3 +86,33 @@ def busqueda_haz_local(grafo, heuristica, estados_iniciales, objetivo, k=2, max_
 haz_inicial = ['A', 'B']  # Comenzamos con dos estados iniciales
 resultado = busqueda_haz_local(grafo, heuristica, haz_inicial, 'J', k=2)
 print("Resultado final:", resultado)
+
+# --- Haz local con lotes grandes: N reinas ---
+# Con haces de miles de estados, evaluar la heurística estado por estado domina el tiempo.
+# Aquí la heurística recibe un lote completo y lo evalúa con NumPy en una sola operación.
+N_REINAS = 16
+COLUMNAS = np.arange(N_REINAS)
+DISTANCIA = np.abs(COLUMNAS[:, None] - COLUMNAS[None, :]) # Distancia entre columnas i y j
+
+def reinas_sucesores(estado): # Mover una reina a otra fila de su misma columna
+    return [estado[:c] + (f,) + estado[c + 1:]
+            for c in range(N_REINAS) for f in range(N_REINAS) if f != estado[c]]
+
+def reinas_valores(lote): # Pares de reinas que se atacan, para todos los tableros del lote a la vez
+    tableros = np.array(lote) # Forma (m, N)
+    diferencia = np.abs(tableros[:, :, None] - tableros[:, None, :]) # (m, N, N)
+    ataques = (diferencia == 0) | (diferencia == DISTANCIA) # Misma fila o misma diagonal
+    return np.triu(ataques, 1).sum(axis=(1, 2)) # Cada par (i < j) una sola vez
+
+def sin_ataques(estado):
+    return reinas_valores([estado])[0] == 0
+
+generador = random.Random(5)
+iniciales = [tuple(generador.randrange(N_REINAS) for _ in range(N_REINAS)) for _ in range(200)]
+for estocastica in (False, True):
+    haz, valores, est = busqueda_haz(iniciales, reinas_sucesores, reinas_valores, k=200, max_iter=50,
+                                     es_meta=sin_ataques, estocastica=estocastica, temperatura=0.5,
+                                     tamano_lote=8192) # Lotes de 8192 tableros: ~16 MB por llamada
+    print(f"\n{N_REINAS} reinas, haz de 200 ({'estocástico' if estocastica else 'los k mejores'}): "
+          f"mejor = {valores[0]} ataques en {est.iteraciones} iteraciones | "
+          f"{est.generados} sucesores generados, {est.duplicados} repetidos descartados")
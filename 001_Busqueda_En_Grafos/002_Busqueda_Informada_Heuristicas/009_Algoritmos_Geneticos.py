@@ -8,6 +8,12 @@
 # En este programa se muestra un ejemplo de su funcionamiento con la funcion f(x) = x^2 para x en el rango de 0 a 31.
 
 import random #Libreria para operaciones aleatorias
+import tempfile
+import time
+from functools import partial
+
+from genetico_vectorizado import a_enteros, algoritmo_genetico_vectorizado, contar_unos # Versión con NumPy
+from modelo_islas import algoritmo_genetico_islas # Varias poblaciones en paralelo con migración
 
 # === Función objetivo ===
 def fitness(x):
@@ -43,6 +49,10 @@ def cruzar(padre1, padre2): # Cruce de un punto
 def mutar(cromosoma, prob_mut=0.1): # Mutar bits con cierta probabilidad
     return [bit if random.random() > prob_mut else 1 - bit for bit in cromosoma] # Invertir bit con probabilidad prob_mut
 
+# === Aptitud de un cromosoma (para ordenar individuos y para el modelo de islas) ===
+def aptitud_cromosoma(cromosoma):
+    return fitness(binario_a_decimal(cromosoma))
+
 # === Algoritmo Genético ===
 def algoritmo_genetico(tamaño_poblacion=6, generaciones=10, prob_mut=0.1): # Parámetros del algoritmo
     longitud = 5  # Longitud del cromosoma (5 bits)
@@ -82,5 +92,48 @@ def algoritmo_genetico(tamaño_poblacion=6, generaciones=10, prob_mut=0.1): # Pa
     x_mejor = binario_a_decimal(mejor) # Convertir a decimal
     print(f"Mejor solución encontrada: x={x_mejor}, f(x)={fitness(x_mejor)}")
 
-# Ejecutar el algoritmo
-algoritmo_genetico()
+# === Algoritmo genético vectorizado (NumPy, población empaquetada en bits) ===
+# El mismo problema f(x) = x^2: la aptitud de toda la población se calcula de una vez
+def aptitud_cuadrado(poblacion):
+    return a_enteros(poblacion, 5) ** 2
+
+
+if __name__ == '__main__': # Necesario para el modelo de islas (varios procesos) en Windows / macOS
+    # Ejecutar el algoritmo
+    algoritmo_genetico()
+
+    mejor, aptitud_mejor, historial = algoritmo_genetico_vectorizado(
+        aptitud_cuadrado, longitud=5, tamano_poblacion=6, generaciones=10, seleccion='ruleta', semilla=1)
+    print(f"\nVectorizado, f(x) = x^2: x={a_enteros(mejor[None, :], 5)[0]}, f(x)={aptitud_mejor}")
+
+    # Un problema grande: "OneMax" (maximizar la cantidad de unos) con 20,000 individuos de 1000 bits.
+    # Con la representación empaquetada, 10^5 individuos siguen ocupando solo ~12 MB.
+    inicio = time.perf_counter()
+    mejor, aptitud_mejor, historial = algoritmo_genetico_vectorizado(
+        contar_unos, longitud=1000, tamano_poblacion=20_000, generaciones=60,
+        seleccion='torneo', elitismo=10, cruce='uniforme', semilla=1)
+    segundos = time.perf_counter() - inicio
+    for generacion in historial[::10] + historial[-1:]:
+        print(f"  Generación {generacion.numero:>3}: mejor = {generacion.mejor_aptitud}, "
+              f"promedio = {generacion.aptitud_promedio:.1f}")
+    print(f"OneMax (1000 bits, 20,000 individuos): mejor aptitud {aptitud_mejor} en {segundos:.2f} s")
+
+    # === Modelo de islas: 4 poblaciones en paralelo (una por proceso) con migración en anillo ===
+    # Se maximiza x^2 con cromosomas de 20 bits, usando los mismos operadores de este script.
+    # Los checkpoints van a una carpeta temporal que se borra sola al terminar el ejemplo
+    with tempfile.TemporaryDirectory(prefix='checkpoints_islas_') as carpeta:
+        operadores = (partial(crear_poblacion, longitud=20), seleccion_ruleta, cruzar, mutar, aptitud_cromosoma)
+        mejor, aptitud_mejor, islas = algoritmo_genetico_islas(
+            *operadores, num_islas=4, tamano_isla=30, generaciones=40, intervalo_migracion=5, migrantes=2,
+            topologia='anillo', prob_mut=0.02, carpeta_checkpoints=carpeta, semilla=7)
+        print(f"\nModelo de islas: x={binario_a_decimal(mejor)} de {2 ** 20 - 1} posibles, f(x)={aptitud_mejor}")
+        for isla in islas:
+            print(f"  Isla {isla.isla}: mejor f(x) = {isla.mejor_aptitud} "
+                  f"(generación 10: {isla.historial[9]}, generación 40: {isla.historial[-1]})")
+
+        # Una segunda llamada con la misma carpeta continúa desde la generación 40 hasta la 60
+        mejor, aptitud_mejor, islas = algoritmo_genetico_islas(
+            *operadores, num_islas=4, tamano_isla=30, generaciones=60, intervalo_migracion=5, migrantes=2,
+            topologia='anillo', prob_mut=0.02, carpeta_checkpoints=carpeta, semilla=7)
+        print(f"Continuando desde la generación {islas[0].generacion_inicial}: f(x)={aptitud_mejor}, "
+              f"historial de {len(islas[0].historial)} generaciones")
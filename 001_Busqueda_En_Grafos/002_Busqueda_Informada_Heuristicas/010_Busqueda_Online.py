@@ -11,6 +11,11 @@
 # - Dependencia de la heurística: La calidad de las decisiones depende en gran medida de la heurística utilizada.
 
 import math # Libreria para funciones matemáticas
+import os
+import tempfile
+import threading
+
+from memoria_lrta import MemoriaLRTA, lrta_estrella # Heurística aprendida guardada en disco (sqlite3)
 
 # Grafo real (el agente no lo conoce completamente desde el inicio)
 grafo_real = {
@@ -37,6 +42,7 @@ heuristica = {
 
 def busqueda_online_LRTA(grafo_real, heuristica, inicio, objetivo, max_iter=20): # Función de búsqueda online
     actual = inicio # Nodo actual comienza en el nodo de inicio
+    heuristica = dict(heuristica) # Copia: lo aprendido no modifica el diccionario de quien llama
     grafo_conocido = {}  # Lo que el agente descubre
     camino = [actual] # Lista para registrar el camino seguido
 
@@ -49,9 +55,10 @@ def busqueda_online_LRTA(grafo_real, heuristica, inicio, objetivo, max_iter=20):
             print("Objetivo alcanzado!\n")
             break
 
-        # Descubrir vecinos al llegar a este nodo
-        vecinos = grafo_real.get(actual, {}) # Obtener vecinos del grafo real
-        grafo_conocido[actual] = vecinos # Actualizar grafo conocido
+        # Descubrir vecinos al llegar a este nodo (solo la primera vez; después ya están en grafo_conocido)
+        if actual not in grafo_conocido:
+            grafo_conocido[actual] = grafo_real.get(actual, {}) # Obtener vecinos del grafo real
+        vecinos = grafo_conocido[actual]
 
         print(f"Nodo actual: {actual}")
         print(f"Vecinos descubiertos: {vecinos}")
@@ -86,3 +93,55 @@ def busqueda_online_LRTA(grafo_real, heuristica, inicio, objetivo, max_iter=20):
 
 # Ejemplo de ejecución
 camino = busqueda_online_LRTA(grafo_real, heuristica, 'A', 'G')
+
+# --- LRTA* con memoria persistente ---
+# Un robot que recorre varias veces el mismo edificio: lo aprendido (heurística y mapa) se guarda
+# en un archivo sqlite, así cada viaje (y cada ejecución del programa) empieza donde quedó el anterior.
+# Entorno: cuadrícula de 12 x 12 con una pared que obliga a rodear.
+LADO = 12
+PARED = {(fila, 6) for fila in range(0, 10)} # Columna 6 bloqueada excepto abajo
+
+def percibir(nodo): # Sensor del robot: las casillas libres alrededor (costo 1)
+    fila, columna = nodo
+    vecinos = {}
+    for df, dc in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+        siguiente = (fila + df, columna + dc)
+        if 0 <= siguiente[0] < LADO and 0 <= siguiente[1] < LADO and siguiente not in PARED:
+            vecinos[siguiente] = 1
+    return vecinos
+
+def manhattan(nodo): # Heurística inicial hacia la meta (0, 11): ignora la pared
+    return abs(nodo[0] - 0) + abs(nodo[1] - 11)
+
+print("\n=== LRTA* con memoria persistente (sqlite3) ===")
+ruta = os.path.join(tempfile.gettempdir(), 'memoria_lrta.sqlite')
+if os.path.exists(ruta):
+    os.remove(ruta) # El ejemplo empieza sin nada aprendido
+
+def viajes(memoria, cantidad): # Varios viajes seguidos de (0, 0) a (0, 11); devuelve los pasos de cada uno
+    return [len(lrta_estrella(percibir, manhattan, (0, 0), (0, 11), memoria)[0]) - 1 for _ in range(cantidad)]
+
+with MemoriaLRTA(ruta, entorno='edificio') as memoria:
+    print("Sesión 1, pasos por viaje:", viajes(memoria, 5))
+
+# Arranque en caliente: otra ejecución (aquí, una conexión nueva) abre el mismo archivo y sigue aprendiendo
+with MemoriaLRTA(ruta, entorno='edificio') as memoria:
+    print("Sesión 2 (con lo aprendido en la sesión 1):", viajes(memoria, 5))
+
+# Sin memoria previa (otro entorno en el mismo archivo) hay que volver a aprender todo
+with MemoriaLRTA(ruta, entorno='edificio_sin_memoria') as memoria:
+    print("Sesión 2 sin memoria previa:               ", viajes(memoria, 5))
+
+# Varios robots al mismo tiempo, cada uno con su conexión, comparten lo que aprenden
+def robot(inicio, resultados):
+    with MemoriaLRTA(ruta, entorno='edificio') as memoria:
+        resultados[inicio] = lrta_estrella(percibir, manhattan, inicio, (0, 11), memoria)
+
+resultados = {}
+hilos = [threading.Thread(target=robot, args=(inicio, resultados)) for inicio in [(11, 0), (5, 2), (9, 9)]]
+for hilo in hilos:
+    hilo.start()
+for hilo in hilos:
+    hilo.join()
+for inicio, (camino, costo, percepciones) in sorted(resultados.items()):
+    print(f"Robot desde {inicio}: {len(camino) - 1} pasos, {percepciones} percepciones nuevas")
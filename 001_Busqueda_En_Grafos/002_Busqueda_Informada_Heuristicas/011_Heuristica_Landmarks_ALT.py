@@ -0,0 +1,47 @@
+# Heurística ALT (Landmarks) para A*
+# Las búsquedas informadas de esta carpeta usan un diccionario 'heuristica' escrito a mano.
+# Para un grafo fijo donde se hacen muchas consultas de camino más corto, la heurística se puede
+# calcular automáticamente: se eligen K landmarks, se precalculan sus distancias con costo uniforme
+# y la desigualdad triangular da una cota inferior admisible para cualquier par de nodos.
+
+import os
+import random
+import tempfile
+
+from busqueda_informada import a_estrella # A* con estadísticas (nodos expandidos, generados, ...)
+from landmarks_alt import IndiceALT, construir_indice # Preprocesamiento y consulta del índice ALT
+
+# Grafo de ejemplo: una cuadrícula de 40 x 40 con costos aleatorios (como una red de calles)
+random.seed(7)
+LADO = 40
+grafo = {}
+for fila in range(LADO):
+    for columna in range(LADO):
+        vecinos = {}
+        for df, dc in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+            f, c = fila + df, columna + dc
+            if 0 <= f < LADO and 0 <= c < LADO:
+                vecinos[(f, c)] = random.randint(1, 9) # Costo de recorrer la calle
+        grafo[(fila, columna)] = vecinos
+
+# --- 1. Preprocesamiento (una sola vez por grafo) ---
+ruta_indice = os.path.join(tempfile.gettempdir(), 'indice_alt_cuadricula.bin')
+indice = construir_indice(grafo, k=8, ruta=ruta_indice)
+print("Landmarks elegidos:", [indice.grafo.nombre(l) for l in indice.landmarks])
+grafo_csr = indice.grafo
+indice.cerrar()  # Este índice ya no se usa: se suelta su mmap antes de abrir el archivo de nuevo
+
+# --- 2. Consultas: A* sin heurística (costo uniforme) contra A* con ALT ---
+def sin_heuristica(nodo):
+    return 0
+
+# Otro proceso (o el mismo, más tarde) solo abre el archivo: la tabla se comparte vía mmap
+with IndiceALT(ruta_indice, grafo_csr) as indice:  # Al salir del bloque se cierra el mmap
+    for inicio, objetivo in [((0, 0), (39, 39)), ((5, 30), (35, 2)), ((20, 20), (0, 39))]:
+        camino, costo, est_ucs = a_estrella(grafo, sin_heuristica, inicio, objetivo)
+        camino_alt, costo_alt, est_alt = a_estrella(grafo, indice.heuristica(objetivo), inicio, objetivo)
+        assert costo == costo_alt # La heurística es admisible: el costo óptimo no cambia
+        print(f"\n{inicio} → {objetivo}: costo {costo}")
+        print(f"  Sin heurística: {est_ucs.expandidos} nodos expandidos")
+        print(f"  Con ALT:        {est_alt.expandidos} nodos expandidos "
+              f"({est_ucs.expandidos / max(est_alt.expandidos, 1):.1f}x menos)")
@@ -0,0 +1,44 @@
+# Búsquedas A* con memoria acotada: IDA* y SMA*
+# A* guarda todos los nodos generados (costo_g y padres), así que en espacios de estados grandes
+# se queda sin memoria mucho antes de encontrar la solución. Estas variantes cambian memoria por tiempo:
+#   - IDA*: búsquedas en profundidad con un umbral sobre f = g + h que va subiendo en cada ronda.
+#           Solo guarda el camino actual.
+#   - SMA*: funciona como A*, pero con un límite explícito de nodos; al llenarse la memoria olvida
+#           la hoja con peor f y anota ese valor en su padre para regenerarla si hace falta.
+# Las tres reciben (grafo, heuristica, inicio, objetivo) y devuelven (camino, costo, estadisticas).
+
+from busqueda_informada import a_estrella, ida_estrella, sma_estrella
+
+# Ejemplo: el rompecabezas de 8 piezas. Un estado es una tupla de 9 números (0 = hueco).
+META = (1, 2, 3, 4, 5, 6, 7, 8, 0)
+MOVIMIENTOS = {0: (1, 3), 1: (0, 2, 4), 2: (1, 5), 3: (0, 4, 6), 4: (1, 3, 5, 7),
+               5: (2, 4, 8), 6: (3, 7), 7: (4, 6, 8), 8: (5, 7)}
+
+def sucesores(estado): # El espacio de estados es implícito: el "grafo" es esta función
+    hueco = estado.index(0)
+    for destino in MOVIMIENTOS[hueco]:
+        nuevo = list(estado)
+        nuevo[hueco], nuevo[destino] = nuevo[destino], nuevo[hueco]
+        yield tuple(nuevo), 1 # Cada movimiento cuesta 1
+
+def manhattan(estado): # Suma de las distancias de cada pieza a su lugar (admisible)
+    total = 0
+    for posicion, pieza in enumerate(estado):
+        if pieza:
+            meta = pieza - 1
+            total += abs(posicion // 3 - meta // 3) + abs(posicion % 3 - meta % 3)
+    return total
+
+inicio = (8, 6, 7, 2, 5, 4, 3, 0, 1) # Uno de los estados más difíciles (31 movimientos)
+
+print("=== A* ===")
+camino, costo, estadisticas = a_estrella(sucesores, manhattan, inicio, META)
+print("Movimientos:", costo, "|", estadisticas)
+
+print("\n=== IDA* ===")
+camino, costo, estadisticas = ida_estrella(sucesores, manhattan, inicio, META)
+print("Movimientos:", costo, "|", estadisticas)
+
+print("\n=== SMA* (máximo 2000 nodos en memoria) ===")
+camino, costo, estadisticas = sma_estrella(sucesores, manhattan, inicio, META, max_nodos=2000)
+print("Movimientos:", costo, "|", estadisticas)
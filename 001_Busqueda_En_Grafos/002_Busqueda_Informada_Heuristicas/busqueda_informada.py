@@ -0,0 +1,355 @@
+# Piezas compartidas por las búsquedas informadas (A* y sus variantes)
+#   - Estadísticas estructuradas de la búsqueda, en lugar de imprimir en cada expansión
+#   - Heurísticas como funciones h(nodo), memorizadas con una caché de tamaño acotado
+#   - Sucesores de un nodo tanto para el grafo de diccionarios como para un GrafoCSR
+#   - A* con conjunto cerrado, política de reapertura y presupuesto de expansiones
+#   - IDA* y SMA*: variantes de A* con memoria acotada, con las mismas estadísticas
+
+import heapq  # Montículos de SMA*
+import os
+import sys
+from collections import namedtuple  # Para una estructura de datos simple
+from functools import lru_cache  # Caché acotada para la heurística
+
+# Estructuras compartidas con los scripts de búsqueda no informada
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '001_Busqueda_No_Informada'))
+from cola_prioridad import ColaPrioridadIndexada
+from grafo_csr import GrafoCSR
+
+# Estadísticas que devuelven todas las variantes de A*:
+#   expandidos   -> nodos sacados de la frontera y expandidos
+#   generados    -> sucesores generados (contando los que se descartan)
+#   max_frontera -> tamaño máximo que alcanzó la frontera (memoria usada)
+#   reabiertos   -> nodos cerrados que se volvieron a abrir por un camino más barato
+#   iteraciones  -> rondas de la búsqueda (IDA*); 1 para A*
+#   olvidados    -> nodos descartados para respetar el límite de memoria (SMA*)
+EstadisticasBusqueda = namedtuple('EstadisticasBusqueda',
+                                  ['expandidos', 'generados', 'max_frontera', 'reabiertos', 'iteraciones', 'olvidados'],
+                                  defaults=(0, 1, 0))
+
+
+def heuristica_memorizada(heuristica, tamano_cache=100_000):
+    """
+    Convierte la heurística en una función h(nodo).
+      - Si es un diccionario (como en los ejemplos) se consulta directamente.
+      - Si es una función (p. ej. calculada a partir de coordenadas) se envuelve en una caché LRU
+        de tamaño acotado, para no recalcularla cada vez que se genera el mismo nodo.
+    """
+    if not callable(heuristica):
+        return heuristica.__getitem__
+    if tamano_cache == 0:
+        return heuristica
+    return lru_cache(maxsize=tamano_cache)(heuristica)
+
+
+def funcion_sucesores(grafo):
+    """
+    Devuelve una función sucesores(nodo) -> iterable de (vecino, costo).
+    Acepta {'A': {'B': 2}}, {'A': [('B', 2)]}, un GrafoCSR con pesos, o directamente una
+    función sucesores(estado) para espacios de estados implícitos (p. ej. un rompecabezas).
+    """
+    if callable(grafo) and not isinstance(grafo, GrafoCSR):
+        return grafo
+    if isinstance(grafo, GrafoCSR):
+        def sucesores(nodo):
+            return ((grafo.nombre(v), costo) for v, costo in grafo.aristas(grafo.id(nodo)))
+        return sucesores
+
+    def sucesores(nodo):
+        vecinos = grafo[nodo]
+        return vecinos.items() if isinstance(vecinos, dict) else vecinos
+    return sucesores
+
+
+def reconstruir_camino(padres, objetivo):
+    """Camino desde el inicio hasta el objetivo siguiendo los padres (O(largo del camino))."""
+    camino = []
+    nodo = objetivo
+    while nodo is not None:
+        camino.append(nodo)
+        nodo = padres[nodo]
+    camino.reverse()
+    return camino
+
+
+def a_estrella(grafo, heuristica, inicio, objetivo, reabrir=True, max_expansiones=None, tamano_cache=100_000):
+    """
+    A* con conjunto cerrado.
+      - heuristica: diccionario o función h(nodo) (se memoriza con una caché LRU de tamano_cache)
+      - reabrir: si es True, un nodo cerrado se vuelve a abrir cuando aparece un camino más barato
+        (necesario con heurísticas inconsistentes para seguir encontrando el óptimo)
+      - max_expansiones: presupuesto de nodos expandidos; al agotarlo la búsqueda se rinde
+    Devuelve (camino, costo, estadisticas). Si no hay camino: ([], inf, estadisticas).
+    """
+    h = heuristica_memorizada(heuristica, tamano_cache)
+    sucesores = funcion_sucesores(grafo)
+
+    frontera = ColaPrioridadIndexada()  # Nodos abiertos, con prioridad f = g + h
+    frontera.insertar(inicio, h(inicio))
+    costo_g = {inicio: 0}  # Mejor costo conocido desde el inicio
+    padres = {inicio: None}
+    cerrados = set()  # Nodos ya expandidos
+    expandidos = generados = reabiertos = 0
+    max_frontera = 1
+
+    while frontera:
+        if max_expansiones is not None and expandidos >= max_expansiones:
+            break  # Se acabó el presupuesto
+
+        actual, _ = frontera.extraer()
+        if actual == objetivo:
+            estadisticas = EstadisticasBusqueda(expandidos, generados, max_frontera, reabiertos)
+            return reconstruir_camino(padres, objetivo), costo_g[objetivo], estadisticas
+
+        cerrados.add(actual)
+        expandidos += 1
+        g_actual = costo_g[actual]
+
+        for vecino, costo in sucesores(actual):
+            generados += 1
+            nuevo_costo_g = g_actual + costo
+            if nuevo_costo_g >= costo_g.get(vecino, float('inf')):
+                continue  # No mejora el camino conocido
+
+            if vecino in cerrados:
+                if not reabrir:
+                    continue
+                cerrados.discard(vecino)
+                reabiertos += 1
+
+            costo_g[vecino] = nuevo_costo_g
+            padres[vecino] = actual
+            frontera.insertar(vecino, nuevo_costo_g + h(vecino))  # Agrega o baja su f (decrease-key)
+
+        if len(frontera) > max_frontera:
+            max_frontera = len(frontera)
+
+    estadisticas = EstadisticasBusqueda(expandidos, generados, max_frontera, reabiertos)
+    return [], float('inf'), estadisticas
+
+
+def ida_estrella(grafo, heuristica, inicio, objetivo, max_iteraciones=None, tamano_cache=100_000):
+    """
+    IDA* (A* con profundización iterativa). Hace búsquedas en profundidad con un umbral sobre
+    f = g + h; cada ronda sube el umbral al menor f que quedó fuera. Solo guarda el camino actual,
+    así la memoria es proporcional a la profundidad y no al número de nodos generados.
+    Mismos argumentos y resultado que a_estrella: (camino, costo, estadisticas).
+    """
+    h = heuristica_memorizada(heuristica, tamano_cache)
+    sucesores = funcion_sucesores(grafo)
+    expandidos = generados = iteraciones = 0
+    max_camino = 1
+    umbral = h(inicio)
+
+    if inicio == objetivo:
+        return [inicio], 0, EstadisticasBusqueda(0, 0, 1, 0, 0)
+
+    while max_iteraciones is None or iteraciones < max_iteraciones:
+        iteraciones += 1
+        siguiente_umbral = float('inf')
+
+        # Búsqueda en profundidad sin recursión: una pila de iteradores de sucesores
+        camino, costos, en_camino = [inicio], [0], {inicio}
+        pila = [iter(sucesores(inicio))]
+        expandidos += 1
+
+        while pila:
+            try:
+                vecino, costo = next(pila[-1])
+            except StopIteration:
+                # Ya no quedan sucesores: retrocedemos un nivel
+                pila.pop()
+                en_camino.discard(camino.pop())
+                costos.pop()
+                continue
+
+            generados += 1
+            if vecino in en_camino:
+                continue  # Evita ciclos dentro del camino actual
+            g = costos[-1] + costo
+            f = g + h(vecino)
+            if f > umbral:
+                siguiente_umbral = min(siguiente_umbral, f)  # Candidato para el próximo umbral
+                continue
+
+            if vecino == objetivo:
+                camino.append(vecino)
+                estadisticas = EstadisticasBusqueda(expandidos, generados, max_camino, 0, iteraciones)
+                return camino, g, estadisticas
+
+            camino.append(vecino)
+            costos.append(g)
+            en_camino.add(vecino)
+            pila.append(iter(sucesores(vecino)))
+            expandidos += 1
+            max_camino = max(max_camino, len(camino))
+
+        if siguiente_umbral == float('inf'):
+            break  # Nada quedó fuera del umbral: no hay camino
+        umbral = siguiente_umbral
+
+    return [], float('inf'), EstadisticasBusqueda(expandidos, generados, max_camino, 0, iteraciones)
+
+
+class _NodoSMA:
+    """Nodo del árbol de búsqueda de SMA*."""
+
+    __slots__ = ('estado', 'g', 'f', 'padre', 'profundidad', 'sucesores', 'siguiente',
+                 'hijos', 'olvidados', 'en_cola', 'version', 'version_hoja')
+
+    def __init__(self, estado, g, f, padre):
+        self.estado = estado
+        self.g = g
+        self.f = f
+        self.padre = padre
+        self.profundidad = 0 if padre is None else padre.profundidad + 1
+        self.sucesores = None  # Lista de (vecino, costo), se calcula la primera vez que se elige
+        self.siguiente = 0     # Índice del próximo sucesor que nunca se generó
+        self.hijos = {}        # estado -> _NodoSMA de los hijos que siguen en memoria
+        self.olvidados = {}    # estado -> f de los hijos que se borraron para liberar memoria
+        self.en_cola = False
+        self.version = 0       # Invalida las entradas viejas del montículo de mejores
+        self.version_hoja = 0  # Invalida las entradas viejas del montículo de peores hojas
+
+
+def sma_estrella(grafo, heuristica, inicio, objetivo, max_nodos, tamano_cache=100_000):
+    """
+    SMA* (A* simplificado con memoria acotada). Nunca guarda más de max_nodos nodos: cuando la
+    memoria se llena borra la hoja con peor f (la menos profunda en caso de empate) y anota su f
+    en el padre, para regenerarla solo si vuelve a ser la mejor opción.
+    Encuentra el óptimo si el camino óptimo cabe en memoria (largo < max_nodos).
+    Mismos argumentos que a_estrella (más max_nodos) y mismo resultado: (camino, costo, estadisticas).
+    """
+    h = heuristica_memorizada(heuristica, tamano_cache)
+    sucesores_de = funcion_sucesores(grafo)
+    infinito = float('inf')
+    mejores, peores = [], []  # Montículos: mejores nodos (menor f, más profundo) y peores hojas
+    contador = 0
+
+    def encolar(nodo):
+        # Cada cambio de f o de estado publica una versión nueva; solo las hojas van a 'peores'
+        nonlocal contador
+        nodo.version += 1
+        nodo.version_hoja += 1
+        nodo.en_cola = True
+        contador += 1
+        heapq.heappush(mejores, (nodo.f, -nodo.profundidad, contador, nodo.version, nodo))
+        if not nodo.hijos:
+            heapq.heappush(peores, (-nodo.f, nodo.profundidad, contador, nodo.version_hoja, nodo))
+
+    def desencolar(nodo):
+        nodo.en_cola = False
+        nodo.version += 1
+        nodo.version_hoja += 1
+
+    def vigente(entrada):
+        nodo = entrada[4]
+        return nodo.en_cola and nodo.version == entrada[3]
+
+    def hoja_vigente(entrada):
+        nodo = entrada[4]
+        return nodo.en_cola and nodo.version_hoja == entrada[3]
+
+    def respaldar(nodo):
+        # Cuando ya no quedan sucesores por generar, f(nodo) = mínimo f de sus hijos (en memoria u olvidados)
+        while nodo is not None and nodo.siguiente == len(nodo.sucesores):
+            valores = [hijo.f for hijo in nodo.hijos.values()] + list(nodo.olvidados.values())
+            nuevo = max(nodo.f, min(valores, default=infinito))
+            if nuevo == nodo.f:
+                break
+            nodo.f = nuevo
+            if nodo.en_cola:
+                encolar(nodo)
+            nodo = nodo.padre
+
+    raiz = _NodoSMA(inicio, 0, h(inicio), None)
+    encolar(raiz)
+    usados = max_usados = 1
+    expandidos = generados = olvidados = 0
+
+    while True:
+        # El mejor nodo: menor f y, en empate, el más profundo
+        while mejores and not vigente(mejores[0]):
+            heapq.heappop(mejores)
+        if not mejores or mejores[0][4].f == infinito:
+            break
+        mejor = mejores[0][4]
+
+        if mejor.estado == objetivo:
+            camino = []
+            nodo = mejor
+            while nodo is not None:
+                camino.append(nodo.estado)
+                nodo = nodo.padre
+            camino.reverse()
+            return camino, mejor.g, EstadisticasBusqueda(expandidos, generados, max_usados, 0, 1, olvidados)
+
+        if mejor.sucesores is None:
+            # Primera expansión: sucesores sin volver a estados del propio camino
+            ancestros = set()
+            nodo = mejor
+            while nodo is not None:
+                ancestros.add(nodo.estado)
+                nodo = nodo.padre
+            mejor.sucesores = [(v, c) for v, c in sucesores_de(mejor.estado) if v not in ancestros]
+            expandidos += 1
+            if not mejor.sucesores:
+                # Callejón sin salida: f infinita, queda como la peor hoja para borrarse primero
+                mejor.f = infinito
+                encolar(mejor)
+                respaldar(mejor.padre)
+                continue
+
+        # Siguiente sucesor: primero los nunca generados, después el olvidado con menor f
+        if mejor.siguiente < len(mejor.sucesores):
+            estado, costo = mejor.sucesores[mejor.siguiente]
+            mejor.siguiente += 1
+            f_anterior = 0
+        else:
+            estado = min(mejor.olvidados, key=mejor.olvidados.get)
+            f_anterior = mejor.olvidados.pop(estado)
+            costo = next(c for v, c in mejor.sucesores if v == estado)
+        generados += 1
+
+        hijo = _NodoSMA(estado, mejor.g + costo, 0, mejor)
+        if estado != objetivo and hijo.profundidad >= max_nodos - 1:
+            hijo.f = infinito  # El camino ya no cabe en memoria
+        else:
+            hijo.f = max(mejor.f, hijo.g + h(estado), f_anterior)
+        mejor.hijos[estado] = hijo
+        mejor.version_hoja += 1  # 'mejor' ya no es una hoja
+        respaldar(mejor)
+
+        # Si todos los sucesores de 'mejor' están en memoria, sale de la cola
+        if mejor.siguiente == len(mejor.sucesores) and not mejor.olvidados:
+            desencolar(mejor)
+
+        usados += 1
+        if usados > max_nodos:
+            # Memoria llena: se borra la hoja con mayor f (la menos profunda en empate)
+            descartadas = []
+            while peores:
+                entrada = heapq.heappop(peores)
+                if not hoja_vigente(entrada):
+                    continue
+                malo = entrada[4]
+                if malo.padre is None or malo is mejor:
+                    descartadas.append(entrada)  # La raíz y el nodo en expansión no se borran
+                    continue
+                padre = malo.padre
+                del padre.hijos[malo.estado]
+                padre.olvidados[malo.estado] = malo.f
+                desencolar(malo)
+                usados -= 1
+                olvidados += 1
+                respaldar(padre)
+                if not padre.en_cola or not padre.hijos:
+                    encolar(padre)  # El padre vuelve a la cola (o se publica como hoja nueva)
+                break
+            for entrada in descartadas:
+                heapq.heappush(peores, entrada)
+
+        encolar(hijo)
+        max_usados = max(max_usados, usados)
+
+    return [], infinito, EstadisticasBusqueda(expandidos, generados, max_usados, 0, 1, olvidados)
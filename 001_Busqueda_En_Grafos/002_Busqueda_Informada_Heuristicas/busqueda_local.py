@@ -0,0 +1,349 @@
+# Motores de búsqueda local para los scripts de esta carpeta
+# Los scripts originales trabajan con un grafo y un diccionario de heurísticas. Aquí el problema
+# se describe con tres funciones, así el mismo motor sirve para grafos y para paisajes combinatorios
+# (n reinas, asignaciones, permutaciones, ...):
+#   - estado_inicial(rng): genera un estado de arranque usando el generador aleatorio 'rng'
+#   - vecinos(estado):     devuelve los estados vecinos
+#   - valor(estado):       número a minimizar (como la heurística: entre menor, mejor)
+#
+# Para usar varios procesos, esas funciones deben estar definidas a nivel de módulo
+# (ProcessPoolExecutor las envía a los trabajadores por nombre, con pickle).
+
+import heapq
+import math
+import multiprocessing
+import os
+import random
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+# Resumen de lo que hizo cada trabajador en la búsqueda con reinicios
+EstadisticasTrabajador = namedtuple(
+    'EstadisticasTrabajador',
+    ['trabajador', 'semilla', 'escaladas', 'pasos', 'evaluaciones', 'mejor_valor', 'segundos', 'detenido'])
+
+# Resumen de una búsqueda tabú
+EstadisticasTabu = namedtuple('EstadisticasTabu', ['iteraciones', 'evaluaciones', 'aspiraciones', 'bloqueados'])
+
+# Resumen de una búsqueda de haz
+EstadisticasHaz = namedtuple('EstadisticasHaz', ['iteraciones', 'generados', 'duplicados', 'evaluados'])
+
+
+# --- 1. Una escalada ---
+
+def ascension_colinas(estado, vecinos, valor, rng=None, estocastica=False, max_pasos=None, detener=None):
+    """
+    Escalada desde 'estado' hasta un óptimo local (ningún vecino mejora).
+      - estocastica=False: se mueve al mejor vecino (empates al azar si se da 'rng')
+      - estocastica=True:  se mueve a un vecino al azar entre los que mejoran
+      - max_pasos: corta la escalada después de esa cantidad de movimientos
+      - detener: función sin argumentos; si devuelve True la escalada se corta
+    Devuelve (camino, valor_final, pasos, evaluaciones).
+    """
+    rng = rng or random.Random(0)
+    actual, valor_actual = estado, valor(estado)
+    camino = [actual]
+    evaluaciones = 1
+
+    while max_pasos is None or len(camino) - 1 < max_pasos:
+        if detener is not None and detener():
+            break
+        candidatos = [(valor(v), v) for v in vecinos(actual)]
+        evaluaciones += len(candidatos)
+        mejores = [(val, v) for val, v in candidatos if val < valor_actual]
+        if not mejores:
+            break  # Óptimo local
+
+        if estocastica:
+            valor_actual, actual = rng.choice(mejores)
+        else:
+            minimo = min(val for val, _ in mejores)
+            valor_actual, actual = rng.choice([(val, v) for val, v in mejores if val == minimo])
+        camino.append(actual)
+
+    return camino, valor_actual, len(camino) - 1, evaluaciones
+
+
+# --- 2. Reinicios aleatorios en paralelo ---
+
+_mejor_global = None  # Mejor valor encontrado por cualquier trabajador (multiprocessing.Value)
+
+
+def _iniciar_trabajador(mejor_global):
+    # Se ejecuta una vez en cada proceso del pool: guarda la referencia al valor compartido
+    global _mejor_global
+    _mejor_global = mejor_global
+
+
+def _semilla_trabajador(semilla, trabajador):
+    # Semilla reproducible e independiente del orden en que el pool reparte las tareas
+    return f"{semilla}:{trabajador}"
+
+
+def _trabajador(trabajador, semilla, escaladas, estado_inicial, vecinos, valor, estocastica, meta, max_pasos):
+    """Hace 'escaladas' escaladas con su propio generador y publica su mejor valor en _mejor_global."""
+    inicio_reloj = time.perf_counter()
+    rng = random.Random(_semilla_trabajador(semilla, trabajador))
+
+    def meta_alcanzada():
+        return meta is not None and _mejor_global is not None and _mejor_global.value <= meta
+
+    mejor_camino, mejor_valor = None, math.inf
+    hechas = pasos_totales = evaluaciones_totales = 0
+    detenido = False
+
+    for _ in range(escaladas):
+        if meta_alcanzada():
+            detenido = mejor_valor > meta  # True si fue otro trabajador el que llegó a la meta
+            break
+        camino, valor_final, pasos, evaluaciones = ascension_colinas(
+            estado_inicial(rng), vecinos, valor, rng, estocastica, max_pasos, meta_alcanzada)
+        hechas += 1
+        pasos_totales += pasos
+        evaluaciones_totales += evaluaciones
+
+        if valor_final < mejor_valor:
+            mejor_camino, mejor_valor = camino, valor_final
+            if _mejor_global is not None:
+                with _mejor_global.get_lock():
+                    if valor_final < _mejor_global.value:
+                        _mejor_global.value = valor_final
+
+    est = EstadisticasTrabajador(trabajador, _semilla_trabajador(semilla, trabajador), hechas, pasos_totales,
+                                 evaluaciones_totales, mejor_valor, time.perf_counter() - inicio_reloj, detenido)
+    return mejor_camino, mejor_valor, est
+
+
+def ascension_con_reinicios(estado_inicial, vecinos, valor, reinicios=16, trabajadores=None, semilla=0,
+                            estocastica=False, meta=None, max_pasos=None):
+    """
+    Ascensión de colinas con reinicios aleatorios: 'reinicios' escaladas independientes repartidas
+    entre 'trabajadores' procesos (por defecto, uno por núcleo; con 1 no se crea ningún proceso).
+      - semilla: cada trabajador usa random.Random con una semilla derivada de (semilla, trabajador),
+        así la misma llamada repite las mismas escaladas
+      - meta: si un trabajador alcanza un valor <= meta, todos se detienen en cuanto lo ven
+        (con meta, qué trabajadores alcanzan a terminar depende del reloj; sin meta es reproducible)
+    Devuelve (mejor_camino, mejor_valor, estadisticas) con una EstadisticasTrabajador por trabajador.
+    """
+    trabajadores = max(1, min(trabajadores or os.cpu_count() or 1, reinicios))
+    # Reparto de escaladas lo más parejo posible
+    cuota = [reinicios // trabajadores + (1 if i < reinicios % trabajadores else 0) for i in range(trabajadores)]
+    tareas = [(i, semilla, cuota[i], estado_inicial, vecinos, valor, estocastica, meta, max_pasos)
+              for i in range(trabajadores)]
+
+    mejor_global = multiprocessing.Value('d', math.inf)
+    if trabajadores == 1:
+        _iniciar_trabajador(mejor_global)
+        resultados = [_trabajador(*tareas[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=trabajadores, initializer=_iniciar_trabajador,
+                                 initargs=(mejor_global,)) as pool:
+            futuros = [pool.submit(_trabajador, *tarea) for tarea in tareas]
+            resultados = [futuro.result() for futuro in futuros]
+
+    # En empate gana el trabajador de menor índice (resultado estable)
+    mejor_camino, mejor_valor, _ = min(resultados, key=lambda r: (r[1], r[2].trabajador))
+    return mejor_camino, mejor_valor, [est for _, _, est in resultados]
+
+
+# --- 3. Búsqueda tabú ---
+
+class MemoriaTabu:
+    """
+    Memoria tabú de tamaño fijo ('tenencia') sobre ATRIBUTOS de movimientos (no estados completos).
+      - Corto plazo: un anillo guarda los últimos atributos en orden; un diccionario cuenta cuántas
+        veces está cada uno en el anillo. Preguntar, agregar y expulsar el más viejo cuestan O(1).
+      - Largo plazo: 'frecuencia' cuenta cuántas veces se ha usado cada atributo en toda la búsqueda.
+    """
+
+    def __init__(self, tenencia):
+        self.tenencia = tenencia
+        self._anillo = [None] * tenencia
+        self._siguiente = 0   # Posición donde se escribe el próximo atributo
+        self._ocupados = 0
+        self._en_anillo = {}  # atributo -> veces que aparece en el anillo
+        self.frecuencia = Counter()
+
+    def __contains__(self, atributo):
+        return atributo in self._en_anillo
+
+    def __len__(self):
+        return self._ocupados
+
+    def __iter__(self):
+        # Del más viejo al más reciente
+        inicio = (self._siguiente - self._ocupados) % self.tenencia if self.tenencia else 0
+        for i in range(self._ocupados):
+            yield self._anillo[(inicio + i) % self.tenencia]
+
+    def agregar(self, atributo):
+        self.frecuencia[atributo] += 1
+        if self.tenencia == 0:
+            return
+        if self._ocupados == self.tenencia:
+            # El anillo está lleno: el más viejo deja de ser tabú
+            viejo = self._anillo[self._siguiente]
+            if self._en_anillo[viejo] == 1:
+                del self._en_anillo[viejo]
+            else:
+                self._en_anillo[viejo] -= 1
+        else:
+            self._ocupados += 1
+        self._anillo[self._siguiente] = atributo
+        self._en_anillo[atributo] = self._en_anillo.get(atributo, 0) + 1
+        self._siguiente = (self._siguiente + 1) % self.tenencia
+
+
+def _evaluar_bloque(estado, movimientos, vecino, valor):
+    # Valor de cada vecino de un bloque (se ejecuta en un proceso del pool)
+    return [valor(vecino(estado, m)) for m in movimientos]
+
+
+def busqueda_tabu_atributos(estado, movimientos, vecino, valor, atributo, tenencia=7, max_iter=1000,
+                            aspiracion=True, peso_frecuencia=0.0, meta=None, trabajadores=1, tamano_bloque=256):
+    """
+    Búsqueda tabú genérica:
+      - movimientos(estado): lista de movimientos posibles
+      - vecino(estado, movimiento): estado que resulta de aplicar el movimiento
+      - valor(estado): número a minimizar
+      - atributo(movimiento): lo que queda prohibido al aplicar el movimiento (ej. "la columna 3");
+        un movimiento es tabú si su atributo está en la memoria de corto plazo
+      - aspiracion: un movimiento tabú se permite si lleva a un valor mejor que el mejor conocido
+      - peso_frecuencia: diversificación; al elegir, cada vecino se penaliza con
+        peso_frecuencia * (veces que se ha usado su atributo)
+      - trabajadores > 1: la vecindad se evalúa en bloques de 'tamano_bloque' en varios procesos
+        (conviene cuando valor() es caro; las funciones deben estar a nivel de módulo)
+    A diferencia de la ascensión de colinas, siempre se mueve al mejor vecino permitido aunque empeore.
+    Devuelve (mejor_estado, mejor_valor, EstadisticasTabu).
+    """
+    memoria = MemoriaTabu(tenencia)
+    actual = mejor_estado = estado
+    mejor_valor = valor(estado)
+    iteracion, evaluaciones, aspiraciones, bloqueados = 0, 1, 0, 0
+    pool = ProcessPoolExecutor(max_workers=trabajadores) if trabajadores > 1 else None
+
+    try:
+        while iteracion < max_iter:
+            iteracion += 1
+            lista = list(movimientos(actual))
+            if not lista:
+                break
+            if pool is None:
+                valores = _evaluar_bloque(actual, lista, vecino, valor)
+            else:
+                bloques = [lista[i:i + tamano_bloque] for i in range(0, len(lista), tamano_bloque)]
+                valores = [v for parte in pool.map(_evaluar_bloque, [actual] * len(bloques), bloques,
+                                                   [vecino] * len(bloques), [valor] * len(bloques))
+                           for v in parte]
+            evaluaciones += len(lista)
+
+            elegido, puntaje_elegido, aspiro = None, math.inf, False
+            for movimiento, v in zip(lista, valores):
+                clave = atributo(movimiento)
+                es_tabu = clave in memoria
+                if es_tabu and not (aspiracion and v < mejor_valor):
+                    bloqueados += 1
+                    continue
+                puntaje = v + peso_frecuencia * memoria.frecuencia[clave] if peso_frecuencia else v
+                if puntaje < puntaje_elegido:
+                    elegido, puntaje_elegido, valor_elegido, aspiro = movimiento, puntaje, v, es_tabu
+            if elegido is None:
+                break  # Todos los movimientos son tabú
+
+            aspiraciones += aspiro
+            actual = vecino(actual, elegido)
+            memoria.agregar(atributo(elegido))
+            if valor_elegido < mejor_valor:
+                mejor_estado, mejor_valor = actual, valor_elegido
+                if meta is not None and mejor_valor <= meta:
+                    break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return mejor_estado, mejor_valor, EstadisticasTabu(iteracion, evaluaciones, aspiraciones, bloqueados)
+
+
+# --- 4. Búsqueda de haz local ---
+
+def _k_menores(valores, k):
+    """Los k valores más pequeños como pares (valor, índice), ordenados, sin ordenar toda la lista."""
+    if hasattr(valores, 'argpartition'):
+        # Arreglo de NumPy: selección en O(n) y solo se ordenan los k elegidos
+        elegidos = valores.argpartition(k - 1)[:k] if k < len(valores) else valores.argsort()
+        return sorted(zip(valores[elegidos].tolist(), elegidos.tolist()))
+    return heapq.nsmallest(k, zip(valores, range(len(valores))))
+
+
+def _seleccion_estocastica(finalistas, k, temperatura, rng):
+    """
+    k pares (valor, índice) distintos al azar, con probabilidad proporcional a e^(-valor / temperatura)
+    (muestreo sin reemplazo de Efraimidis-Spirakis: clave = log(u) / peso, se quedan las k mayores).
+    """
+    minimo = min(valor for valor, _ in finalistas)
+    claves = [(math.log(1.0 - rng.random()) * math.exp(min((valor - minimo) / temperatura, 700.0)), valor, i)
+              for valor, i in finalistas]
+    return sorted((valor, i) for _, valor, i in heapq.nlargest(k, claves))
+
+
+def busqueda_haz(estados_iniciales, sucesores, valores_lote, k, max_iter=100, es_meta=None,
+                 estocastica=False, temperatura=1.0, semilla=0, tamano_lote=65536):
+    """
+    Búsqueda de haz local con k estados.
+      - sucesores(estado): iterable con los estados vecinos (deben ser hashables)
+      - valores_lote(lista_de_estados): valores de TODOS los estados de la lista en una sola llamada
+        (lista de números o arreglo de NumPy; así la heurística puede vectorizarse)
+      - es_meta(estado): si devuelve True para algún estado del haz, la búsqueda termina
+      - estocastica: en lugar de los k mejores, elige k sucesores al azar favoreciendo a los mejores
+        (menos 'temperatura' = más codicioso)
+      - tamano_lote: cuántos estados se le pasan a valores_lote en cada llamada
+    Los sucesores repetidos (el mismo estado generado desde varios padres) se evalúan una sola vez.
+    Devuelve (haz, valores, EstadisticasHaz) con el haz final ordenado de mejor a peor.
+    """
+    rng = random.Random(semilla)
+    haz = list(dict.fromkeys(estados_iniciales))
+    valores = valores_lote(haz)
+    valores = valores.tolist() if hasattr(valores, 'tolist') else list(valores)
+    iteracion = generados = duplicados = evaluados = 0
+
+    while iteracion < max_iter:
+        if es_meta is not None and any(es_meta(estado) for estado in haz):
+            break
+        iteracion += 1
+
+        # 1. Sucesores sin repetir (conjunto hash)
+        vistos, candidatos = set(), []
+        for estado in haz:
+            for sucesor in sucesores(estado):
+                generados += 1
+                if sucesor in vistos:
+                    duplicados += 1
+                    continue
+                vistos.add(sucesor)
+                candidatos.append(sucesor)
+        if not candidatos:
+            break
+        evaluados += len(candidatos)
+
+        # 2. Evaluación por lotes; de cada lote solo pasan sus k mejores (o todos, si la selección es al azar)
+        finalistas = []  # Pares (valor, índice en candidatos)
+        for inicio in range(0, len(candidatos), tamano_lote):
+            puntajes = valores_lote(candidatos[inicio:inicio + tamano_lote])
+            if estocastica:
+                puntajes = puntajes.tolist() if hasattr(puntajes, 'tolist') else puntajes
+                finalistas.extend((valor, inicio + i) for i, valor in enumerate(puntajes))
+            else:
+                finalistas.extend((valor, inicio + i) for valor, i in _k_menores(puntajes, k))
+
+        # 3. Los k siguientes, sin ordenar todos los candidatos
+        if estocastica:
+            elegidos = _seleccion_estocastica(finalistas, k, temperatura, rng)
+        else:
+            elegidos = heapq.nsmallest(k, finalistas)
+        haz = [candidatos[i] for _, i in elegidos]
+        valores = [valor for valor, _ in elegidos]
+
+    orden = sorted(range(len(haz)), key=valores.__getitem__)
+    return [haz[i] for i in orden], [valores[i] for i in orden], \
+        EstadisticasHaz(iteracion, generados, duplicados, evaluados)
@@ -0,0 +1,191 @@
+# Algoritmo genético vectorizado con NumPy
+# El script 009 guarda cada cromosoma como una lista de ints, calcula la aptitud individuo por individuo
+# (pasando por un string en binario_a_decimal) y recalcula todas las aptitudes cada vez que elige un padre.
+#
+# Aquí toda la población es UN arreglo uint8 de forma (tamaño_poblacion, ceil(longitud / 8)):
+# cada byte guarda 8 bits del cromosoma (np.packbits), así 10^5 individuos de 1000 bits ocupan ~12 MB.
+# La aptitud de toda la población se calcula en una sola llamada, y selección, cruce y mutación
+# son operaciones sobre arreglos completos (sin bucles de Python por individuo).
+
+from collections import namedtuple
+
+import numpy as np
+
+# Resumen de una generación
+Generacion = namedtuple('Generacion', ['numero', 'mejor_aptitud', 'aptitud_promedio'])
+
+SELECCIONES = ('ruleta', 'torneo')
+CRUCES = ('un_punto', 'uniforme')
+
+# Cantidad de bits en 1 de cada valor de byte (para contar unos sin desempacar)
+BITS_POR_BYTE = np.array([bin(b).count('1') for b in range(256)], dtype=np.int64)
+
+
+# --- 1. Representación ---
+
+def bytes_por_individuo(longitud):
+    return (longitud + 7) // 8
+
+
+def mascara_ultimo_byte(longitud):
+    # Los bits de relleno (después de 'longitud') siempre deben quedar en 0
+    sobrantes = bytes_por_individuo(longitud) * 8 - longitud
+    return (0xFF << sobrantes) & 0xFF
+
+
+def poblacion_aleatoria(rng, tamano, longitud):
+    """Población empaquetada con bits al azar."""
+    poblacion = rng.integers(0, 256, size=(tamano, bytes_por_individuo(longitud)), dtype=np.uint8)
+    poblacion[:, -1] &= mascara_ultimo_byte(longitud)
+    return poblacion
+
+
+def desempacar(poblacion, longitud):
+    """Bits de cada individuo como arreglo (tamaño, longitud) de 0 y 1."""
+    return np.unpackbits(poblacion, axis=1, count=longitud)
+
+
+def contar_unos(poblacion):
+    """Número de bits en 1 de cada individuo (directo sobre los bytes empaquetados)."""
+    return BITS_POR_BYTE[poblacion].sum(axis=1)
+
+
+def a_enteros(poblacion, longitud):
+    """Valor entero de cada cromosoma (el primer bit es el más significativo). Solo para longitud <= 63."""
+    if longitud > 63:
+        raise ValueError("a_enteros solo admite cromosomas de hasta 63 bits")
+    potencias = np.left_shift(np.int64(1), np.arange(longitud - 1, -1, -1, dtype=np.int64))
+    return desempacar(poblacion, longitud).astype(np.int64) @ potencias
+
+
+# --- 2. Selección (índices de padres para toda la generación de una vez) ---
+
+def seleccion_ruleta(rng, aptitudes, cantidad):
+    """
+    Ruleta: probabilidad proporcional a la aptitud. Se calcula UNA suma acumulada por generación
+    y todos los padres salen de un solo sorteo vectorizado (np.searchsorted).
+    Si hay aptitudes negativas se desplazan para que la peor valga 0.
+    """
+    pesos = aptitudes - min(aptitudes.min(), 0)
+    acumulada = np.cumsum(pesos, dtype=np.float64)
+    if acumulada[-1] <= 0:
+        return rng.integers(0, len(aptitudes), size=cantidad)  # Todos iguales: selección uniforme
+    tiros = rng.random(cantidad) * acumulada[-1]
+    return np.minimum(np.searchsorted(acumulada, tiros, side='right'), len(aptitudes) - 1)
+
+
+def seleccion_torneo(rng, aptitudes, cantidad, tamano_torneo=3):
+    """Torneo: cada padre es el mejor de 'tamano_torneo' individuos al azar (todos los torneos a la vez)."""
+    participantes = rng.integers(0, len(aptitudes), size=(cantidad, tamano_torneo))
+    ganador = aptitudes[participantes].argmax(axis=1)
+    return participantes[np.arange(cantidad), ganador]
+
+
+def elite(aptitudes, cantidad):
+    """Índices de los 'cantidad' mejores individuos (argpartition: sin ordenar toda la población)."""
+    if cantidad <= 0:
+        return np.empty(0, dtype=np.int64)
+    if cantidad >= len(aptitudes):
+        return np.argsort(-aptitudes)
+    return np.argpartition(-aptitudes, cantidad - 1)[:cantidad]
+
+
+# --- 3. Cruce y mutación sobre arreglos ---
+
+def cruzar(rng, padres1, padres2, longitud, tipo='un_punto', prob_cruce=1.0):
+    """
+    Cruza cada fila de padres1 con la misma fila de padres2 usando una máscara de bytes:
+        hijo1 = (padre1 & máscara) | (padre2 & ~máscara),   hijo2 = al revés
+      - un_punto: la máscara tiene 1 antes del punto de cruce y 0 después
+      - uniforme: cada bit viene de uno u otro padre al azar
+    Las parejas que no se cruzan (probabilidad 1 - prob_cruce) pasan como copias de los padres.
+    """
+    parejas, ancho = padres1.shape
+    if tipo == 'un_punto':
+        puntos = rng.integers(1, longitud, size=parejas)  # El hijo toma 'puntos' bits del primer padre
+        byte_corte, bits_corte = (puntos // 8)[:, None], (puntos % 8)[:, None]
+        posiciones = np.arange(ancho)[None, :]
+        parcial = ((0xFF << (8 - bits_corte)) & 0xFF).astype(np.uint8)  # Byte donde cae el corte
+        mascara = np.where(posiciones < byte_corte, np.uint8(0xFF),
+                           np.where(posiciones == byte_corte, parcial, np.uint8(0))).astype(np.uint8)
+    elif tipo == 'uniforme':
+        mascara = rng.integers(0, 256, size=(parejas, ancho), dtype=np.uint8)
+    else:
+        raise ValueError(f"tipo de cruce debe ser uno de {CRUCES}")
+
+    if prob_cruce < 1.0:
+        mascara[rng.random(parejas) >= prob_cruce] = 0xFF  # Sin cruce: hijo1 = padre1, hijo2 = padre2
+
+    hijos1 = (padres1 & mascara) | (padres2 & ~mascara)
+    hijos2 = (padres2 & mascara) | (padres1 & ~mascara)
+    return hijos1, hijos2
+
+
+def mutar(rng, poblacion, longitud, prob_mut):
+    """
+    Invierte cada bit con probabilidad prob_mut (en su lugar). En vez de sortear un número por bit,
+    se sortea CUÁNTOS bits cambian (binomial) y luego cuáles, así la memoria es O(bits mutados).
+    """
+    tamano = poblacion.shape[0]
+    cantidad = rng.binomial(tamano * longitud, prob_mut)
+    if cantidad == 0:
+        return poblacion
+    posiciones = np.unique(rng.integers(0, tamano * longitud, size=cantidad))  # Un bit no se invierte dos veces
+    filas, bits = np.divmod(posiciones, longitud)
+    # bitwise_xor.at acumula bien aunque varios bits caigan en el mismo byte
+    np.bitwise_xor.at(poblacion, (filas, bits // 8), (0x80 >> (bits % 8)).astype(np.uint8))
+    return poblacion
+
+
+# --- 4. Algoritmo genético completo ---
+
+def algoritmo_genetico_vectorizado(aptitud, longitud, tamano_poblacion=1000, generaciones=100,
+                                   seleccion='torneo', tamano_torneo=3, elitismo=1, cruce='un_punto',
+                                   prob_cruce=0.9, prob_mut=None, meta=None, semilla=0):
+    """
+    Algoritmo genético sobre una población empaquetada (se MAXIMIZA la aptitud, como en el script 009).
+      - aptitud(poblacion): recibe el arreglo uint8 (tamaño, bytes) y devuelve un arreglo con la aptitud
+        de cada individuo (ver contar_unos, a_enteros y desempacar)
+      - seleccion: 'ruleta' o 'torneo'
+      - elitismo: cuántos de los mejores pasan sin cambios a la siguiente generación
+      - prob_mut: probabilidad de invertir cada bit (por defecto 1 / longitud)
+      - meta: se detiene cuando la mejor aptitud llega a ese valor
+    Devuelve (mejor_individuo, mejor_aptitud, historial), con mejor_individuo empaquetado (uint8)
+    e historial como lista de Generacion.
+    """
+    if seleccion not in SELECCIONES:
+        raise ValueError(f"seleccion debe ser una de {SELECCIONES}")
+    rng = np.random.default_rng(semilla)
+    prob_mut = 1.0 / longitud if prob_mut is None else prob_mut
+    elitismo = min(elitismo, tamano_poblacion)
+    ultimo_byte = mascara_ultimo_byte(longitud)
+
+    poblacion = poblacion_aleatoria(rng, tamano_poblacion, longitud)
+    aptitudes = np.asarray(aptitud(poblacion))
+    historial = []
+
+    for numero in range(1, generaciones + 1):
+        mejores = elite(aptitudes, elitismo)
+        faltan = tamano_poblacion - elitismo
+        parejas = (faltan + 1) // 2
+
+        # Selección: todos los padres de la generación en un solo sorteo
+        if seleccion == 'ruleta':
+            padres = seleccion_ruleta(rng, aptitudes, 2 * parejas)
+        else:
+            padres = seleccion_torneo(rng, aptitudes, 2 * parejas, tamano_torneo)
+
+        hijos1, hijos2 = cruzar(rng, poblacion[padres[:parejas]], poblacion[padres[parejas:]],
+                                longitud, cruce, prob_cruce)
+        hijos = np.concatenate([hijos1, hijos2])[:faltan]
+        mutar(rng, hijos, longitud, prob_mut)
+        hijos[:, -1] &= ultimo_byte
+
+        poblacion = np.concatenate([poblacion[mejores], hijos])
+        aptitudes = np.asarray(aptitud(poblacion))
+        historial.append(Generacion(numero, aptitudes.max().item(), aptitudes.mean().item()))
+        if meta is not None and historial[-1].mejor_aptitud >= meta:
+            break
+
+    indice = int(aptitudes.argmax())
+    return poblacion[indice].copy(), aptitudes[indice].item(), historial
@@ -0,0 +1,138 @@
+# Heurística ALT (A*, Landmarks y desigualdad Triangular)
+# En lugar de escribir la heurística a mano, se eligen K nodos "landmark" (puntos de referencia)
+# y se precalcula, con costo uniforme, la distancia de cada landmark a todos los nodos y de todos
+# los nodos a cada landmark. Por la desigualdad triangular, para cualquier landmark L:
+#     d(v, t) >= d(L, t) - d(L, v)      y      d(v, t) >= d(v, L) - d(t, L)
+# El máximo de esas cotas sobre todos los landmarks es una heurística admisible para A*.
+#
+# Las tablas se guardan en un archivo binario que se abre con mmap: varios procesos que
+# consultan el mismo grafo comparten una sola copia en memoria (la del sistema operativo).
+#
+# Formato del archivo:
+#   cabecera  -> 'ALT1', K, n                    (struct '<4sqq')
+#   landmarks -> K ids                            (int64)
+#   desde     -> K * n distancias d(L, v)         (float64, inf = inalcanzable)
+#   hacia     -> K * n distancias d(v, L)         (float64)
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+# Estructuras compartidas con los scripts de búsqueda no informada
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '001_Busqueda_No_Informada'))
+from grafo_csr import GrafoCSR
+from recorrido import costo_uniforme  # El mismo motor de la búsqueda de costo uniforme
+
+CABECERA = struct.Struct('<4sqq')
+MAGIA = b'ALT1'
+INFINITO = float('inf')
+
+
+def elegir_landmarks(g, k, inicial=0):
+    """
+    Elige k landmarks por "el más lejano primero": cada nuevo landmark es el nodo cuya distancia
+    al landmark más cercano ya elegido es la mayor. Landmarks en la periferia dan mejores cotas.
+    Devuelve (landmarks, tablas_desde) para no repetir los costos uniformes ya calculados.
+    """
+    k = min(k, len(g))
+    # El primero es el nodo más lejano a 'inicial'
+    _, distancias = costo_uniforme(g, inicial)
+    landmarks, tablas = [], []
+    cercania = [INFINITO] * len(g)  # Distancia de cada nodo a su landmark más cercano
+    candidato = max(range(len(g)), key=lambda v: distancias[v] if distancias[v] != INFINITO else -1)
+
+    while len(landmarks) < k:
+        landmarks.append(candidato)
+        _, distancias = costo_uniforme(g, candidato)
+        tablas.append(distancias)
+        for v in range(len(g)):
+            if distancias[v] < cercania[v]:
+                cercania[v] = distancias[v]
+        # Los nodos inalcanzables desde todos los landmarks se prefieren (así también quedan cubiertos)
+        elegidos = set(landmarks)
+        candidato = max((v for v in range(len(g)) if v not in elegidos), key=lambda v: cercania[v], default=None)
+        if candidato is None:
+            break
+
+    return landmarks, tablas
+
+
+def construir_indice(grafo, k, ruta, inicial=None):
+    """
+    Preprocesamiento: elige k landmarks, corre costo uniforme desde cada uno (en el grafo y en su
+    inverso) y guarda las tablas en 'ruta'. Devuelve el IndiceALT ya abierto.
+    """
+    g = GrafoCSR.desde(grafo)
+    landmarks, tablas_desde = elegir_landmarks(g, k, 0 if inicial is None else g.id(inicial))
+    inverso = g.inverso()
+    tablas_hacia = [costo_uniforme(inverso, landmark)[1] for landmark in landmarks]
+
+    with open(ruta, 'wb') as archivo:
+        archivo.write(CABECERA.pack(MAGIA, len(landmarks), len(g)))
+        array('q', landmarks).tofile(archivo)
+        for tabla in tablas_desde + tablas_hacia:
+            array('d', tabla).tofile(archivo)
+
+    return IndiceALT(ruta, g)
+
+
+class IndiceALT:
+    """
+    Tablas de distancias de los landmarks, abiertas con mmap (solo lectura, compartibles entre procesos).
+    """
+
+    def __init__(self, ruta, grafo):
+        self.grafo = GrafoCSR.desde(grafo)  # Solo se usa para traducir nombres a ids
+        with open(ruta, 'rb') as archivo:
+            self._mmap = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        magia, k, n = CABECERA.unpack_from(self._mmap, 0)
+        if magia != MAGIA or n != len(self.grafo):
+            raise ValueError(f"'{ruta}' no es un índice ALT de este grafo")
+
+        vista = self._vista = memoryview(self._mmap)
+        inicio = CABECERA.size
+        self.landmarks = vista[inicio:inicio + 8 * k].cast('q')
+        inicio += 8 * k
+        # Una tabla por landmark; cada una es una vista sobre el archivo, sin copiar nada
+        self.desde = [vista[inicio + 8 * n * i:inicio + 8 * n * (i + 1)].cast('d') for i in range(k)]
+        inicio += 8 * n * k
+        self.hacia = [vista[inicio + 8 * n * i:inicio + 8 * n * (i + 1)].cast('d') for i in range(k)]
+
+    def cota(self, v, t):
+        """Cota inferior admisible de d(v, t) para ids v y t."""
+        mejor = 0
+        for desde, hacia in zip(self.desde, self.hacia):
+            # d(L, t) - d(L, v): solo si ambas distancias existen
+            if desde[v] != INFINITO and desde[t] != INFINITO and desde[t] - desde[v] > mejor:
+                mejor = desde[t] - desde[v]
+            # d(v, L) - d(t, L)
+            if hacia[v] != INFINITO and hacia[t] != INFINITO and hacia[v] - hacia[t] > mejor:
+                mejor = hacia[v] - hacia[t]
+        return mejor
+
+    def heuristica(self, objetivo):
+        """
+        Devuelve h(nodo) hacia 'objetivo', lista para pasar a busqueda_a_estrella o busqueda_voraz.
+        """
+        g = self.grafo
+        t = g.id(objetivo)
+
+        def h(nodo):
+            return self.cota(g.id(nodo), t)
+        return h
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def cerrar(self):
+        # Hay que soltar las vistas antes de cerrar el mmap
+        self.landmarks.release()
+        for tabla in self.desde + self.hacia:
+            tabla.release()
+        self._vista.release()
+        self._mmap.close()
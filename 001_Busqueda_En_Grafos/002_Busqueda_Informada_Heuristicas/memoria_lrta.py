@@ -0,0 +1,156 @@
+# Memoria persistente para búsqueda online (LRTA*)
+# El script 010 aprende la heurística en un diccionario que se pierde al terminar el programa, y
+# vuelve a "percibir" (consultar el grafo real) cada vez que pasa por un nodo.
+#
+# Aquí lo aprendido se guarda en una base de datos sqlite3 (un solo archivo):
+#   - heuristica(entorno, nodo, h):                 valores h aprendidos
+#   - aristas(entorno, origen, destino, costo):     el grafo conocido (lo que el agente ya descubrió)
+#   - explorados(entorno, nodo):                    nodos cuyos vecinos ya se conocen (aunque no tengan)
+# Así un agente que vuelve al mismo entorno empieza con todo lo aprendido (arranque en caliente),
+# y varios agentes (hilos o procesos) pueden compartir el mismo archivo al mismo tiempo: cada uno abre
+# su propia conexión y sqlite se encarga de los candados (modo WAL: lectores y un escritor a la vez).
+#
+# Los valores aprendidos solo pueden SUBIR (h = max(h guardada, h nueva)): si dos agentes actualizan
+# el mismo nodo, gana la cota más informada, y como ambas son cotas inferiores, sigue siendo admisible.
+
+import ast
+import sqlite3
+
+from busqueda_informada import heuristica_memorizada  # h como diccionario o función
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS heuristica (
+    entorno TEXT NOT NULL, nodo TEXT NOT NULL, h REAL NOT NULL,
+    PRIMARY KEY (entorno, nodo)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS aristas (
+    entorno TEXT NOT NULL, origen TEXT NOT NULL, destino TEXT NOT NULL, costo REAL NOT NULL,
+    PRIMARY KEY (entorno, origen, destino)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS explorados (
+    entorno TEXT NOT NULL, nodo TEXT NOT NULL,
+    PRIMARY KEY (entorno, nodo)) WITHOUT ROWID;
+"""
+
+
+def _clave(nodo):
+    # Los nodos pueden ser strings, números o tuplas (coordenadas): se guardan con repr
+    return repr(nodo)
+
+
+def _nodo(clave):
+    return ast.literal_eval(clave)
+
+
+class MemoriaLRTA:
+    """
+    Heurística aprendida y grafo conocido de un entorno, guardados en el archivo sqlite 'ruta'.
+    Cada agente debe usar su propia MemoriaLRTA (una conexión por hilo o proceso).
+    """
+
+    def __init__(self, ruta, entorno='default', espera=30.0):
+        self.entorno = entorno
+        self._conexion = sqlite3.connect(ruta, timeout=espera)  # 'espera': segundos esperando un candado
+        self._conexion.execute("PRAGMA journal_mode=WAL")
+        self._conexion.execute("PRAGMA synchronous=NORMAL")
+        self._conexion.executescript(ESQUEMA)
+
+    # --- Heurística aprendida ---
+
+    def valores_h(self, nodos):
+        """{nodo: h aprendida} para los nodos que ya tienen un valor guardado (una sola consulta)."""
+        claves = {_clave(nodo): nodo for nodo in nodos}
+        if not claves:
+            return {}
+        marcas = ','.join('?' * len(claves))
+        filas = self._conexion.execute(
+            f"SELECT nodo, h FROM heuristica WHERE entorno = ? AND nodo IN ({marcas})",
+            (self.entorno, *claves))
+        return {claves[clave]: h for clave, h in filas}
+
+    def aprender(self, nodo, h):
+        """Guarda h para 'nodo' si es mayor que la guardada (inmediatamente visible para otros agentes)."""
+        with self._conexion:
+            self._conexion.execute(
+                "INSERT INTO heuristica (entorno, nodo, h) VALUES (?, ?, ?) "
+                "ON CONFLICT (entorno, nodo) DO UPDATE SET h = MAX(h, excluded.h)",
+                (self.entorno, _clave(nodo), h))
+
+    def heuristica_aprendida(self):
+        """Todo lo aprendido como diccionario {nodo: h}."""
+        filas = self._conexion.execute("SELECT nodo, h FROM heuristica WHERE entorno = ?", (self.entorno,))
+        return {_nodo(clave): h for clave, h in filas}
+
+    # --- Grafo conocido ---
+
+    def vecinos(self, nodo):
+        """Vecinos {destino: costo} de 'nodo' si ya se exploró, o None si nunca se ha percibido."""
+        clave = _clave(nodo)
+        explorado = self._conexion.execute(
+            "SELECT 1 FROM explorados WHERE entorno = ? AND nodo = ?", (self.entorno, clave)).fetchone()
+        if explorado is None:
+            return None
+        filas = self._conexion.execute(
+            "SELECT destino, costo FROM aristas WHERE entorno = ? AND origen = ?", (self.entorno, clave))
+        return {_nodo(destino): costo for destino, costo in filas}
+
+    def registrar_vecinos(self, nodo, vecinos):
+        clave = _clave(nodo)
+        with self._conexion:
+            self._conexion.executemany(
+                "INSERT OR REPLACE INTO aristas (entorno, origen, destino, costo) VALUES (?, ?, ?, ?)",
+                [(self.entorno, clave, _clave(destino), costo) for destino, costo in vecinos.items()])
+            self._conexion.execute(
+                "INSERT OR IGNORE INTO explorados (entorno, nodo) VALUES (?, ?)", (self.entorno, clave))
+
+    def grafo_conocido(self):
+        """El grafo descubierto hasta ahora, como diccionario {nodo: {vecino: costo}}."""
+        grafo = {_nodo(clave): {} for (clave,) in self._conexion.execute(
+            "SELECT nodo FROM explorados WHERE entorno = ?", (self.entorno,))}
+        for origen, destino, costo in self._conexion.execute(
+                "SELECT origen, destino, costo FROM aristas WHERE entorno = ?", (self.entorno,)):
+            grafo.setdefault(_nodo(origen), {})[_nodo(destino)] = costo
+        return grafo
+
+    def cerrar(self):
+        self._conexion.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def lrta_estrella(percibir, heuristica, inicio, objetivo, memoria, max_pasos=10_000):
+    """
+    Agente LRTA* que aprende en 'memoria' (MemoriaLRTA).
+      - percibir(nodo): sensor del entorno, devuelve {vecino: costo}. Solo se llama la primera vez que
+        se visita un nodo (en esta o en cualquier ejecución anterior que use la misma memoria)
+      - heuristica: diccionario o función con la estimación inicial (se usa si no hay valor aprendido)
+    En cada paso: h(actual) = max(h(actual), min(costo + h(vecino))) y se mueve al vecino que da el mínimo.
+    Devuelve (camino, costo, percepciones) con percepciones = veces que se llamó a 'percibir'.
+    """
+    h_inicial = heuristica_memorizada(heuristica)
+    actual, camino, costo_total, percepciones = inicio, [inicio], 0, 0
+
+    while actual != objetivo and len(camino) <= max_pasos:
+        vecinos = memoria.vecinos(actual)
+        if vecinos is None:
+            vecinos = percibir(actual)  # Nodo nuevo: hay que observar el entorno
+            percepciones += 1
+            memoria.registrar_vecinos(actual, vecinos)
+        if not vecinos:
+            memoria.aprender(actual, float('inf'))  # Callejón sin salida: nunca lleva a la meta
+            break
+
+        aprendidos = memoria.valores_h(vecinos)  # Incluye lo que otros agentes aprendieron
+        estimados = {v: c + aprendidos.get(v, h_inicial(v)) for v, c in vecinos.items()}
+        siguiente = min(estimados, key=estimados.get)
+
+        # Aprendizaje: la heurística del nodo actual sube a la mejor estimación vista desde aquí
+        memoria.aprender(actual, max(estimados[siguiente], h_inicial(actual)))
+
+        costo_total += vecinos[siguiente]
+        actual = siguiente
+        camino.append(actual)
+
+    return camino, costo_total, percepciones
@@ -0,0 +1,246 @@
+# Modelo de islas para algoritmos genéticos
+# En lugar de una sola población, se evolucionan varias "islas" en paralelo, cada una en su propio
+# proceso. Cada cierto número de generaciones, cada isla envía copias de sus mejores individuos a sus
+# vecinas (migración) y estos reemplazan a los peores de la isla que los recibe.
+#   - Aprovecha todos los núcleos (cada isla es independiente entre migraciones).
+#   - Las islas exploran zonas distintas y la migración comparte lo bueno sin uniformar todo:
+#     resiste la convergencia prematura mejor que una sola población.
+#
+# Los operadores son los del script 009 (se reciben como funciones, definidas a nivel de módulo
+# para que puedan enviarse a los procesos):
+#   - crear_poblacion(tamaño) -> lista de individuos
+#   - seleccion(poblacion) -> un individuo     (por ejemplo seleccion_ruleta)
+#   - cruzar(padre1, padre2) -> (hijo1, hijo2)
+#   - mutar(individuo, prob_mut) -> individuo
+#   - aptitud(individuo) -> número a maximizar
+# Estos operadores usan el módulo 'random' global; cada isla lo siembra con su propia semilla.
+#
+# Los migrantes viajan por multiprocessing.Queue, que los serializa con pickle; no se usa memoria
+# compartida. Los operadores aceptan individuos de cualquier tipo y largo, y una zona de memoria
+# compartida necesitaría individuos numéricos de tamaño fijo. Además solo se envían unos pocos
+# individuos cada 'intervalo_migracion' generaciones, así que serializarlos cuesta muy poco
+# comparado con evolucionar la isla.
+
+import copy
+import multiprocessing
+import os
+import pickle
+import queue
+import random
+import traceback
+from collections import namedtuple
+
+TOPOLOGIAS = ('anillo', 'completa')
+
+# Resultado de cada isla
+ResultadoIsla = namedtuple('ResultadoIsla', ['isla', 'mejor', 'mejor_aptitud', 'historial', 'generacion_inicial'])
+# Lo que manda una isla cuyo proceso lanzó una excepción (el traceback como texto)
+_FalloIsla = namedtuple('_FalloIsla', ['isla', 'detalle'])
+
+
+def vecinas(isla, num_islas, topologia):
+    """Islas a las que 'isla' envía migrantes."""
+    if topologia == 'anillo':
+        return [(isla + 1) % num_islas] if num_islas > 1 else []
+    return [otra for otra in range(num_islas) if otra != isla]
+
+
+def _ruta_checkpoint(carpeta, isla):
+    return os.path.join(carpeta, f"isla_{isla}.pkl")
+
+
+def _guardar_checkpoint(carpeta, isla, generacion, poblacion, historial):
+    # Se escribe a un archivo temporal y se renombra: un corte a la mitad nunca deja un archivo roto.
+    # El historial va completo: al continuar (aunque sea desde la última generación) no se pierde
+    ruta = _ruta_checkpoint(carpeta, isla)
+    with open(ruta + '.tmp', 'wb') as archivo:
+        pickle.dump({'generacion': generacion, 'poblacion': poblacion, 'historial': historial,
+                     'estado_rng': random.getstate()}, archivo)
+    os.replace(ruta + '.tmp', ruta)
+
+
+def _cargar_checkpoints(carpeta, num_islas):
+    """
+    Checkpoints de todas las islas, solo si existen todos y son de la misma generación
+    (si no, las migraciones no coincidirían); en otro caso devuelve None y se empieza de cero.
+    """
+    if carpeta is None:
+        return None
+    rutas = [_ruta_checkpoint(carpeta, isla) for isla in range(num_islas)]
+    if not all(os.path.exists(ruta) for ruta in rutas):
+        return None
+    datos = []
+    for ruta in rutas:
+        with open(ruta, 'rb') as archivo:
+            datos.append(pickle.load(archivo))
+    if len({d['generacion'] for d in datos}) != 1:
+        return None
+    return datos
+
+
+def _proceso_isla(isla, parametros, operadores, entrada, salidas, resultados, checkpoint):
+    # Si un operador falla, el proceso principal recibe el error en lugar de quedarse esperando
+    try:
+        resultados.put(_evolucionar_isla(isla, parametros, operadores, entrada, salidas, checkpoint))
+    except Exception:
+        resultados.put(_FalloIsla(isla, traceback.format_exc()))
+
+
+def _evolucionar_isla(isla, parametros, operadores, entrada, salidas, checkpoint):
+    """Una isla: evoluciona, migra cada 'intervalo_migracion' generaciones y guarda checkpoints."""
+    (num_islas, tamano_isla, generaciones, intervalo_migracion, migrantes,
+     prob_mut, carpeta, intervalo_checkpoint, semilla, espera) = parametros
+    crear_poblacion, seleccion, cruzar, mutar, aptitud = operadores
+
+    if checkpoint is None:
+        random.seed(f"{semilla}:{isla}")  # Semilla reproducible y distinta para cada isla
+        poblacion = crear_poblacion(tamano_isla)
+        generacion_inicial = 0
+        historial = []
+    else:
+        random.setstate(checkpoint['estado_rng'])
+        poblacion = checkpoint['poblacion']
+        generacion_inicial = checkpoint['generacion']
+        historial = list(checkpoint.get('historial', []))
+
+    for generacion in range(generacion_inicial + 1, generaciones + 1):
+        # Una generación, igual que en algoritmo_genetico del script 009
+        nueva_poblacion = []
+        while len(nueva_poblacion) < tamano_isla:
+            hijo1, hijo2 = cruzar(seleccion(poblacion), seleccion(poblacion))
+            nueva_poblacion.extend([mutar(hijo1, prob_mut), mutar(hijo2, prob_mut)])
+        poblacion = nueva_poblacion[:tamano_isla]
+
+        # Migración: enviar copias de los mejores y recibir las de cada isla que nos envía
+        if generacion % intervalo_migracion == 0 and salidas:
+            ordenados = sorted(poblacion, key=aptitud, reverse=True)
+            # La cola serializa en un hilo aparte, más tarde: se envía una copia para que un operador
+            # que modifique a los individuos en su lugar no cambie a los migrantes antes de salir
+            enviados = copy.deepcopy(ordenados[:migrantes])
+            for destino in salidas:
+                destino.put((generacion, isla, enviados))
+            llegados = entrada.recibir(generacion, espera)
+            # Los migrantes reemplazan a los peores de la isla
+            poblacion = ordenados[:max(tamano_isla - len(llegados), 0)] + [ind for _, ind in llegados]
+            poblacion = poblacion[:tamano_isla]
+
+        mejor = max(poblacion, key=aptitud)
+        historial.append(aptitud(mejor))
+
+        if carpeta is not None and (generacion % intervalo_checkpoint == 0 or generacion == generaciones):
+            _guardar_checkpoint(carpeta, isla, generacion, poblacion, historial)
+
+    mejor = max(poblacion, key=aptitud)
+    return ResultadoIsla(isla, mejor, aptitud(mejor), historial, generacion_inicial)
+
+
+class _Entrada:
+    """
+    Cola de llegada de una isla. Una vecina rápida puede mandar los migrantes de la SIGUIENTE
+    migración antes de que lleguen los de la actual, así que los mensajes se apartan por generación.
+    """
+
+    def __init__(self, cola, esperados):
+        self.cola = cola
+        self.esperados = esperados  # Mensajes por migración (uno por cada isla que nos envía)
+        self._apartados = {}        # generación -> [(origen, individuo), ...]
+        self._contados = {}         # generación -> mensajes recibidos
+
+    def recibir(self, generacion, espera):
+        """Migrantes de 'generacion', ordenados por isla de origen (orden fijo sin importar quién llegó primero)."""
+        while self._contados.get(generacion, 0) < self.esperados:
+            try:
+                gen, origen, individuos = self.cola.get(timeout=espera)
+            except queue.Empty:
+                break  # Una isla vecina no respondió a tiempo: se sigue sin sus migrantes
+            self._apartados.setdefault(gen, []).extend((origen, ind) for ind in individuos)
+            self._contados[gen] = self._contados.get(gen, 0) + 1
+        self._contados.pop(generacion, None)
+        llegados = self._apartados.pop(generacion, [])
+        llegados.sort(key=lambda par: par[0])
+        return llegados
+
+
+def _recoger_resultados(resultados, procesos, intervalo=1.0):
+    """
+    Lee un ResultadoIsla por isla. Si una isla falló, o su proceso terminó sin reportar nada (por
+    ejemplo, porque su resultado no se pudo serializar), lanza RuntimeError con el número de la isla.
+    """
+    por_isla = {}
+    while len(por_isla) < len(procesos):
+        try:
+            resultado = resultados.get(timeout=intervalo)
+        except queue.Empty:
+            terminadas = [isla for isla, proceso in enumerate(procesos)
+                          if isla not in por_isla and proceso.exitcode is not None]
+            if not terminadas:
+                continue
+            # Lo que un proceso puso en la cola antes de terminar ya está ahí: se lee una última vez
+            try:
+                resultado = resultados.get(timeout=intervalo)
+            except queue.Empty:
+                isla = terminadas[0]
+                raise RuntimeError(f"la isla {isla} terminó sin resultado "
+                                   f"(código de salida {procesos[isla].exitcode})") from None
+        if isinstance(resultado, _FalloIsla):
+            raise RuntimeError(f"la isla {resultado.isla} falló:\n{resultado.detalle}")
+        por_isla[resultado.isla] = resultado
+    return [por_isla[isla] for isla in range(len(procesos))]
+
+
+def algoritmo_genetico_islas(crear_poblacion, seleccion, cruzar, mutar, aptitud, num_islas=4, tamano_isla=50,
+                             generaciones=100, intervalo_migracion=10, migrantes=2, topologia='anillo',
+                             prob_mut=0.1, carpeta_checkpoints=None, intervalo_checkpoint=10, semilla=0,
+                             espera=60):
+    """
+    Algoritmo genético con modelo de islas, una isla por proceso.
+      - topologia: 'anillo' (cada isla envía a la siguiente) o 'completa' (cada isla envía a todas)
+      - intervalo_migracion / migrantes: cada cuántas generaciones y cuántos individuos se envían
+      - carpeta_checkpoints: si se da, cada isla guarda su población cada 'intervalo_checkpoint'
+        generaciones (y en la última), y una nueva llamada con la misma carpeta continúa desde ahí
+      - espera: segundos máximos que una isla espera a los migrantes de sus vecinas
+    Devuelve (mejor_individuo, mejor_aptitud, resultados) con un ResultadoIsla por isla.
+    Si un operador lanza una excepción en alguna isla, lanza RuntimeError con la isla y el traceback.
+    historial[g - 1] es la mejor aptitud de la generación g, también la de las generaciones anteriores
+    al checkpoint desde el que se continuó (generacion_inicial).
+    """
+    if topologia not in TOPOLOGIAS:
+        raise ValueError(f"topologia debe ser una de {TOPOLOGIAS}")
+    if carpeta_checkpoints is not None:
+        os.makedirs(carpeta_checkpoints, exist_ok=True)
+    checkpoints = _cargar_checkpoints(carpeta_checkpoints, num_islas) or [None] * num_islas
+
+    contexto = multiprocessing.get_context()
+    colas = [contexto.Queue() for _ in range(num_islas)]
+    recibe_de = [0] * num_islas
+    for isla in range(num_islas):
+        for destino in vecinas(isla, num_islas, topologia):
+            recibe_de[destino] += 1
+    resultados = contexto.Queue()
+
+    parametros = (num_islas, tamano_isla, generaciones, intervalo_migracion, migrantes,
+                  prob_mut, carpeta_checkpoints, intervalo_checkpoint, semilla, espera)
+    operadores = (crear_poblacion, seleccion, cruzar, mutar, aptitud)
+    procesos = []
+    for isla in range(num_islas):
+        salidas = [colas[destino] for destino in vecinas(isla, num_islas, topologia)]
+        proceso = contexto.Process(target=_proceso_isla,
+                                   args=(isla, parametros, operadores, _Entrada(colas[isla], recibe_de[isla]),
+                                         salidas, resultados, checkpoints[isla]))
+        proceso.start()
+        procesos.append(proceso)
+
+    # Primero se leen los resultados y después se espera a los procesos (al revés se pueden trabar).
+    # Si una isla falla, las demás se detienen: sin ella se quedarían esperando a sus migrantes
+    try:
+        por_isla = _recoger_resultados(resultados, procesos)
+    except BaseException:
+        for proceso in procesos:
+            proceso.terminate()
+        raise
+    finally:
+        for proceso in procesos:
+            proceso.join()
+
+    ganador = max(por_isla, key=lambda r: (r.mejor_aptitud, -r.isla))
+    return ganador.mejor, ganador.mejor_aptitud, por_isla
@@ -0,0 +1,120 @@
+# Motor de temple simulado con evaluación incremental
+# El script 006 calcula el costo completo de cada vecino. En problemas grandes (asignación de tareas,
+# horarios, rutas) casi todo el estado queda igual después de un movimiento, así que es mucho más
+# barato calcular solo la DIFERENCIA de costo que produce el movimiento.
+#
+# El problema se describe con callbacks:
+#   - proponer(rng):      devuelve un movimiento al azar (rng es un random.Random), sin aplicarlo
+#   - delta(movimiento):  cambio de costo si se aplicara el movimiento (negativo = mejora)
+#   - aplicar(movimiento): modifica el estado actual
+#   - copiar():           devuelve una copia del estado actual. Solo se llama cuando el estado actual es
+#                         el mejor visto y se va a aceptar un movimiento que lo empeora (y una vez al final):
+#                         en la bajada, cuando casi cada paso es un nuevo mejor, no se copia nada
+#
+# Los números aleatorios para aceptar o rechazar se piden a NumPy por lotes: un solo llamado
+# genera miles de uniformes, en lugar de un random.random() por paso.
+
+import math
+import random
+from collections import namedtuple
+
+import numpy as np
+
+# Una fila de la traza por cada temperatura
+EtapaTemple = namedtuple('EtapaTemple', ['paso', 'temperatura', 'tasa_aceptacion', 'costo_actual', 'mejor_costo'])
+
+ENFRIAMIENTOS = ('geometrico', 'adaptativo', 'recalentamiento')
+
+
+def _uniformes(generador, tamano_lote):
+    # Lotes de uniformes en [0, 1) como floats de Python (indexar un arreglo NumPy uno a uno es lento)
+    while True:
+        yield from generador.random(tamano_lote).tolist()
+
+
+def siguiente_temperatura(enfriamiento, temperatura, tasa, alfa, tasa_objetivo):
+    """
+    Temperatura de la siguiente etapa según el esquema:
+      - geometrico: T * alfa
+      - adaptativo: enfría rápido mientras se acepta casi todo (caminata al azar) y despacio
+        cuando casi nada se acepta, para pasar más tiempo cerca de 'tasa_objetivo'
+      - recalentamiento: geométrico (el recalentamiento lo decide temple_incremental)
+    """
+    if enfriamiento == 'adaptativo':
+        if tasa > 2 * tasa_objetivo:
+            return temperatura * alfa ** 4
+        if tasa < tasa_objetivo / 4:
+            return temperatura * math.sqrt(alfa)
+    return temperatura * alfa
+
+
+def temple_incremental(costo_inicial, proponer, delta, aplicar, copiar, temperatura_inicial,
+                       enfriamiento='geometrico', alfa=0.95, pasos_por_temperatura=1000,
+                       temperatura_minima=1e-3, max_pasos=None, meta=None, tasa_objetivo=0.1,
+                       paciencia=20, max_recalentamientos=3, semilla=0, tamano_lote=4096):
+    """
+    Temple simulado sobre un estado que el problema mantiene (ver callbacks arriba).
+      - costo_inicial: costo del estado actual; después solo se actualiza sumando deltas
+      - enfriamiento: 'geometrico', 'adaptativo' o 'recalentamiento'
+      - pasos_por_temperatura: movimientos propuestos antes de bajar la temperatura
+      - meta: se detiene en cuanto el costo llega a ese valor o menos
+      - paciencia: con 'recalentamiento', etapas sin mejorar el mejor costo antes de recalentar
+        (la temperatura vuelve a la mitad de la inicial, como máximo 'max_recalentamientos' veces)
+      - semilla: la misma semilla repite exactamente la misma búsqueda
+    Devuelve (mejor_estado, mejor_costo, traza) donde traza es una lista de EtapaTemple.
+    """
+    if enfriamiento not in ENFRIAMIENTOS:
+        raise ValueError(f"enfriamiento debe ser uno de {ENFRIAMIENTOS}")
+
+    rng = random.Random(semilla)  # Para proponer movimientos
+    uniformes = _uniformes(np.random.default_rng(semilla), tamano_lote)  # Para aceptar o rechazar
+
+    costo = mejor_costo = costo_inicial
+    mejor_estado = None
+    actual_es_mejor = True  # El estado actual tiene el mejor costo: todavía no hace falta copiarlo
+    temperatura = temperatura_inicial
+    traza = []
+    pasos = 0
+    etapas_sin_mejora = recalentamientos = 0
+
+    while temperatura > temperatura_minima and (max_pasos is None or pasos < max_pasos):
+        aceptados = propuestos = 0
+        mejor_al_empezar = mejor_costo
+        etapa = pasos_por_temperatura if max_pasos is None else min(pasos_por_temperatura, max_pasos - pasos)
+
+        for _ in range(etapa):
+            propuestos += 1
+            movimiento = proponer(rng)
+            d = delta(movimiento)
+            # Criterio de Metropolis: siempre si mejora, con probabilidad e^(-d/T) si empeora
+            if d <= 0 or next(uniformes) < math.exp(-d / temperatura):
+                if d > 0 and actual_es_mejor:
+                    mejor_estado = copiar()  # Se va a dejar el mejor estado: se guarda antes de empeorarlo
+                    actual_es_mejor = False
+                aplicar(movimiento)
+                costo += d
+                aceptados += 1
+                if costo < mejor_costo:
+                    mejor_costo = costo
+                    actual_es_mejor = True
+                    if meta is not None and mejor_costo <= meta:
+                        break
+
+        pasos += propuestos
+        tasa = aceptados / propuestos if propuestos else 0.0
+        traza.append(EtapaTemple(pasos, temperatura, tasa, costo, mejor_costo))
+        if meta is not None and mejor_costo <= meta:
+            break
+
+        etapas_sin_mejora = 0 if mejor_costo < mejor_al_empezar else etapas_sin_mejora + 1
+        if enfriamiento == 'recalentamiento' and etapas_sin_mejora >= paciencia \
+                and recalentamientos < max_recalentamientos:
+            temperatura = max(temperatura, temperatura_inicial / 2)  # Recalentar para salir del valle
+            recalentamientos += 1
+            etapas_sin_mejora = 0
+        else:
+            temperatura = siguiente_temperatura(enfriamiento, temperatura, tasa, alfa, tasa_objetivo)
+
+    if actual_es_mejor:
+        mejor_estado = copiar()
+    return mejor_estado, mejor_costo, traza
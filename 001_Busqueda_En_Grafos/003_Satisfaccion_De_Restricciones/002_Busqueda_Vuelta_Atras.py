@@ -4,6 +4,9 @@
 #Entre sus ventajas se encuentran su simplicidad y efectividad para problemas pequeños a medianos, mientras que sus desventajas incluyen su ineficiencia en problemas grandes debido a la explosión combinatoria.
 #Entre sus desventajas se encuentran su ineficiencia en problemas grandes debido a la explosión combinatoria.
 
+from csp_model import BitsetCSP # Modelo compartido: dominios como máscaras de bits
+from csp_solvers import backtrack as backtrack_bitset
+
 #Se usa el mismo problema de colorear un mapa de Australia
 variables = ['WA', 'NT', 'SA', 'Q', 'NSW', 'V', 'T'] # las regiones
 
@@ -97,4 +100,14 @@ if solution: # Si se encontró una solución
     for variable in sorted(solution.keys()):
         print(f"  {variable}: {solution[variable]}")
 else:
-    print("\nNo se encontró solución.")
\ No newline at end of file
+    print("\nNo se encontró solución.")
+
+
+# --- El mismo problema con el modelo de máscaras de bits (csp_model.py) ---
+# Variables y colores se convierten a enteros y cada dominio es una máscara: el solucionador
+# es el mismo algoritmo, pero comprobar un vecino es un AND en lugar de comparar strings.
+csp = BitsetCSP(variables, domains, constraints)
+solution_bitset = backtrack_bitset(csp)
+print("\nCon el modelo de máscaras de bits:")
+for variable, value in sorted(csp.decode(solution_bitset).items()):
+    print(f"  {variable}: {value}")
@@ -7,6 +7,9 @@
 
 import copy # Necesitaremos 'deepcopy' para copiar los dominios
 
+from csp_model import BitsetCSP # Modelo compartido: dominios como máscaras de bits
+from csp_solvers import forward_check as forward_check_bitset
+
 # --- 1. Definición del CSP (el mismo problema de colorear un mapa de Australia) ---
 
 variables = ['WA', 'NT', 'SA', 'Q', 'NSW', 'V', 'T'] # las regiones
@@ -41,12 +44,15 @@ def select_unassigned_variable(variables, assignment): # Selecciona la primera v
             return v # la retorna
     return None # Si todas están asignadas
 
-def forward_check(assignment, variables, domains, constraints): # Implementación de funcion de comprobación hacia adelante
+def forward_check(assignment, variables, domains, constraints, trail=None): # Implementación de funcion de comprobación hacia adelante
     """
     Función recursiva para Búsqueda con Forward Checking.
     'assignment' es la asignación actual.
     'domains' es el diccionario de dominios *actuales* (que se irá podando).
+    'trail' es el rastro de podas (vecino, valor) que comparten todas las llamadas recursivas.
     """
+    if trail is None: # Primera llamada: rastro vacío
+        trail = []
     
     # Caso Base: ¿Está la asignación completa?
     if len(assignment) == len(variables):
@@ -64,10 +70,9 @@ def forward_check(assignment, variables, domains, constraints): # Implementació
         
         # 3. Paso de "Comprobación Hacia Delante" (Poda)
         
-        # Guardamos los valores que vamos a podar, para poder restaurarlos
-        # si esta rama falla.
-        # {vecino: [valores_podados]}
-        pruned_values = {} 
+        # Recordamos la altura del rastro antes de podar: para deshacer esta rama
+        # basta con desapilar hasta esa altura (sin crear un diccionario nuevo en cada rama)
+        height = len(trail)
         domain_wipeout = False # Flag para "dominio vacío"
 
         # Revisar todos los vecinos de la variable que acabamos de asignar
@@ -81,10 +86,8 @@ def forward_check(assignment, variables, domains, constraints): # Implementació
                     # ...¡lo eliminamos de su dominio!
                     domains[neighbor].remove(value)
                     
-                    # Guardamos registro de lo que hicimos
-                    if neighbor not in pruned_values:
-                        pruned_values[neighbor] = []
-                    pruned_values[neighbor].append(value)
+                    # Guardamos registro de lo que hicimos en el rastro
+                    trail.append((neighbor, value))
                     
                     # ¡Comprobación clave! ¿Dejamos un dominio vacío?
                     if not domains[neighbor]:
@@ -96,7 +99,7 @@ def forward_check(assignment, variables, domains, constraints): # Implementació
         # Si NO hubo un dominio vacío (la poda fue "segura")...
         if not domain_wipeout:
             # ...continuamos con la recursión
-            result = forward_check(assignment, variables, domains, constraints)
+            result = forward_check(assignment, variables, domains, constraints, trail)
             
             # Si la recursión encontró una solución, la propagamos
             if result is not None:
@@ -106,9 +109,10 @@ def forward_check(assignment, variables, domains, constraints): # Implementació
         # Si domain_wipeout=True O la recursión falló (result=None),
         # debemos deshacer nuestros cambios.
         
-        # Restaurar los dominios que podamos
-        for neighbor, values in pruned_values.items():
-            domains[neighbor].extend(values)
+        # Restaurar los dominios que podamos: desapilar el rastro hasta la altura guardada
+        while len(trail) > height:
+            neighbor, pruned_value = trail.pop()
+            domains[neighbor].append(pruned_value)
             
         # Quitar la asignación de 'var'
         del assignment[var]
@@ -129,4 +133,15 @@ if solution: # Si se encontró una solución
     for variable in sorted(solution.keys()): # Imprime la solución de forma ordenada
         print(f"  {variable}: {solution[variable]}")
 else: # Si no se encontró solución
-    print("\nNo se encontró solución.")
\ No newline at end of file
+    print("\nNo se encontró solución.")
+
+
+# --- El mismo problema con el modelo de máscaras de bits (csp_model.py) ---
+# Podar el dominio de un vecino es un solo AND con la tabla de compatibilidad:
+#   domains[vecino] &= compat[vecino][var][valor]
+# y cada poda apila (vecino, máscara anterior) en un solo rastro (csp_model.Trail): restaurar es desapilar.
+csp = BitsetCSP(variables, initial_domains, constraints)
+solution_bitset = forward_check_bitset(csp)
+print("\nCon el modelo de máscaras de bits:")
+for variable, value in sorted(csp.decode(solution_bitset).items()):
+    print(f"  {variable}: {value}")
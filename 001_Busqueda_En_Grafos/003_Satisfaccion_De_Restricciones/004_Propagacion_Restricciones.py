@@ -7,6 +7,10 @@
 
 import copy # Necesitaremos 'deepcopy' para copiar los dominios
 
+from csp_model import BitsetCSP # Modelo compartido: dominios como máscaras de bits
+from csp_propagation import ArcConsistency # AC-2001: últimos soportes y cola sin repetidos
+from csp_solvers import ac3 as ac3_bitset, mac
+
 #Definicion del problema
 
 variables = ['WA', 'NT', 'SA'] # Definir las regiones
@@ -119,4 +123,35 @@ consistency = ac3(variables, domains_ac3, constraints)
 
 print("\n--- Resultado ---")
 print(f"¿El problema es consistente? -> {consistency}")
-print(f"Dominios Finales (después de AC-3):\n  WA: {domains_ac3['WA']}\n  NT: {domains_ac3['NT']}\n  SA: {domains_ac3['SA']}")
\ No newline at end of file
+print(f"Dominios Finales (después de AC-3):\n  WA: {domains_ac3['WA']}\n  NT: {domains_ac3['NT']}\n  SA: {domains_ac3['SA']}")
+
+
+# --- Consistencia de arcos con el modelo de máscaras de bits (csp_model.py) ---
+# Motor AC-2001: cada valor recuerda su último soporte y solo se busca otro si ese se perdió.
+csp = BitsetCSP(variables, initial_domains, constraints)
+engine = ArcConsistency(csp)
+consistent_bitset, domains_bitset = ac3_bitset(csp, engine=engine)
+print("\nCon el modelo de máscaras de bits:")
+print(f"¿El problema es consistente? -> {consistent_bitset}")
+for i, variable in enumerate(csp.names):
+    print(f"  {variable}: {csp.domain_values(i, domains_bitset[i])}")
+print(f"Arcos revisados: {engine.revisions}, soportes vigentes: {engine.residue_hits}, "
+      f"soportes buscados: {engine.searches}")
+
+# MAC: la misma propagación dentro de la vuelta atrás, después de cada asignación (mapa completo de Australia)
+australia = {
+    'WA': ['NT', 'SA'], 'NT': ['WA', 'SA', 'Q'], 'SA': ['WA', 'NT', 'Q', 'NSW', 'V'],
+    'Q': ['NT', 'SA', 'NSW'], 'NSW': ['Q', 'SA', 'V'], 'V': ['SA', 'NSW'], 'T': []
+}
+csp_australia = BitsetCSP(list(australia), {v: ['rojo', 'verde', 'azul'] for v in australia}, australia)
+print("\nMAC en el mapa de Australia:", csp_australia.decode(mac(csp_australia)))
+
+# El modelo acepta cualquier relación binaria, no solo '!=': aquí, con solo dos variables,
+# se pide que WA venga antes que NT en el orden de los colores (función sobre pares de valores).
+orden = {'rojo': 0, 'verde': 1, 'azul': 2}
+csp_orden = BitsetCSP(['WA', 'NT'], {'WA': ['rojo', 'verde', 'azul'], 'NT': ['rojo', 'verde', 'azul']},
+                      relations={('WA', 'NT'): lambda a, b: orden[a] < orden[b]})
+_, domains_orden = ac3_bitset(csp_orden)
+print("\nWA antes que NT (relación como función):")
+for i, variable in enumerate(csp_orden.names):
+    print(f"  {variable}: {csp_orden.domain_values(i, domains_orden[i])}")
@@ -3,6 +3,13 @@
 #Entre las aplicaciones comunes de este algoritmo se encuentran la coloración de mapas, la asignación de horarios y la resolución de puzzles como el Sudoku.
 #Entre sus ventajas se encuentran la reducción del espacio de búsqueda y la eficiencia en la resolución de conflictos, mientras que sus desventajas incluyen la complejidad adicional en la gestión de conjuntos de conflictos y la posible sobrecarga computacional.
 
+import random
+
+from csp_model import BitsetCSP # Modelo compartido: dominios como máscaras de bits
+from csp_nogoods import cbj_learning # CBJ que recuerda sus conflictos (nogoods) y reinicia
+from csp_ordering import FirstUnassigned
+from csp_solvers import SearchStats, backtrack_cbj as backtrack_cbj_bitset
+
 # --- 1. Definición del CSP (igual que antes) ---
 
 variables = ['WA', 'NT', 'SA', 'Q', 'NSW', 'V', 'T']
@@ -126,4 +133,43 @@ if solution: # Si se encontró una solución
     for variable in sorted(solution.keys()): # Imprime la solución de forma ordenada
         print(f"  {variable}: {solution[variable]}")
 else: # Si no se encontró solución
-    print(f"\nNo se encontró solución. Conflicto final: {conflicts}")
\ No newline at end of file
+    print(f"\nNo se encontró solución. Conflicto final: {conflicts}")
+
+
+# --- El mismo problema con el modelo de máscaras de bits (csp_model.py) ---
+csp = BitsetCSP(variables, domains, constraints)
+solution_bitset, conflicts_bitset = backtrack_cbj_bitset(csp)
+print("\nCon el modelo de máscaras de bits:")
+for variable, value in sorted(csp.decode(solution_bitset).items()):
+    print(f"  {variable}: {value}")
+
+# --- CBJ con aprendizaje de nogoods y reinicios (csp_nogoods.py) ---
+# Horario de exámenes: cada examen va en una franja; si dos exámenes tienen alumnos en común no pueden
+# ir en franjas seguidas, y algunos exámenes deben ir antes que otros. CBJ salta bien, pero olvida por qué
+# falló: al volver a la misma combinación por otra rama la explora de nuevo. Con nogoods no.
+
+def horario(examenes, franjas, semilla): # Instancia al azar (reproducible con 'semilla')
+    generador = random.Random(semilla)
+    csp = BitsetCSP(list(range(examenes)), {e: list(range(franjas)) for e in range(examenes)})
+    for a in range(examenes):
+        for b in range(a + 1, examenes):
+            tiro = generador.random()
+            if tiro < 0.15: # Alumnos en común: al menos una franja libre entre ambos
+                csp.add_constraint(a, b, lambda p, q: abs(p - q) > 1)
+            elif tiro < 0.22: # Correlativas: a antes que b
+                csp.add_constraint(a, b, lambda p, q: p < q)
+    return csp
+
+for semilla in (1, 3):
+    csp_horario = horario(30, 10, semilla)
+    print(f"\nHorario de 30 exámenes en 10 franjas (semilla {semilla}):")
+    stats = SearchStats()
+    backtrack_cbj_bitset(csp_horario, stats=stats)
+    print(f"  CBJ (script 005):                 {stats.nodes:>8,} nodos")
+    _, est = cbj_learning(csp_horario, variable_order=FirstUnassigned(), restarts=False)
+    print(f"  CBJ + nogoods:                    {est.nodes:>8,} nodos | {est.learned} nogoods aprendidos, "
+          f"{est.nogood_prunes} valores rechazados por nogoods, {est.backjumps} saltos "
+          f"({est.levels_jumped} niveles saltados)")
+    _, est = cbj_learning(csp_horario)
+    print(f"  CBJ + nogoods + Luby + dom/wdeg:  {est.nodes:>8,} nodos | {est.restarts} reinicios, "
+          f"{est.kept} nogoods guardados al final")
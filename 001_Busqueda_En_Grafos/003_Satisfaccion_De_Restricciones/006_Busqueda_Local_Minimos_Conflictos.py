@@ -4,6 +4,11 @@
 # Entre sus ventajas se encuentran su rapidez y capacidad para manejar grandes problemas, mientras que sus desventajas incluyen su naturaleza incompleta y la posibilidad de quedar atrapado en mínimos locales.
 
 import random # Necesitaremos funciones aleatorias
+import time
+
+from csp_model import BitsetCSP # Modelo compartido: dominios como máscaras de bits
+from csp_solvers import min_conflicts as min_conflicts_bitset
+from csp_min_conflicts import BitsetConflicts, QueensConflicts, min_conflicts_search # Versión incremental
 
 # --- 1. Definición del CSP de mapa de colores ---
 
@@ -118,4 +123,33 @@ if solution:
     for variable in sorted(solution.keys()):
         print(f"  {variable}: {solution[variable]}")
 else:
-    print("\nLa búsqueda local se atascó o agotó los pasos.")
\ No newline at end of file
+    print("\nLa búsqueda local se atascó o agotó los pasos.")
+
+
+# --- El mismo problema con el modelo de máscaras de bits (csp_model.py) ---
+csp = BitsetCSP(variables, domains, constraints)
+solution_bitset, steps = min_conflicts_bitset(csp, rng=random.Random(0))
+print(f"\nCon el modelo de máscaras de bits ({steps} pasos):")
+if solution_bitset is not None:
+    for variable, value in sorted(csp.decode(solution_bitset).items()):
+        print(f"  {variable}: {value}")
+
+
+# --- Mínimos conflictos incremental (csp_min_conflicts.py) ---
+# Tabla de conflictos por valor + tabú + paseo aleatorio: un paso solo actualiza a los vecinos
+assignment, stats = min_conflicts_search(BitsetConflicts(csp), rng=random.Random(0))
+print(f"\nVersión incremental: {stats.steps} pasos, {stats.initial_conflicted} variables en conflicto al empezar")
+if assignment is not None:
+    for variable, value in sorted(csp.decode(assignment).items()):
+        print(f"  {variable}: {value}")
+
+# N reinas a gran escala: con contadores por fila y diagonal y muestreando filas en cada paso.
+# Un millón de reinas tarda unos 10 segundos.
+N_REINAS = 100_000
+inicio = time.perf_counter()
+reinas, stats = min_conflicts_search(QueensConflicts(N_REINAS), rng=random.Random(1), sample=64,
+                                     initial_sample=32)
+segundos = time.perf_counter() - inicio
+estado = "resuelto" if reinas is not None else "sin resolver"
+print(f"\n{N_REINAS:,} reinas: {estado} en {stats.steps:,} pasos de reparación "
+      f"({stats.initial_conflicted:,} reinas en conflicto tras el inicio voraz), {segundos:.2f} s")
@@ -4,7 +4,12 @@
 # Entre las aplicaciones comunes de este algoritmo se encuentran la coloración de mapas, la asignación de horarios y la resolución de puzzles como el Sudoku.
 # Entre sus ventajas se encuentran la reducción del espacio de búsqueda y la capacidad para manejar problemas con ciclos, mientras que sus desventajas incluyen la complejidad adicional en la identificación del cutset y la posible explosión combinatoria en el cutset.
 
-import copy # Necesitaremos 'deepcopy' para copiar los dominios
+import random
+import time
+
+from csp_model import BitsetCSP # Modelo compartido: dominios como máscaras de bits
+from csp_solvers import cutset_conditioning as cutset_conditioning_bitset
+from csp_cutset import cycle_cutset, parallel_cutset_conditioning # Corte automático y varios procesos
 
 #Definición del CSP (igual que antes)
 
@@ -87,8 +92,10 @@ def cutset_conditioning(variables, domains, constraints): # 1. Identificar el Cu
         # 4a. Asignación inicial para el subproblema (vacía)
         tree_assignment = {}
         
-        # 4b. Dominios para el subproblema (copia profunda)
-        tree_domains = copy.deepcopy(domains)
+        # 4b. Dominios para el subproblema: se podan los mismos dominios (sin copia profunda)
+        #     y cada poda se anota en un rastro para deshacerla antes del siguiente valor de SA
+        tree_domains = domains
+        trail = [] # (variable, posición, valor podado)
         
         # 4c. Restricciones para el subproblema (podemos reusar las originales)
         
@@ -104,6 +111,7 @@ def cutset_conditioning(variables, domains, constraints): # 1. Identificar el Cu
                 # ...y el valor de 'SA' está en su dominio...
                 if value in tree_domains[tree_var]:
                     # ...¡lo eliminamos!
+                    trail.append((tree_var, tree_domains[tree_var].index(value), value))
                     tree_domains[tree_var].remove(value)
                     
         print(f"  Dominio podado de 'WA' (vecino de SA): {tree_domains['WA']}")
@@ -115,6 +123,12 @@ def cutset_conditioning(variables, domains, constraints): # 1. Identificar el Cu
         #    y la asignación inicial vacía.
         
         solution_T = backtrack(tree_assignment, tree_vars, tree_domains, constraints) # Resolver T
+
+        # Deshacer las podas de este valor de SA, en orden inverso y cada valor en su posición
+        # (los dominios quedan exactamente como al principio)
+        while trail:
+            tree_var, position, pruned_value = trail.pop()
+            tree_domains[tree_var].insert(position, pruned_value)
         
         if solution_T is not None:
             print("  ¡Éxito! El subproblema del árbol tiene solución.")
@@ -137,4 +151,49 @@ if solution: # Si se encontró una solución
     for variable in sorted(solution.keys()): # Imprime la solución de forma ordenada
         print(f"  {variable}: {solution[variable]}")
 else:
-    print("\nNo se encontró solución.") # Si no se encontró solución.
\ No newline at end of file
+    print("\nNo se encontró solución.") # Si no se encontró solución.
+
+
+# --- El mismo problema con el modelo de máscaras de bits (csp_model.py) ---
+# Sin copias profundas: podar los vecinos del corte es un AND sobre una lista de enteros.
+csp = BitsetCSP(variables, domains, constraints)
+solution_bitset = cutset_conditioning_bitset(csp, [csp.index['SA']])
+print("\nCon el modelo de máscaras de bits (corte = ['SA']):")
+for variable, value in sorted(csp.decode(solution_bitset).items()):
+    print(f"  {variable}: {value}")
+
+
+# --- Corte encontrado automáticamente y árbol sin vuelta atrás (csp_cutset.py) ---
+def casi_arbol(n, aristas_extra, colores, semilla):
+    """Coloreo de un árbol aleatorio de n vértices con algunas aristas extra (cada una puede cerrar un ciclo)."""
+    rng = random.Random(semilla)
+    vecinos = {v: [] for v in range(n)}
+    for v in range(1, n):
+        u = rng.randrange(v)
+        vecinos[u].append(v)
+        vecinos[v].append(u)
+    for _ in range(aristas_extra):
+        u, v = rng.sample(range(n), 2)
+        if v not in vecinos[u]:
+            vecinos[u].append(v)
+            vecinos[v].append(u)
+    return BitsetCSP(list(range(n)), {v: list(range(colores)) for v in range(n)}, vecinos)
+
+
+if __name__ == '__main__': # Necesario para el pool de procesos en Windows / macOS
+    corte = cycle_cutset(csp)
+    print(f"\nCorte encontrado automáticamente: {[csp.names[v] for v in corte]}")
+    solution_auto = cutset_conditioning_bitset(csp)  # Corte automático + solve_tree (DAC y pasada hacia las hojas)
+    for variable, value in sorted(csp.decode(solution_auto).items()):
+        print(f"  {variable}: {value}")
+
+    grande = casi_arbol(50_000, 12, 3, semilla=0)
+    corte = cycle_cutset(grande)
+    print(f"\nÁrbol de 50,000 vértices con 12 aristas extra: corte de {len(corte)} variables")
+    for nombre, resolver in [("Un proceso", lambda: cutset_conditioning_bitset(grande, corte)),
+                             ("Varios procesos", lambda: parallel_cutset_conditioning(grande, corte))]:
+        inicio = time.perf_counter()
+        solution_grande = resolver()
+        valida = solution_grande is not None and all(
+            grande.consistent(v, a, solution_grande) for v, a in enumerate(solution_grande))
+        print(f"  {nombre:<16} {'resuelto' if valida else 'sin solución'} en {time.perf_counter() - inicio:.3f} s")
@@ -0,0 +1,268 @@
+# Acondicionamiento del corte sin análisis a mano
+# El script 007 fija el corte a mano (cutset_vars = ['SA']) y resuelve lo que queda con vuelta atrás.
+# Aquí:
+#   - cycle_cutset encuentra un corte de ciclos pequeño: quita hojas mientras haya, y cuando ya no quedan
+#     pasa al corte la variable de mayor grado; al final devuelve al árbol las variables del corte que
+#     no cierran ningún ciclo (con unión-búsqueda)
+#   - solve_tree resuelve un bosque SIN vuelta atrás: consistencia de arcos dirigida de las hojas a la
+#     raíz y después una pasada de la raíz a las hojas que toma el primer valor compatible con el padre.
+#     Cuesta O(variables * valores) con máscaras de bits, y nunca se arrepiente de un valor.
+#   - parallel_cutset_conditioning reparte las asignaciones del corte en bloques entre varios procesos;
+#     el primero que encuentra solución levanta una bandera compartida (multiprocessing.Event), los
+#     demás la revisan antes de cada asignación y abandonan su bloque
+#
+# Para usar varios procesos desde un script, la llamada debe ir dentro de  if __name__ == '__main__':
+# (en Windows / macOS cada proceso vuelve a importar el script).
+
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from csp_model import Trail, bits
+
+
+# --- 1. Corte de ciclos ---
+
+def _find(parent, x):
+    while parent[x] != x:
+        parent[x] = parent[parent[x]]
+        x = parent[x]
+    return x
+
+
+def cycle_cutset(csp):
+    """
+    Corte de ciclos voraz: variables (índices) que, una vez asignadas, dejan el grafo de
+    restricciones sin ciclos. No siempre es el mínimo (eso es NP-difícil), pero no tiene sobrantes.
+    """
+    n = len(csp)
+    neighbors = csp.neighbors
+    degree = [len(neighbors[x]) for x in range(n)]
+    removed = [False] * n
+    leaves = [x for x in range(n) if degree[x] <= 1]
+    remaining = n
+    cutset = []
+
+    def remove(x):
+        removed[x] = True
+        for y in neighbors[x]:
+            if not removed[y]:
+                degree[y] -= 1
+                if degree[y] == 1:
+                    leaves.append(y)
+
+    while remaining:
+        # Las hojas no pueden estar en un ciclo: se quitan y quizá dejan nuevas hojas
+        while leaves:
+            x = leaves.pop()
+            if not removed[x]:
+                remove(x)
+                remaining -= 1
+        if not remaining:
+            break
+        # Solo quedan ciclos: la variable de mayor grado rompe más de una vez
+        x = max((y for y in range(n) if not removed[y]), key=degree.__getitem__)
+        cutset.append(x)
+        remove(x)
+        remaining -= 1
+
+    # Las del corte que unen componentes distintas del bosque no cierran ningún ciclo: vuelven al árbol
+    parent = list(range(n))
+    in_cutset = set(cutset)
+    for x in range(n):
+        if x not in in_cutset:
+            for y in neighbors[x]:
+                if y not in in_cutset:
+                    parent[_find(parent, x)] = _find(parent, y)
+    for x in reversed(cutset):
+        roots = [_find(parent, y) for y in neighbors[x] if y not in in_cutset]
+        if len(roots) == len(set(roots)):
+            in_cutset.discard(x)
+            for root in roots:
+                parent[root] = x
+    return [x for x in cutset if x in in_cutset]
+
+
+# --- 2. Resolver un bosque ---
+
+def solve_tree(csp, domains=None, assignment=None, trail=None):
+    """
+    Resuelve las variables sin asignar, que deben formar un bosque (si hay un ciclo entre ellas,
+    ValueError). Las ya asignadas solo podan los dominios de sus vecinos. Mismos parámetros que los
+    solucionadores de csp_solvers.py, así sirve como 'solver' de cutset_conditioning; los dominios
+    recibidos no se modifican. Devuelve la asignación completa o None.
+    """
+    domains = trail.domains if trail is not None else (csp.domains if domains is None else domains)
+    assignment = [-1] * len(csp) if assignment is None else assignment
+    neighbors, compat = csp.neighbors, csp.compat
+
+    # Dominios locales: los recibidos, podados por las variables ya asignadas
+    dom = list(domains)
+    for y, b in enumerate(assignment):
+        if b >= 0:
+            for x in neighbors[y]:
+                if assignment[x] < 0:
+                    dom[x] &= compat[y][x][b]
+
+    # Cada componente se recorre desde una raíz: 'order' deja a cada padre antes que sus hijos
+    parent = [-1] * len(csp)
+    seen = [False] * len(csp)
+    order = []
+    for root in range(len(csp)):
+        if assignment[root] >= 0 or seen[root]:
+            continue
+        seen[root] = True
+        stack = [root]
+        while stack:
+            x = stack.pop()
+            order.append(x)
+            for y in neighbors[x]:
+                if assignment[y] >= 0 or y == parent[x]:
+                    continue
+                if seen[y]:
+                    raise ValueError(f"las variables sin asignar tienen un ciclo (pasa por '{csp.names[y]}')")
+                seen[y] = True
+                parent[y] = x
+                stack.append(y)
+
+    # Consistencia de arcos dirigida, de las hojas a la raíz: al padre solo le quedan valores
+    # con soporte en el hijo
+    for x in reversed(order):
+        if not dom[x]:
+            return None
+        p = parent[x]
+        if p >= 0:
+            towards_x, dom_x = compat[p][x], dom[x]
+            dom[p] = sum(1 << a for a in bits(dom[p]) if towards_x[a] & dom_x)
+
+    # Pasada hacia las hojas: el primer valor compatible con el padre siempre existe
+    for x in order:
+        p = parent[x]
+        options = dom[x] if p < 0 else dom[x] & compat[p][x][assignment[p]]
+        assignment[x] = (options & -options).bit_length() - 1
+    return assignment
+
+
+# --- 3. Asignaciones del corte ---
+
+def cutset_assignments(csp, cutset, assignment, trail):
+    """
+    Generador de las asignaciones consistentes del corte. Cada una se escribe en 'assignment' y
+    sus podas sobre los vecinos quedan en 'trail' mientras el que llama la usa; al pedir la
+    siguiente, se deshacen. Se saltan las que dejan el dominio de algún vecino vacío.
+    """
+    domains = trail.domains
+
+    def condicionar(k):
+        if k == len(cutset):
+            yield assignment
+            return
+        var = cutset[k]
+        compat = csp.compat[var]
+        for value in list(bits(domains[var])):
+            if not csp.consistent(var, value, assignment):
+                continue
+            assignment[var] = value
+            height = len(trail)
+            wipeout = False
+            for neighbor in csp.neighbors[var]:
+                if assignment[neighbor] < 0 and trail.prune(neighbor, domains[neighbor] & compat[neighbor][value]):
+                    if not domains[neighbor]:
+                        wipeout = True
+                        break
+            if not wipeout:
+                yield from condicionar(k + 1)
+            trail.undo(height)
+            assignment[var] = -1
+
+    return condicionar(0)
+
+
+# --- 4. Varios procesos ---
+
+_csp_trabajador = None   # El problema y el corte, enviados una sola vez a cada proceso del pool
+_corte_trabajador = None
+_parar_trabajador = None  # Bandera compartida: algún proceso ya encontró solución
+
+
+def _iniciar_trabajador(csp, cutset, parar=None):
+    global _csp_trabajador, _corte_trabajador, _parar_trabajador
+    _csp_trabajador, _corte_trabajador, _parar_trabajador = csp, cutset, parar
+
+
+def _resolver_bloque(bloque):
+    """
+    Prueba cada tupla de valores del corte en 'bloque' y devuelve la primera solución, o None.
+    Si otro proceso levanta la bandera de parar, abandona el bloque y devuelve None.
+    """
+    csp, cutset, parar = _csp_trabajador, _corte_trabajador, _parar_trabajador
+    for values in bloque:
+        if parar is not None and parar.is_set():
+            return None
+        assignment = [-1] * len(csp)
+        for var, value in zip(cutset, values):
+            assignment[var] = value
+        if solve_tree(csp, assignment=assignment) is not None:
+            if parar is not None:
+                parar.set()
+            return assignment
+    return None
+
+
+def _bloques(csp, cutset, tamano_bloque):
+    # Las asignaciones del corte se generan en el proceso principal (con poda) y se agrupan
+    assignment = [-1] * len(csp)
+    bloque = []
+    for _ in cutset_assignments(csp, cutset, assignment, Trail(list(csp.domains))):
+        bloque.append(tuple(assignment[var] for var in cutset))
+        if len(bloque) == tamano_bloque:
+            yield bloque
+            bloque = []
+    if bloque:
+        yield bloque
+
+
+def parallel_cutset_conditioning(csp, cutset=None, trabajadores=None, tamano_bloque=64):
+    """
+    Acondicionamiento del corte con solve_tree, repartiendo las asignaciones del corte en bloques de
+    'tamano_bloque' entre 'trabajadores' procesos (por defecto, uno por núcleo; con 1 no se crea
+    ningún proceso). El corte por omisión es cycle_cutset(csp). Como mucho hay 2 bloques por
+    trabajador esperando, así un corte grande no se genera entero en memoria. En cuanto un proceso
+    encuentra solución, los demás dejan sus bloques a medias y los que no empezaron se cancelan.
+    Devuelve la asignación completa o None.
+    """
+    cutset = cycle_cutset(csp) if cutset is None else list(cutset)
+    trabajadores = max(1, trabajadores or os.cpu_count() or 1)
+    bloques = _bloques(csp, cutset, tamano_bloque)
+
+    if trabajadores == 1:
+        _iniciar_trabajador(csp, cutset)
+        for bloque in bloques:
+            solution = _resolver_bloque(bloque)
+            if solution is not None:
+                return solution
+        return None
+
+    contexto = multiprocessing.get_context()
+    parar = contexto.Event()
+    pool = ProcessPoolExecutor(max_workers=trabajadores, mp_context=contexto, initializer=_iniciar_trabajador,
+                               initargs=(csp, cutset, parar))
+    try:
+        pendientes = set()
+        for bloque in bloques:
+            pendientes.add(pool.submit(_resolver_bloque, bloque))
+            if len(pendientes) >= 2 * trabajadores:
+                break
+        while pendientes:
+            terminados, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+            for futuro in terminados:
+                solution = futuro.result()
+                if solution is not None:
+                    return solution
+                bloque = next(bloques, None)
+                if bloque is not None:
+                    pendientes.add(pool.submit(_resolver_bloque, bloque))
+        return None
+    finally:
+        parar.set()  # Los bloques en curso se abandonan
+        pool.shutdown(cancel_futures=True)  # Y los que no empezaron ya no hacen falta
@@ -0,0 +1,255 @@
+# Mínimos conflictos con contadores incrementales
+# min_conflicts del script 006 recorre TODAS las variables en cada paso (get_conflicted_variables) para
+# saber cuáles están en conflicto, aunque entre un paso y el siguiente solo cambió una variable.
+#
+# Aquí se guarda, para cada variable y cada valor, cuántos vecinos asignados chocan con ese valor
+# (tabla de conflictos por valor), y un conjunto con las variables en conflicto. Al cambiar el valor de
+# una variable solo se actualizan sus vecinos, así que un paso cuesta O(grado) y no O(variables * grado).
+# Además:
+#   - tabú: una variable no vuelve al valor que acaba de dejar durante 'tabu_tenure' pasos
+#   - paseo aleatorio: con probabilidad 'walk_prob' se elige un valor al azar en vez del mejor
+#   - inicio voraz: cada variable empieza en el valor con menos conflictos con las ya asignadas
+#     (con n reinas deja muy pocos conflictos y la reparación termina en pocos pasos)
+#
+# El motor trabaja con cualquier problema que ofrezca la misma interfaz (ver BitsetConflicts):
+#   len(problema), values(var), random_value(var, rng), conflicts(var, valor) y assign(var, valor).
+# QueensConflicts es la versión para n reinas: en vez de tablas n x n guarda cuántas reinas hay en cada
+# fila y diagonal, así un millón de reinas cabe en memoria y cada consulta es O(1).
+
+import random
+from collections import namedtuple
+from itertools import chain
+
+from csp_model import bits
+
+# Estadísticas de una búsqueda
+MinConflictsStats = namedtuple('MinConflictsStats', ['steps', 'initial_conflicted', 'walks', 'tabu_blocked'])
+
+
+class IndexedSet:
+    """Conjunto con alta, baja y elección al azar en O(1) (lista + posición de cada elemento)."""
+
+    def __init__(self):
+        self.items = []
+        self.position = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.position
+
+    def add(self, item):
+        if item not in self.position:
+            self.position[item] = len(self.items)
+            self.items.append(item)
+
+    def discard(self, item):
+        k = self.position.pop(item, None)
+        if k is not None:
+            last = self.items.pop()
+            if k < len(self.items):
+                self.items[k] = last
+                self.position[last] = k
+
+    def choice(self, rng):
+        return self.items[int(rng.random() * len(self.items))]
+
+
+class BitsetConflicts:
+    """
+    Conflictos de un BitsetCSP (csp_model.py). table[var][valor] = vecinos asignados incompatibles con
+    var = valor. Al mover var de 'old' a 'new', en cada vecino j se restan los valores incompatibles con
+    old y se suman los incompatibles con new (con '!=' es un solo valor por vecino).
+    """
+
+    def __init__(self, csp, domains=None):
+        self.csp = csp
+        self.domains = csp.domains if domains is None else domains
+        self.options = [list(bits(mask)) for mask in self.domains]
+        self.assignment = [-1] * len(csp)
+        self.table = [[0] * len(values) for values in csp.values]
+        # Valores de j incompatibles con var = a, solo los del dominio de j (se calculan una vez)
+        self._bad = [{j: [self.domains[j] & ~compat_a for compat_a in compat]
+                      for j, compat in csp.compat[var].items()} for var in range(len(csp))]
+
+    def __len__(self):
+        return len(self.csp)
+
+    def values(self, var):
+        return self.options[var]
+
+    def random_value(self, var, rng):
+        return rng.choice(self.options[var])
+
+    def conflicts(self, var, value):
+        return self.table[var][value]
+
+    def assign(self, var, value):
+        """Cambia el valor de var y devuelve las variables cuyo número de conflictos pudo cambiar."""
+        old = self.assignment[var]
+        self.assignment[var] = value
+        table, assignment = self.table, self.assignment
+        changed = [var]
+        for j, bad in self._bad[var].items():
+            row = table[j]
+            if old >= 0:
+                for b in bits(bad[old]):
+                    row[b] -= 1
+            for b in bits(bad[value]):
+                row[b] += 1
+            if assignment[j] >= 0:
+                changed.append(j)
+        return changed
+
+
+class QueensConflicts:
+    """
+    N reinas, una por columna (la variable es la columna y el valor la fila). Se guarda cuántas reinas
+    hay en cada fila y en cada diagonal, y la suma de sus columnas: si una línea tiene una sola reina,
+    la suma ES su columna, así se sabe a quién afecta un movimiento sin guardar listas por línea.
+    """
+
+    def __init__(self, n):
+        self.n = n
+        self.assignment = [-1] * n
+        self.count = [[0] * n, [0] * (2 * n - 1), [0] * (2 * n - 1)]  # Filas, diagonales, antidiagonales
+        self.total = [[0] * n, [0] * (2 * n - 1), [0] * (2 * n - 1)]  # Suma de columnas por línea
+        self.free_rows = IndexedSet()  # Filas sin ninguna reina: los candidatos con más chance de 0 conflictos
+        for row in range(n):
+            self.free_rows.add(row)
+
+    def __len__(self):
+        return self.n
+
+    def _lines(self, col, row):
+        return row, col + row, col - row + self.n - 1
+
+    def values(self, var):
+        return range(self.n)
+
+    def random_value(self, var, rng):
+        return int(rng.random() * self.n)
+
+    def promising_values(self, var, rng, k):
+        """Hasta k filas libres (todas si son pocas, como al final de la búsqueda)."""
+        free = self.free_rows
+        if len(free) <= k:
+            yield from list(free.items)
+        else:
+            for _ in range(k):
+                yield free.choice(rng)
+
+    def conflicts(self, var, value):
+        rows, diagonals, antidiagonals = self.count
+        total = rows[value] + diagonals[var + value] + antidiagonals[var - value + self.n - 1]
+        return total - 3 if self.assignment[var] == value else total
+
+    def assign(self, var, value):
+        old = self.assignment[var]
+        self.assignment[var] = value
+        changed = [var]
+        if old >= 0:
+            for count, total, line in zip(self.count, self.total, self._lines(var, old)):
+                count[line] -= 1
+                total[line] -= var
+                if count is self.count[0] and count[line] == 0:
+                    self.free_rows.add(line)
+                if count[line] == 1:
+                    changed.append(total[line])  # Se quedó sola en la línea: quizá ya no tiene conflictos
+        for count, total, line in zip(self.count, self.total, self._lines(var, value)):
+            if count[line] == 1:
+                changed.append(total[line])  # Estaba sola y ahora tiene compañía
+            count[line] += 1
+            total[line] += var
+        self.free_rows.discard(value)
+        return changed
+
+
+def _best_value(problem, var, current, rng, sample, tabu, step):
+    # Valor con menos conflictos (empates al azar) entre los valores no tabú; con 'sample' solo se
+    # evalúa esa cantidad de valores al azar (en dominios enormes, como un millón de filas), más los
+    # que el problema considere prometedores si ofrece promising_values
+    # (los candidatos ya son al azar, así que el primero sin conflictos se toma sin mirar el resto)
+    sampling = sample is not None and sample < len(problem.values(var))
+    if sampling:
+        candidates = (problem.random_value(var, rng) for _ in range(sample))
+        if hasattr(problem, 'promising_values'):
+            candidates = chain(problem.promising_values(var, rng, sample), candidates)
+    else:
+        candidates = problem.values(var)
+    conflicts = problem.conflicts
+    best, best_values, blocked = None, [], 0
+    for value in candidates:
+        if value == current:
+            continue
+        score = conflicts(var, value)
+        if tabu and score > 0 and tabu.get((var, value), -1) > step:  # Aspiración: sin conflictos se acepta igual
+            blocked += 1
+            continue
+        if best is None or score < best:
+            best, best_values = score, [value]
+            if score == 0 and sampling:
+                break
+        elif score == best:
+            best_values.append(value)
+    if current >= 0 and (not best_values or best > problem.conflicts(var, current)):
+        return current, blocked  # Ningún valor mejora al actual
+    return rng.choice(best_values), blocked
+
+
+def min_conflicts_search(problem, max_steps=100_000, rng=None, tabu_tenure=10, walk_prob=0.02,
+                         sample=None, initial='greedy', initial_sample=None):
+    """
+    Mínimos conflictos incremental sobre 'problem' (BitsetConflicts, QueensConflicts o similar).
+      - tabu_tenure: pasos durante los que una variable no vuelve al valor que dejó (0 = sin tabú)
+      - walk_prob: probabilidad de mover la variable elegida a un valor al azar (ruido)
+      - sample: si se da, cuántos valores al azar se evalúan por paso (None = todo el dominio)
+      - initial: 'greedy' (cada variable en su valor con menos conflictos) o 'random'
+      - initial_sample: como 'sample', pero para el inicio voraz
+    Devuelve (asignación o None, MinConflictsStats).
+    """
+    rng = rng or random.Random()
+    conflicted = IndexedSet()
+
+    def refresh(changed):
+        for j in changed:
+            if problem.conflicts(j, problem.assignment[j]) > 0:
+                conflicted.add(j)
+            else:
+                conflicted.discard(j)
+
+    # 1. Asignación inicial completa
+    for var in range(len(problem)):
+        if initial == 'greedy':
+            value, _ = _best_value(problem, var, -1, rng, initial_sample, {}, 0)
+        else:
+            value = problem.random_value(var, rng)
+        refresh(problem.assign(var, value))
+    initial_conflicted = len(conflicted)
+
+    # 2. Reparar: variable en conflicto al azar -> su valor con menos conflictos
+    tabu = {}
+    walks = tabu_blocked = 0
+    for step in range(max_steps):
+        if not conflicted:
+            return problem.assignment, MinConflictsStats(step, initial_conflicted, walks, tabu_blocked)
+        var = conflicted.choice(rng)
+        current = problem.assignment[var]
+        if walk_prob and rng.random() < walk_prob:
+            value = problem.random_value(var, rng)
+            walks += 1
+        else:
+            value, blocked = _best_value(problem, var, current, rng, sample, tabu, step)
+            tabu_blocked += blocked
+        if value == current:
+            continue
+        if tabu_tenure:
+            tabu[(var, current)] = step + tabu_tenure
+            if len(tabu) > 4 * tabu_tenure + 64:
+                tabu = {move: until for move, until in tabu.items() if until > step}  # Purga de vencidos
+        refresh(problem.assign(var, value))
+
+    solved = not conflicted
+    stats = MinConflictsStats(max_steps, initial_conflicted, walks, tabu_blocked)
+    return (problem.assignment if solved else None), stats
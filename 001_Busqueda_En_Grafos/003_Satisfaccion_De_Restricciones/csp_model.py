@@ -0,0 +1,171 @@
+# Modelo CSP compartido por los solucionadores de esta carpeta
+# Los scripts definen el problema con diccionarios de listas de strings:
+#   variables = ['WA', 'NT', ...]
+#   domains = {'WA': ['rojo', 'verde', 'azul'], ...}
+#   constraints = {'WA': ['NT', 'SA'], ...}
+# y preguntan "value in domains[neighbor]" o hacen "domains[neighbor].remove(value)" sobre listas.
+#
+# Aquí cada variable y cada valor se convierten a enteros (su posición), y:
+#   - cada dominio es UN entero usado como máscara de bits: el bit k encendido = el valor k sigue disponible
+#   - cada restricción binaria (X, Y) es una tabla de compatibilidad: para cada valor a de X, una máscara
+#     con los valores de Y compatibles con a
+# Así, "quitar de Y los valores incompatibles con X = a" es un solo AND:  dom_Y & compat[X][Y][a]
+# y "¿le queda algún valor a Y?" es solo preguntar si la máscara es distinta de 0.
+
+ALL_DIFFERENT = None  # Relación por omisión: valores distintos (colorear mapas)
+
+
+def bits(mask):
+    """Posiciones de los bits encendidos de 'mask', de menor a mayor."""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def popcount(mask):
+    """Cantidad de valores en un dominio (bits encendidos)."""
+    return mask.bit_count()
+
+
+def _as_predicate(relation):
+    # Una relación puede ser una función f(valor_x, valor_y) -> bool o un conjunto de pares permitidos
+    if relation is ALL_DIFFERENT:
+        return lambda a, b: a != b
+    if callable(relation):
+        return relation
+    allowed = set(relation)
+    return lambda a, b: (a, b) in allowed
+
+
+class BitsetCSP:
+    """
+    CSP binario con variables y valores como enteros, dominios como máscaras de bits
+    y restricciones como tablas de compatibilidad.
+      - names[i]:      nombre de la variable i         index[nombre] -> i
+      - values[i][k]:  valor k de la variable i         value_index[i][valor] -> k
+      - domains[i]:    máscara inicial del dominio de i
+      - neighbors[i]:  variables que comparten una restricción con i
+      - compat[i][j][a]: máscara de valores de j compatibles con el valor a de i
+    """
+
+    def __init__(self, variables, domains, constraints=None, relations=None):
+        """
+        Acepta el mismo formato de los scripts:
+          - variables: lista de nombres
+          - domains: {variable: [valores]}
+          - constraints: {variable: [vecinos]} (restricción '!=' con cada vecino, como en colorear mapas)
+          - relations: opcional {(X, Y): relación} para restricciones distintas de '!='
+            (función f(valor_x, valor_y) -> bool, o conjunto de pares (valor_x, valor_y) permitidos)
+        """
+        self.names = list(variables)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.values = [list(domains[name]) for name in self.names]
+        self.value_index = [{value: k for k, value in enumerate(values)} for values in self.values]
+        self.domains = [(1 << len(values)) - 1 for values in self.values]
+        self.neighbors = [[] for _ in self.names]
+        self.compat = [{} for _ in self.names]
+
+        relations = relations or {}
+        for x in self.names:
+            for y in (constraints or {}).get(x, []):
+                self.add_constraint(x, y)
+        for (x, y), relation in relations.items():
+            self.add_constraint(x, y, relation)
+
+    def __len__(self):
+        return len(self.names)
+
+    def add_constraint(self, x, y, relation=ALL_DIFFERENT):
+        """
+        Agrega la restricción binaria relation(valor_x, valor_y) entre las variables x e y (por nombre).
+        Si ya había una restricción entre ellas, se combinan (deben cumplirse ambas).
+        """
+        i, j = self.index[x], self.index[y]
+        if i == j:
+            raise ValueError(f"restricción de '{x}' consigo misma: use el dominio para restricciones unarias")
+        allowed = _as_predicate(relation)
+        forward = [sum(1 << kb for kb, b in enumerate(self.values[j]) if allowed(a, b)) for a in self.values[i]]
+        backward = [sum(1 << ka for ka, a in enumerate(self.values[i]) if allowed(a, b)) for b in self.values[j]]
+
+        if j in self.compat[i]:
+            forward = [old & new for old, new in zip(self.compat[i][j], forward)]
+            backward = [old & new for old, new in zip(self.compat[j][i], backward)]
+        else:
+            self.neighbors[i].append(j)
+            self.neighbors[j].append(i)
+        self.compat[i][j] = forward
+        self.compat[j][i] = backward
+
+    def arcs(self):
+        """Todos los arcos (i, j), en ambas direcciones."""
+        return [(i, j) for i in range(len(self.names)) for j in self.neighbors[i]]
+
+    def consistent(self, i, a, assignment):
+        """
+        ¿El valor a de la variable i es compatible con las variables ya asignadas?
+        'assignment' es una lista indexada por variable con el índice del valor, o -1 si no está asignada.
+        """
+        compat = self.compat[i]
+        for j in self.neighbors[i]:
+            b = assignment[j]
+            if b >= 0 and not (compat[j][a] >> b) & 1:
+                return False
+        return True
+
+    def conflicts(self, i, a, assignment):
+        """Cuántas variables asignadas son incompatibles con el valor a de la variable i."""
+        compat = self.compat[i]
+        return sum(1 for j in self.neighbors[i] if assignment[j] >= 0 and not (compat[j][a] >> assignment[j]) & 1)
+
+    # --- Conversión entre nombres y enteros ---
+
+    def encode(self, assignment):
+        """{nombre: valor} -> lista de índices de valor (-1 = sin asignar)."""
+        encoded = [-1] * len(self.names)
+        for name, value in assignment.items():
+            i = self.index[name]
+            encoded[i] = self.value_index[i][value]
+        return encoded
+
+    def decode(self, assignment):
+        """Lista de índices de valor -> {nombre: valor} (solo variables asignadas)."""
+        return {self.names[i]: self.values[i][a] for i, a in enumerate(assignment) if a >= 0}
+
+    def domain_values(self, i, mask):
+        """Valores (los originales, no índices) que siguen en la máscara 'mask' de la variable i."""
+        return [self.values[i][k] for k in bits(mask)]
+
+
+class Trail:
+    """
+    Rastro único para deshacer podas durante la búsqueda. En lugar de copiar los dominios en cada
+    nodo (o guardar en un diccionario nuevo lo que se podó en cada rama), cada poda apila
+    (variable, máscara anterior); para retroceder se recuerda la altura del rastro antes de
+    podar y se desapila hasta esa altura.
+    """
+
+    def __init__(self, domains):
+        self.domains = domains  # Lista de máscaras que se poda en su lugar
+        self.entries = []
+
+    def __len__(self):
+        return len(self.entries)
+
+    def prune(self, var, mask):
+        """domains[var] = mask, anotando la máscara anterior. Devuelve True si cambió algo."""
+        old = self.domains[var]
+        if mask == old:
+            return False
+        self.entries.append((var, old))
+        self.domains[var] = mask
+        return True
+
+    def undo(self, height, on_restore=None):
+        """Deshace las podas hasta dejar el rastro con 'height' entradas (on_restore(var) por cada una)."""
+        entries, domains = self.entries, self.domains
+        while len(entries) > height:
+            var, old = entries.pop()
+            domains[var] = old
+            if on_restore is not None:
+                on_restore(var)
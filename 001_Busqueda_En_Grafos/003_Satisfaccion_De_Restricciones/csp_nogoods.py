@@ -0,0 +1,251 @@
+# Salto atrás dirigido por conflictos (CBJ) con aprendizaje de nogoods y reinicios
+# backtrack_cbj del script 005 calcula el conjunto de conflictos de cada variable, pero lo olvida al saltar:
+# si la búsqueda vuelve a una situación parecida por otra rama, repite exactamente el mismo trabajo.
+#
+# Aquí, cuando una variable se queda sin valores, su conjunto de conflictos C se guarda como "nogood":
+# la combinación de valores que tienen ahora las variables de C no puede formar parte de ninguna solución.
+#   - Los nogoods se guardan con dos literales vigilados (como los resolvedores SAT): al asignar var = valor
+#     solo se revisan los nogoods que vigilan ese literal, no todos.
+#   - Si hay demasiados, se borran los menos activos (la actividad sube cada vez que un nogood rechaza un valor).
+#   - Reinicios de Luby: cada cierto número de fallos (1, 1, 2, 1, 1, 2, 4, ... veces una base) se
+#     empieza de nuevo, conservando los nogoods aprendidos y los pesos del orden de variables.
+#
+# Los conjuntos de conflictos son máscaras de bits sobre los NIVELES de decisión (el bit d es la variable
+# asignada en la profundidad d): unir es un OR y el nivel al que hay que saltar es el bit más alto.
+
+from collections import namedtuple
+
+from csp_model import bits
+from csp_ordering import DomWdeg, fixed_values
+from csp_solvers import _permitir_recursion, find_conflict
+
+# Estadísticas de una búsqueda
+CBJStats = namedtuple('CBJStats', ['nodes', 'dead_ends', 'backjumps', 'levels_jumped', 'learned', 'deleted',
+                                   'kept', 'nogood_prunes', 'restarts'])
+
+
+def luby(i):
+    """Término i (desde 1) de la sucesión de Luby: 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8, ..."""
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    while i != (1 << k) - 1:
+        i -= (1 << (k - 1)) - 1
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+    return 1 << (k - 1)
+
+
+class Nogood:
+    """Literales (variable, valor) que no pueden cumplirse todos a la vez. lits[0] y lits[1] son los vigilados."""
+    __slots__ = ('lits', 'activity', 'deleted')
+
+    def __init__(self, lits):
+        self.lits = lits
+        self.activity = 0.0
+        self.deleted = False
+
+
+class NogoodStore:
+    """
+    Nogoods aprendidos con dos literales vigilados. Invariante: mientras un nogood no se cumpla
+    completo, al menos uno de sus dos literales vigilados es falso (variable sin asignar u otro valor).
+    Así, el único momento en que un nogood puede completarse es al asignar uno de sus vigilados.
+    """
+
+    def __init__(self, csp, max_learned=1000, decay=0.95):
+        self.watches = [[[] for _ in values] for values in csp.values]  # watches[var][valor] -> [Nogood]
+        self.learned = []
+        self.max_learned = max_learned
+        self.decay = decay
+        self._increment = 1.0
+        self.deleted = 0
+
+    def add(self, lits):
+        """Guarda un nogood de 2 o más literales; lits[0] y lits[1] deben ser los asignados más recientemente."""
+        nogood = Nogood(lits)
+        nogood.activity = self._increment
+        for var, value in lits[:2]:
+            self.watches[var][value].append(nogood)
+        self.learned.append(nogood)
+        return nogood
+
+    def check(self, var, value, assignment):
+        """
+        Se llama justo después de asignar var = value. Devuelve un nogood que ahora se cumple completo
+        (el valor hay que rechazarlo), o None. Mueve los vigilados que dejaron de ser falsos.
+        """
+        watching = self.watches[var][value]
+        i = 0
+        while i < len(watching):
+            nogood = watching[i]
+            if nogood.deleted:
+                watching[i] = watching[-1]
+                watching.pop()
+                continue
+            lits = nogood.lits
+            if lits[0][0] == var:
+                lits[0], lits[1] = lits[1], lits[0]  # El literal recién asignado queda en la posición 1
+            other_var, other_value = lits[0]
+            if assignment[other_var] != other_value:
+                i += 1  # El otro vigilado es falso: el nogood no puede cumplirse
+                continue
+            for k in range(2, len(lits)):
+                y, b = lits[k]
+                if assignment[y] != b:  # Literal falso: pasa a ser el vigilado
+                    lits[1], lits[k] = lits[k], lits[1]
+                    self.watches[y][b].append(nogood)
+                    watching[i] = watching[-1]
+                    watching.pop()
+                    break
+            else:
+                self.bump(nogood)
+                return nogood
+        return None
+
+    def bump(self, nogood):
+        nogood.activity += self._increment
+
+    def decay_activity(self):
+        # En lugar de bajar la actividad de todos, se sube lo que vale un uso futuro
+        self._increment /= self.decay
+        if self._increment > 1e100:
+            for nogood in self.learned:
+                nogood.activity *= 1e-100
+            self._increment *= 1e-100
+
+    def reduce(self):
+        """Si hay más de max_learned nogoods, borra la mitad menos activa (los de 2 literales se conservan)."""
+        if len(self.learned) <= self.max_learned:
+            return
+        candidates = sorted((n for n in self.learned if len(n.lits) > 2), key=lambda n: n.activity)
+        removed = candidates[:len(self.learned) // 2]
+        for nogood in removed:
+            nogood.deleted = True
+        self.learned = [n for n in self.learned if not n.deleted]
+        self.deleted += len(removed)
+        # Las listas de vigilados se limpian solas en check; aquí se vacían las que quedaron sin revisar
+        for by_value in self.watches:
+            for k, watching in enumerate(by_value):
+                if any(n.deleted for n in watching):
+                    by_value[k] = [n for n in watching if not n.deleted]
+        self.max_learned = int(self.max_learned * 1.1)  # El límite crece poco a poco, como en SAT
+
+
+class _Restart(Exception):
+    """Se cumplió el número de fallos del reinicio actual."""
+
+
+def cbj_learning(csp, domains=None, assignment=None, variable_order=None, value_order=None, restarts=True,
+                 restart_base=64, max_learned=1000, max_nodes=None):
+    """
+    CBJ con aprendizaje de nogoods y reinicios de Luby.
+      - domains / assignment: dominios iniciales (lista de máscaras) y variables ya fijas (-1 = libre)
+      - variable_order: por omisión DomWdeg (con reinicios conviene un orden que aprenda de los fallos)
+      - restarts: si es False nunca se reinicia; restart_base: fallos del primer reinicio
+      - max_learned: nogoods guardados antes de borrar los menos activos
+      - max_nodes: corta la búsqueda (devuelve None) al pasar ese número de nodos
+    Devuelve (asignación o None, CBJStats).
+    """
+    domains = list(csp.domains if domains is None else domains)
+    assignment = [-1] * len(csp) if assignment is None else list(assignment)  # Copia: las fijas no se tocan
+    order = variable_order or DomWdeg()
+    values = value_order or fixed_values
+    store = NogoodStore(csp, max_learned)
+    level = [-1] * len(csp)   # Nivel de decisión de cada variable asignada
+    decisions = []            # decisions[d] = variable asignada en el nivel d
+    counts = dict(nodes=0, dead_ends=0, backjumps=0, levels_jumped=0, learned=0, nogood_prunes=0, restarts=0)
+    limit = [restart_base * luby(1) if restarts else None]
+    failures = [0]
+    _permitir_recursion(csp)
+
+    def conflict_levels(lits, var):
+        mask = 0
+        for y, _ in lits:
+            if y != var and level[y] >= 0:
+                mask |= 1 << level[y]
+        return mask
+
+    def learn(conflict, depth):
+        # El nogood son los valores actuales de las variables de los niveles en 'conflict'
+        counts['dead_ends'] += 1
+        target = conflict.bit_length() - 1  # Nivel al que se salta (-1: no hay nada que cambiar)
+        if target < depth - 1:
+            counts['backjumps'] += 1
+            counts['levels_jumped'] += depth - 1 - target
+        lits = [(decisions[d], assignment[decisions[d]]) for d in reversed(list(bits(conflict)))]
+        if len(lits) == 1:
+            var, value = lits[0]
+            domains[var] &= ~(1 << value)  # Nogood de un literal: el valor sale del dominio para siempre
+            order.domain_changed(var)
+            counts['learned'] += 1
+        elif len(lits) > 1:
+            store.add(lits)
+            counts['learned'] += 1
+        store.decay_activity()
+        failures[0] += 1
+        if limit[0] is not None and failures[0] >= limit[0] and conflict:
+            raise _Restart
+
+    def resolver(depth):
+        var = order.select()
+        if var < 0:
+            return True, 0
+        conflict = 0
+        for value in list(values(csp, var, domains, assignment)):
+            if not (domains[var] >> value) & 1:
+                continue  # Quitado por un nogood de un literal aprendido más abajo
+            counts['nodes'] += 1
+            if max_nodes is not None and counts['nodes'] > max_nodes:
+                raise _Restart  # Se atrapa abajo y, sin más reinicios, termina la búsqueda
+            culprit = find_conflict(csp, var, value, assignment)
+            if culprit >= 0:
+                if level[culprit] >= 0:
+                    conflict |= 1 << level[culprit]
+                order.conflict(var, culprit)
+                continue
+            assignment[var] = value
+            nogood = store.check(var, value, assignment)
+            if nogood is not None:
+                assignment[var] = -1
+                conflict |= conflict_levels(nogood.lits, var)
+                counts['nogood_prunes'] += 1
+                continue
+            level[var] = depth
+            decisions.append(var)
+            order.assigned(var)
+            solved, child = resolver(depth + 1)
+            if solved:
+                return True, 0
+            decisions.pop()
+            level[var] = -1
+            assignment[var] = -1
+            order.unassigned(var)
+            if not (child >> depth) & 1:
+                return False, child  # El salto: esta variable no participa en el conflicto
+            conflict |= child & ~(1 << depth)
+        learn(conflict, depth)
+        store.reduce()
+        return False, conflict
+
+    solution = None
+    while True:
+        order.start(csp, domains, assignment)
+        try:
+            solved, _ = resolver(0)
+            solution = assignment if solved else None
+            break
+        except _Restart:
+            for var in decisions:
+                assignment[var] = -1
+                level[var] = -1
+            decisions.clear()
+            if max_nodes is not None and counts['nodes'] > max_nodes:
+                break
+            counts['restarts'] += 1
+            failures[0] = 0
+            limit[0] = restart_base * luby(counts['restarts'] + 1)
+
+    stats = CBJStats(kept=len(store.learned), deleted=store.deleted, **counts)
+    return solution, stats
@@ -0,0 +1,165 @@
+# Heurísticas de orden para los solucionadores de csp_solvers.py
+# Los scripts 002, 003 y 005 eligen siempre la primera variable sin asignar y prueban los valores
+# en el orden del dominio. Aquí el orden es intercambiable:
+#   - Orden de variables: FirstUnassigned (el de los scripts), MRVDegree (mínimos valores restantes,
+#     desempate por grado) y DomWdeg (dominio / grado ponderado por los fallos de cada restricción)
+#   - Orden de valores: fixed_values (el de los scripts) y least_constraining_values (LCV)
+#
+# Elegir la variable con MRV recorriendo todas las variables en cada nodo cuesta O(n) por nodo.
+# En su lugar, cada orden guarda un montículo con (clave, variable) que se actualiza solo cuando algo
+# cambia: el solucionador avisa al podar o restaurar un dominio, al asignar o desasignar, y al fallar.
+# Las entradas viejas no se borran: al sacar el mínimo se descartan las que ya no coinciden con la
+# clave actual de su variable (invalidación perezosa).
+
+import heapq
+
+from csp_model import bits, popcount
+
+
+class FirstUnassigned:
+    """
+    Orden fijo: la primera variable sin asignar, como select_unassigned_variable de los scripts.
+    Base de las demás: cada subclase solo define key(var) y qué eventos cambian las claves.
+    """
+
+    def start(self, csp, domains, assignment):
+        """Se llama una vez al empezar la búsqueda con los dominios y la asignación del solucionador."""
+        self.csp, self.domains, self.assignment = csp, domains, assignment
+        self._rebuild()
+
+    def key(self, var):
+        return var
+
+    def _rebuild(self):
+        self._heap = [(self.key(var), var) for var, value in enumerate(self.assignment) if value < 0]
+        heapq.heapify(self._heap)
+
+    def _push(self, var):
+        if self.assignment[var] < 0:
+            heapq.heappush(self._heap, (self.key(var), var))
+            if len(self._heap) > 4 * len(self.assignment) + 64:
+                self._rebuild()  # Demasiadas entradas viejas: se reconstruye con las vigentes
+
+    def select(self):
+        """Variable a asignar, o -1 si ya están todas asignadas."""
+        heap = self._heap
+        while heap:
+            key, var = heap[0]
+            if self.assignment[var] < 0 and key == self.key(var):
+                return var
+            heapq.heappop(heap)  # Entrada vieja (variable asignada o clave cambiada)
+        return -1
+
+    # --- Eventos que avisa el solucionador ---
+
+    def assigned(self, var):
+        pass  # La entrada de 'var' queda inválida sola (assignment[var] >= 0)
+
+    def unassigned(self, var):
+        self._push(var)
+
+    def domain_changed(self, var):
+        pass
+
+    def conflict(self, var, other):
+        """La restricción entre var y other causó un fallo (dominio vacío o valor incompatible)."""
+        pass
+
+
+class MRVDegree(FirstUnassigned):
+    """
+    Mínimos valores restantes (MRV): la variable con el dominio más pequeño.
+    Empates: la de mayor grado (más restricciones con variables sin asignar), y luego la primera.
+    Con 'backtrack' los dominios no se podan, así que solo cuenta el grado: MRV rinde con
+    forward_check, que sí achica los dominios.
+    """
+
+    def start(self, csp, domains, assignment):
+        self.degree = [sum(1 for j in csp.neighbors[i] if assignment[j] < 0) for i in range(len(csp))]
+        super().start(csp, domains, assignment)
+
+    def key(self, var):
+        return popcount(self.domains[var]), -self.degree[var], var
+
+    def assigned(self, var):
+        for j in self.csp.neighbors[var]:
+            self.degree[j] -= 1
+            self._push(j)
+
+    def unassigned(self, var):
+        for j in self.csp.neighbors[var]:
+            self.degree[j] += 1
+            self._push(j)
+        self._push(var)
+
+    def domain_changed(self, var):
+        self._push(var)
+
+
+class DomWdeg(FirstUnassigned):
+    """
+    dom/wdeg: cada restricción tiene un peso (empieza en 1) que sube cada vez que causa un fallo;
+    wdeg(X) es la suma de los pesos de las restricciones de X con variables sin asignar.
+    Se elige la variable con menor |dominio| / wdeg: la búsqueda aprende qué zonas son difíciles.
+    Los pesos se conservan entre búsquedas si se reusa el mismo objeto.
+    """
+
+    def __init__(self):
+        self.weights = {}  # (i, j) con i < j -> peso
+
+    def weight(self, i, j):
+        return self.weights.get((i, j) if i < j else (j, i), 1)
+
+    def start(self, csp, domains, assignment):
+        self.wdeg = [sum(self.weight(i, j) for j in csp.neighbors[i] if assignment[j] < 0)
+                     for i in range(len(csp))]
+        super().start(csp, domains, assignment)
+
+    def key(self, var):
+        wdeg = self.wdeg[var]
+        size = popcount(self.domains[var])
+        # Sin restricciones pendientes la variable es trivial: se deja al final
+        return (size / wdeg if wdeg else float('inf')), size, var
+
+    def assigned(self, var):
+        for j in self.csp.neighbors[var]:
+            self.wdeg[j] -= self.weight(var, j)
+            self._push(j)
+
+    def unassigned(self, var):
+        for j in self.csp.neighbors[var]:
+            self.wdeg[j] += self.weight(var, j)
+            self._push(j)
+        self._push(var)
+
+    def domain_changed(self, var):
+        self._push(var)
+
+    def conflict(self, var, other):
+        pair = (var, other) if var < other else (other, var)
+        self.weights[pair] = self.weights.get(pair, 1) + 1
+        for x, y in ((var, other), (other, var)):
+            if self.assignment[y] < 0:
+                self.wdeg[x] += 1
+                self._push(x)
+
+
+# --- Orden de valores: value_order(csp, var, domains, assignment) -> valores a probar ---
+
+def fixed_values(csp, var, domains, assignment):
+    """En el orden del dominio (como los scripts)."""
+    return bits(domains[var])
+
+
+def least_constraining_values(csp, var, domains, assignment):
+    """
+    Valor menos restrictivo (LCV): primero el valor que quita menos opciones a los vecinos sin asignar.
+    Lo que quita el valor a en el vecino j es popcount(dominio_j & ~compat[var][j][a]).
+    """
+    compat = csp.compat[var]
+    pending = [(j, domains[j]) for j in csp.neighbors[var] if assignment[j] < 0]
+
+    def removed(a):
+        return sum(popcount(dom_j & ~compat[j][a]) for j, dom_j in pending)
+
+    return sorted(bits(domains[var]), key=removed)
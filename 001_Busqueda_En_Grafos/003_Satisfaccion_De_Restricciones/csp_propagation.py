@@ -0,0 +1,91 @@
+# Motor de consistencia de arcos para el modelo BitsetCSP (csp_model.py)
+# El script 004 (AC-3) empieza con una lista de arcos, vuelve a encolar arcos que ya estaban en la cola
+# y, en cada 'revise', recorre todo el dominio del vecino buscando soporte para cada valor.
+#
+# Aquí:
+#   - la cola es FIFO y no tiene repetidos (deque + set): un arco que ya espera no se vuelve a encolar
+#   - cada valor a de X recuerda su último soporte en Y (AC-2001 / AC-3.1): si ese valor de Y sigue en el
+#     dominio, a sigue soportado sin buscar nada; solo si se perdió se busca otro, y con máscaras la
+#     búsqueda es un AND:  compat[X][Y][a] & dominio_Y  (el bit más bajo es el nuevo soporte)
+#   - las relaciones son las del modelo: '!=', funciones o tablas de pares, todas ya como máscaras
+#   - puede correr de forma incremental (MAC): después de asignar una variable solo se revisan
+#     los arcos que apuntan a ella, y lo que se poda se anota en el rastro (csp_model.Trail)
+#
+# Los soportes NO se restauran al retroceder: como cualquier soporte guardado se vuelve a comprobar
+# antes de usarlo, sirven igual aunque los dominios hayan crecido (la variante AC-3rm de AC-2001).
+
+from collections import deque
+
+from csp_model import bits
+
+
+class ArcConsistency:
+    """
+    Consistencia de arcos AC-2001 sobre máscaras. Un objeto por problema: los soportes guardados
+    se reusan en todas las llamadas a propagate (útil en MAC, donde se llama en cada nodo).
+    Contadores: revisions (arcos revisados), residue_hits (soportes que seguían vigentes)
+    y searches (soportes que hubo que buscar de nuevo).
+    """
+
+    def __init__(self, csp):
+        self.csp = csp
+        # last[x][y][a] = último soporte del valor a de x en y (-1 = todavía no tiene)
+        self.last = [{y: [-1] * len(csp.values[x]) for y in csp.neighbors[x]} for x in range(len(csp))]
+        self.failed_arc = None  # Arco (x, y) que vació el dominio de x en la última propagación fallida
+        self.revisions = self.residue_hits = self.searches = 0
+
+    def revise(self, domains, x, y):
+        """Quita de domains[x] los valores sin soporte en domains[y]. Devuelve la máscara nueva."""
+        self.revisions += 1
+        dom_y = domains[y]
+        compat = self.csp.compat[x][y]
+        last = self.last[x][y]
+        supported = domains[x]
+        for a in bits(supported):
+            b = last[a]
+            if b >= 0 and (dom_y >> b) & 1:
+                self.residue_hits += 1
+                continue
+            self.searches += 1
+            options = compat[a] & dom_y
+            if options:
+                last[a] = (options & -options).bit_length() - 1
+            else:
+                supported &= ~(1 << a)
+        return supported
+
+    def propagate(self, domains, arcs=None, trail=None):
+        """
+        Aplica consistencia de arcos a 'domains' (lista de máscaras, se modifica en su lugar).
+          - arcs: arcos (x, y) con los que empieza la cola (por omisión todos los del problema)
+          - trail: Trail de csp_model sobre 'domains'; si se da, cada poda queda anotada
+            en él para poder deshacerla
+        Devuelve False si algún dominio queda vacío (y failed_arc indica el arco), True si no.
+        """
+        neighbors = self.csp.neighbors
+        queue = deque(self.csp.arcs() if arcs is None else arcs)
+        waiting = set(queue)
+        while queue:
+            arc = queue.popleft()
+            waiting.discard(arc)
+            x, y = arc
+            old = domains[x]
+            new = self.revise(domains, x, y)
+            if new == old:
+                continue
+            if trail is not None:
+                trail.prune(x, new)
+            else:
+                domains[x] = new
+            if not new:
+                self.failed_arc = arc
+                return False
+            for z in neighbors[x]:
+                if z != y and (z, x) not in waiting:
+                    waiting.add((z, x))
+                    queue.append((z, x))
+        return True
+
+    def arcs_towards(self, var):
+        """Arcos (z, var) a revisar cuando cambia el dominio de 'var' (el arranque de MAC)."""
+        return [(z, var) for z in self.csp.neighbors[var]]
@@ -0,0 +1,305 @@
+# Solucionadores de los scripts 002-007 sobre el modelo BitsetCSP (csp_model.py)
+# Mismos algoritmos, pero:
+#   - una asignación es una lista indexada por variable (índice del valor, o -1 si no está asignada)
+#   - los dominios son una lista de máscaras de bits, y podar es un AND:  domains[j] &= compat[i][j][a]
+#   - las podas se deshacen con un solo rastro (csp_model.Trail), sin copiar dominios en cada nodo
+#   - las restricciones no tienen que ser '!=': cualquier relación binaria del modelo funciona igual
+# Las funciones devuelven asignaciones con índices; csp.decode(...) las convierte a {variable: valor}.
+
+import sys
+
+from csp_cutset import cutset_assignments, cycle_cutset, solve_tree
+from csp_min_conflicts import BitsetConflicts, min_conflicts_search
+from csp_model import Trail
+from csp_ordering import FirstUnassigned, fixed_values
+from csp_propagation import ArcConsistency
+
+
+def _permitir_recursion(csp):
+    # Los solucionadores recursivos bajan un nivel por variable: con miles de variables
+    # el límite por omisión de Python (1000) no alcanza
+    necesario = len(csp) + 100
+    if sys.getrecursionlimit() < necesario:
+        sys.setrecursionlimit(necesario)
+
+
+class SearchLimit(Exception):
+    """Se alcanzó SearchStats.max_nodes (la búsqueda se corta y devuelve None)."""
+
+
+class SearchStats:
+    """
+    Contadores de una búsqueda (se pasa como 'stats' y el solucionador los va sumando).
+      - nodes: asignaciones probadas     - backtracks: valores que fallaron y se deshicieron
+      - max_nodes: si se da, la búsqueda se corta al pasarlo y 'aborted' queda en True
+    """
+
+    def __init__(self, max_nodes=None):
+        self.nodes = 0
+        self.backtracks = 0
+        self.max_nodes = max_nodes
+        self.aborted = False
+
+    def node(self):
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            self.aborted = True
+            raise SearchLimit
+
+    def __repr__(self):
+        return f"SearchStats(nodes={self.nodes}, backtracks={self.backtracks}, aborted={self.aborted})"
+
+
+def find_conflict(csp, var, value, assignment):
+    """Primera variable asignada incompatible con var = value, o -1 si no hay."""
+    compat = csp.compat[var]
+    for neighbor in csp.neighbors[var]:
+        b = assignment[neighbor]
+        if b >= 0 and not (compat[neighbor][value] >> b) & 1:
+            return neighbor
+    return -1
+
+
+def _preparar(csp, domains, assignment, variable_order, value_order, stats):
+    # Valores por omisión comunes a los solucionadores con orden intercambiable (csp_ordering.py)
+    assignment = [-1] * len(csp) if assignment is None else assignment
+    variable_order = variable_order or FirstUnassigned()
+    variable_order.start(csp, domains, assignment)
+    _permitir_recursion(csp)
+    return assignment, variable_order, value_order or fixed_values, stats or SearchStats()
+
+
+def _rastro(csp, domains, trail):
+    # Los solucionadores que podan trabajan sobre un Trail: el que reciben (y entonces podan sus
+    # dominios, deshaciendo todo al fallar) o uno nuevo sobre una copia de 'domains'
+    if trail is not None:
+        return trail
+    return Trail(list(csp.domains if domains is None else domains))
+
+
+# --- Vuelta atrás (script 002) ---
+
+def backtrack(csp, domains=None, assignment=None, variable_order=None, value_order=None, stats=None,
+              trail=None):
+    """
+    Vuelta atrás cronológica. 'domains' permite empezar con dominios ya podados
+    (por omisión los del modelo). Devuelve la asignación completa o None.
+      - variable_order / value_order: heurísticas de csp_ordering.py (por omisión, el orden de los scripts)
+      - stats: SearchStats para contar nodos (y cortar con max_nodes)
+      - trail: Trail compartido (por ejemplo el de cutset_conditioning); sus dominios reemplazan a 'domains'
+    """
+    domains = trail.domains if trail is not None else (csp.domains if domains is None else domains)
+    assignment, order, values, stats = _preparar(csp, domains, assignment, variable_order, value_order, stats)
+
+    def resolver():
+        var = order.select()
+        if var < 0:
+            return assignment
+        for value in values(csp, var, domains, assignment):
+            stats.node()
+            conflicting = find_conflict(csp, var, value, assignment)
+            if conflicting >= 0:
+                order.conflict(var, conflicting)
+                continue
+            assignment[var] = value
+            order.assigned(var)
+            if resolver() is not None:
+                return assignment
+            assignment[var] = -1
+            order.unassigned(var)
+            stats.backtracks += 1
+        return None
+
+    try:
+        return resolver()
+    except SearchLimit:
+        return None
+
+
+# --- Comprobación hacia adelante (script 003) ---
+
+def forward_check(csp, domains=None, assignment=None, variable_order=None, value_order=None, stats=None,
+                  trail=None):
+    """
+    Vuelta atrás con comprobación hacia adelante: al asignar var = value, cada vecino sin asignar
+    se queda solo con los valores compatibles (un AND por vecino). Si algún dominio queda en 0,
+    se desapila el rastro hasta la altura anterior y se prueba el siguiente valor.
+    Mismos parámetros que backtrack.
+    """
+    trail = _rastro(csp, domains, trail)
+    domains = trail.domains
+    assignment, order, values, stats = _preparar(csp, domains, assignment, variable_order, value_order, stats)
+
+    def resolver():
+        var = order.select()
+        if var < 0:
+            return assignment
+        compat = csp.compat[var]
+        for value in list(values(csp, var, domains, assignment)):
+            stats.node()
+            assignment[var] = value
+            order.assigned(var)
+            height = len(trail)
+            wipeout = False
+            for neighbor in csp.neighbors[var]:
+                if assignment[neighbor] < 0 and trail.prune(neighbor, domains[neighbor] & compat[neighbor][value]):
+                    order.domain_changed(neighbor)
+                    if not domains[neighbor]:
+                        wipeout = True
+                        order.conflict(var, neighbor)
+                        break
+            if not wipeout and resolver() is not None:
+                return assignment
+            trail.undo(height, order.domain_changed)
+            assignment[var] = -1
+            order.unassigned(var)
+            stats.backtracks += 1
+        return None
+
+    try:
+        return resolver()
+    except SearchLimit:
+        return None
+
+
+# --- Consistencia de arcos (script 004) y MAC ---
+
+def ac3(csp, domains=None, engine=None):
+    """
+    Consistencia de arcos sobre máscaras con el motor AC-2001 de csp_propagation.py.
+    Poda 'domains' (lista de máscaras, se modifica en su lugar; por omisión una copia de los del modelo).
+    Devuelve (consistente, domains).
+    """
+    domains = list(csp.domains) if domains is None else domains
+    engine = engine or ArcConsistency(csp)
+    return engine.propagate(domains), domains
+
+
+def mac(csp, domains=None, assignment=None, variable_order=None, value_order=None, stats=None, engine=None,
+        trail=None):
+    """
+    Vuelta atrás manteniendo la consistencia de arcos (MAC): primero se hace todo el problema
+    arco-consistente y, después de cada asignación, se propaga solo desde la variable asignada.
+    Es forward_check llevado hasta el final: además de podar a los vecinos, la poda se contagia.
+    Mismos parámetros que backtrack, más 'engine' (un ArcConsistency, para reusar sus soportes).
+    """
+    trail = _rastro(csp, domains, trail)
+    domains = trail.domains
+    engine = engine or ArcConsistency(csp)
+    start = len(trail)
+    if assignment is not None:
+        for var, value in enumerate(assignment):
+            if value >= 0:
+                trail.prune(var, domains[var] & (1 << value))
+    if not engine.propagate(domains, trail=trail):
+        trail.undo(start)
+        return None
+    assignment, order, values, stats = _preparar(csp, domains, assignment, variable_order, value_order, stats)
+
+    def resolver():
+        var = order.select()
+        if var < 0:
+            return assignment
+        for value in list(values(csp, var, domains, assignment)):
+            stats.node()
+            assignment[var] = value
+            order.assigned(var)
+            height = len(trail)
+            trail.prune(var, 1 << value)
+            consistent = engine.propagate(domains, engine.arcs_towards(var), trail)
+            for x, _ in trail.entries[height + 1:]:
+                order.domain_changed(x)
+            if not consistent:
+                order.conflict(*engine.failed_arc)
+            elif resolver() is not None:
+                return assignment
+            trail.undo(height, order.domain_changed)
+            assignment[var] = -1
+            order.unassigned(var)
+            stats.backtracks += 1
+        return None
+
+    try:
+        solution = resolver()
+    except SearchLimit:
+        solution = None
+    if solution is None:
+        trail.undo(start)  # Deja los dominios del que llamó como estaban
+    return solution
+
+
+# --- Salto atrás dirigido por conflictos (script 005) ---
+
+def backtrack_cbj(csp, domains=None, assignment=None, variable_order=None, value_order=None, stats=None,
+                  trail=None):
+    """
+    Conflict-Directed Backjumping. Devuelve (asignación o None, conjunto de conflictos),
+    con el conjunto de conflictos como conjunto de índices de variable. Mismos parámetros que backtrack.
+    """
+    domains = trail.domains if trail is not None else (csp.domains if domains is None else domains)
+    assignment, order, values, stats = _preparar(csp, domains, assignment, variable_order, value_order, stats)
+
+    def resolver():
+        var = order.select()
+        if var < 0:
+            return assignment, set()
+        conflict_set = set()
+        for value in values(csp, var, domains, assignment):
+            stats.node()
+            conflicting = find_conflict(csp, var, value, assignment)
+            if conflicting >= 0:
+                conflict_set.add(conflicting)
+                order.conflict(var, conflicting)
+                continue
+            assignment[var] = value
+            order.assigned(var)
+            result, child_conflicts = resolver()
+            if result is not None:
+                return result, set()
+            assignment[var] = -1
+            order.unassigned(var)
+            stats.backtracks += 1
+            if var not in child_conflicts:
+                return None, child_conflicts  # El salto: 'var' no causó el conflicto
+            conflict_set |= child_conflicts - {var}
+        return None, conflict_set
+
+    try:
+        return resolver()
+    except SearchLimit:
+        return None, set()
+
+
+# --- Mínimos conflictos (script 006) ---
+
+def min_conflicts(csp, max_steps=1000, rng=None, domains=None):
+    """
+    Mínimos conflictos desde una asignación completa al azar, como el script 006 (sin tabú ni ruido),
+    con los contadores incrementales de csp_min_conflicts.py. Devuelve (asignación o None, pasos usados).
+    """
+    problem = BitsetConflicts(csp, domains)
+    assignment, stats = min_conflicts_search(problem, max_steps, rng, tabu_tenure=0, walk_prob=0.0,
+                                             initial='random')
+    return assignment, stats.steps
+
+
+# --- Acondicionamiento del corte (script 007) ---
+
+def cutset_conditioning(csp, cutset=None, solver=solve_tree):
+    """
+    Prueba cada asignación consistente del conjunto de corte 'cutset' (índices de variable; por omisión
+    cycle_cutset de csp_cutset.py) y resuelve el resto con 'solver' (por omisión solve_tree, sin vuelta
+    atrás: el resto debe ser un bosque; si el corte deja algún ciclo, solve_tree lanza ValueError, y para
+    un corte cualquiera hay que pasar otro solver, como forward_check). Al asignar una variable del corte se podan sus vecinos en un solo
+    Trail, que el solucionador sigue usando: ni los dominios ni la asignación se copian al pasar a otro valor.
+    Devuelve la asignación completa o None.
+    """
+    cutset = cycle_cutset(csp) if cutset is None else cutset
+    assignment = [-1] * len(csp)
+    trail = Trail(list(csp.domains))
+    for _ in cutset_assignments(csp, cutset, assignment, trail):
+        result = solver(csp, assignment=assignment, trail=trail)
+        solution = result[0] if isinstance(result, tuple) else result
+        if solution is not None:
+            return solution
+    return None
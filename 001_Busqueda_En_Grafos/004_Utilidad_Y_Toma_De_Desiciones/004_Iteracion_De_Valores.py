@@ -6,6 +6,7 @@
 # Entre sus desventajas se encuentra la necesidad de conocer el modelo completo del entorno y puede ser computacionalmente costoso para espacios de estado grandes.
 #Su objetivo principal es determinar cual accion debera tomarse en cada estado para maximizar la utilidad esperada.
 
+from mdp_vectorizado import compilar_mdp, iteracion_valores as iteracion_valores_dispersa # Versión con matrices dispersas
 
 # Definición de los componentes del MDP:
 estados = ['A', 'B', 'C']  # Lista de estados posibles del sistema
@@ -25,9 +26,18 @@ epsilon = 0.001  # Criterio de convergencia (margen de error aceptable)
 U = {s: 0 for s in estados}  # Inicialización de utilidades en 0 para todos los estados
 
 # --- Implementación del algoritmo de iteración de valores ---
-def iteracion_valores():
-    """Ejecuta el algoritmo de iteración de valores hasta alcanzar convergencia."""
+def iteracion_valores(vectorizado=False):
+    """
+    Ejecuta el algoritmo de iteración de valores hasta alcanzar convergencia.
+    Con vectorizado=True usa el motor de mdp_vectorizado.py (un producto matriz-vector disperso por barrido).
+    """
     global U
+    if vectorizado:
+        # Una sola acción por estado: la recompensa es la del estado, como en la ecuación de abajo
+        mdp = compilar_mdp(estados, [None], lambda s, a: transiciones[s], lambda s, a: recompensa[s])
+        resultado = iteracion_valores_dispersa(mdp, gamma, epsilon, U=[U[s] for s in estados])
+        U = mdp.nombrar(resultado.U)
+        return U
     while True:
         delta = 0  # Inicializa la diferencia máxima entre iteraciones
         U_nuevo = U.copy()  # Crea una copia de las utilidades actuales
@@ -55,4 +65,11 @@ U_final = iteracion_valores()  # Obtiene las utilidades finales convergidas
 print("=== ITERACIÓN DE VALORES ===\n")
 # Imprime los resultados formateados
 for s in estados:
-    print(f"U({s}) = {U_final[s]:.4f}")
\ No newline at end of file
+    print(f"U({s}) = {U_final[s]:.4f}")
+
+# La misma iteración con matrices dispersas (mdp_vectorizado.py), desde utilidades en 0
+U = {s: 0 for s in estados}
+U_vectorizado = iteracion_valores(vectorizado=True)
+print("\nCon matrices dispersas:")
+for s in estados:
+    print(f"U({s}) = {U_vectorizado[s]:.4f}")
@@ -6,6 +6,13 @@
 # Ventajas: encuentra la política óptima considerando todas las acciones posibles.
 # Desventajas: complejidad computacional mayor que en el caso de una sola acción por estado.
 
+import time
+
+import numpy as np
+from scipy import sparse
+
+from mdp_vectorizado import MDPDisperso, compilar_mdp, iteracion_valores # Versión con matrices dispersas
+
 # Definición del MDP completo:
 estados = ['A', 'B', 'C']  # Lista de estados del sistema
 acciones = {  # Diccionario de acciones disponibles por estado
@@ -32,9 +39,20 @@ epsilon = 0.001  # Umbral de convergencia
 U = {s: 0 for s in estados}  # Inicialización de utilidades
 
 # --- Iteración de Valores para MDP ---
-def iteracion_valores_mdp():
-    """Calcula las utilidades óptimas usando iteración de valores para MDP."""
+def iteracion_valores_mdp(vectorizado=False):
+    """
+    Calcula las utilidades óptimas usando iteración de valores para MDP.
+    Con vectorizado=True usa el motor de mdp_vectorizado.py (un producto matriz-vector disperso por barrido).
+    """
     global U
+    if vectorizado:
+        # Recompensa esperada de (s, a): la suma de abajo sin el término de U; los terminales valen recompensa[s]
+        mdp = compilar_mdp(estados, acciones, lambda s, a: transiciones[(s, a)],
+                           lambda s, a: sum(p * recompensa.get((s, a, s2), 0) for s2, p in transiciones[(s, a)].items()),
+                           valor_terminal=lambda s: recompensa[s])
+        resultado = iteracion_valores(mdp, gamma, epsilon, U=[U[s] for s in estados])
+        U = mdp.nombrar(resultado.U)
+        return U
     while True:
         delta = 0  # Controla la convergencia
         U_nuevo = U.copy()  # Copia de las utilidades actuales
@@ -107,4 +125,48 @@ for s in estados:
 
 print("\nPolítica óptima:")
 for s, a in politica.items():
-    print(f"π({s}) = {a}")  # Imprime la política óptima
\ No newline at end of file
+    print(f"π({s}) = {a}")  # Imprime la política óptima
+
+# --- La misma iteración con matrices dispersas (mdp_vectorizado.py) ---
+# Los valores cambian: arriba el cambio de los estados terminales no entra en delta ('continue'), así que
+# el primer barrido ya da delta = 0 y se detiene; el motor sí cuenta a los terminales en delta.
+U = {s: 0 for s in estados}
+U_vectorizado = iteracion_valores_mdp(vectorizado=True)
+politica_vectorizada = politica_optima()
+print("\nCon matrices dispersas:")
+for s in estados:
+    print(f"U({s}) = {U_vectorizado[s]:.4f}   π({s}) = {politica_vectorizada[s]}")
+
+
+# --- Un MDP grande: inventario con un millón de estados ---
+# Estado: unidades en bodega (0..capacidad). Acción: cuántas unidades pedir. Cada día llega el pedido
+# (hasta llenar la bodega), se vende lo que pida la demanda (aleatoria) y se paga el almacenaje.
+# P y R se construyen directamente con NumPy: cada fila de P tiene una entrada por valor de la demanda.
+def mdp_inventario(capacidad, pedidos, demandas, prob_demanda, precio=5.0, costo_unidad=3.0, costo_fijo=50.0,
+                   costo_almacen=0.01):
+    S = capacidad + 1
+    stock = np.arange(S)
+    prob_demanda = np.asarray(prob_demanda, dtype=np.float64)
+    P, R = [], []
+    for q in pedidos:
+        y = np.minimum(stock + q, capacidad)  # Unidades después de recibir el pedido
+        siguientes = np.maximum(y[:, None] - np.asarray(demandas)[None, :], 0)  # (S, demandas)
+        vendidas = y[:, None] - siguientes
+        indptr = np.arange(0, S * len(demandas) + 1, len(demandas))
+        P.append(sparse.csr_matrix((np.tile(prob_demanda, S), siguientes.ravel(), indptr), shape=(S, S)))
+        R.append(precio * (vendidas @ prob_demanda) - costo_unidad * (y - stock) - costo_fijo * (q > 0)
+                 - costo_almacen * y)
+    return MDPDisperso(P, R, estados=stock, acciones=list(pedidos))
+
+
+# El ejemplo grande tarda varios segundos: solo corre al ejecutar el script directamente
+if __name__ == '__main__':
+    inicio = time.perf_counter()
+    inventario = mdp_inventario(1_000_000, pedidos=(0, 2_000, 5_000), demandas=(0, 1_000, 2_000, 4_000),
+                                prob_demanda=(0.2, 0.4, 0.3, 0.1))
+    resultado = iteracion_valores(inventario, gamma=0.95, epsilon=0.01)
+    print(f"\nInventario de {inventario.num_estados:,} estados: {resultado.iteraciones} barridos "
+          f"en {time.perf_counter() - inicio:.1f} s")
+    for unidades in (0, 1_000, 3_000, 10_000):
+        print(f"  Con {unidades:>6,} unidades en bodega: pedir {inventario.acciones[resultado.politica[unidades]]:,} "
+              f"(U = {resultado.U[unidades]:,.1f})")
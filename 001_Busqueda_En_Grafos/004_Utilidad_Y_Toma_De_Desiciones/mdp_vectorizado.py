@@ -0,0 +1,166 @@
+# Iteración de valores vectorizada con matrices de transición dispersas
+# Los scripts 004 y 005 guardan el MDP en diccionarios con estados como strings y (s, a) como llaves,
+# copian U en cada barrido y calculan cada suma de Bellman con un bucle de Python por estado.
+#
+# Aquí el MDP se compila a índices (estado -> 0..S-1, acción -> 0..A-1) y a arreglos:
+#   - P: las matrices de transición de todas las acciones, una debajo de otra, en UNA matriz CSR de
+#     (A * S) x S: la fila a * S + s es la distribución de s' al hacer a en s
+#   - R: arreglo denso (A, S) con la recompensa inmediata esperada de hacer a en s
+# Así, un respaldo de Bellman completo es un solo producto matriz-vector disperso más un máximo:
+#     Q = R + gamma * (P @ U).reshape(A, S)        U_nuevo = Q.max(axis=0)
+# Las acciones no disponibles en un estado valen -inf, y los estados sin acciones (terminales) se
+# quedan con su valor fijo. Con 10^6 estados y pocas acciones, un barrido tarda milisegundos.
+
+from collections import namedtuple
+
+import numpy as np
+from scipy import sparse
+
+# Resultado de una iteración de valores (politica[s] = índice de la acción, -1 en estados terminales)
+ResultadoIteracion = namedtuple('ResultadoIteracion', ['U', 'politica', 'iteraciones', 'delta'])
+
+
+class MDPDisperso:
+    """
+    MDP con estados y acciones como índices, transiciones dispersas y recompensas densas.
+      - P: lista con una matriz S x S por acción (de scipy.sparse o densa)
+      - R: arreglo (A, S) con la recompensa esperada de cada acción en cada estado
+      - disponibles: arreglo booleano (A, S), True si la acción se puede hacer en el estado
+        (por omisión todas en todos)
+      - valor_terminal: arreglo (S,) con el valor de los estados sin acciones (por omisión 0)
+      - estados / acciones: nombres originales, para traducir los resultados con nombrar
+    Sin acciones (P vacía) todos los estados son terminales; el número de estados sale entonces de
+    'estados', de 'valor_terminal' o de la forma (0, S) de R.
+    Para MDPs grandes conviene construir P y R directamente con NumPy (ver el inventario del script 005);
+    compilar_mdp sirve para los MDPs descritos con diccionarios, como los de los scripts.
+    """
+
+    def __init__(self, P, R, disponibles=None, valor_terminal=None, estados=None, acciones=None):
+        self.num_acciones = len(P)
+        if P:
+            self.num_estados = P[0].shape[0]
+            self.P = sparse.vstack([sparse.csr_matrix(p, dtype=np.float64) for p in P], format='csr')
+        else:
+            if estados is not None:
+                self.num_estados = len(estados)
+            elif valor_terminal is not None:
+                self.num_estados = len(valor_terminal)
+            else:
+                self.num_estados = np.shape(R)[-1]
+            self.P = sparse.csr_matrix((0, self.num_estados), dtype=np.float64)
+        self.R = np.asarray(R, dtype=np.float64).reshape(self.num_acciones, self.num_estados)
+
+        forma = (self.num_acciones, self.num_estados)
+        if disponibles is None:
+            self.disponibles = np.ones(forma, dtype=bool)
+            self._castigo = None
+        else:
+            self.disponibles = np.asarray(disponibles, dtype=bool).reshape(forma)
+            self._castigo = np.where(self.disponibles, 0.0, -np.inf)  # Se suma a Q en cada barrido
+        self.terminales = ~self.disponibles.any(axis=0)
+        self.valor_terminal = (np.zeros(self.num_estados) if valor_terminal is None
+                               else np.asarray(valor_terminal, dtype=np.float64))
+
+        self.estados = estados
+        self.acciones = acciones
+
+    def q_valores(self, U, gamma):
+        """Q[a, s] = R[a, s] + gamma * sum_s' P(s' | s, a) U(s')  (-inf si a no está disponible en s)."""
+        Q = self.P @ U
+        Q *= gamma
+        Q = Q.reshape(self.num_acciones, self.num_estados)
+        Q += self.R
+        if self._castigo is not None:
+            Q += self._castigo
+        return Q
+
+    def respaldo(self, U, gamma):
+        """Un barrido de Bellman: devuelve (U_nuevo, Q)."""
+        Q = self.q_valores(U, gamma)
+        if not self.num_acciones:
+            return self.valor_terminal.copy(), Q  # Sin acciones: todos los estados son terminales
+        U_nuevo = Q.max(axis=0)
+        U_nuevo[self.terminales] = self.valor_terminal[self.terminales]
+        return U_nuevo, Q
+
+    def nombrar(self, U, politica=None):
+        """Traduce U (y la política) a diccionarios {estado: valor} y {estado: acción o None}."""
+        valores = {s: float(u) for s, u in zip(self.estados, U)}
+        if politica is None:
+            return valores
+        acciones = {s: (self.acciones[a] if a >= 0 else None) for s, a in zip(self.estados, politica)}
+        return valores, acciones
+
+
+def compilar_mdp(estados, acciones, transiciones, recompensa, valor_terminal=None):
+    """
+    Compila un MDP descrito con funciones de Python a un MDPDisperso.
+      - estados: lista de estados (cualquier valor que sirva de llave)
+      - acciones: lista de acciones (todas disponibles en todos los estados) o {estado: [acciones]};
+        un estado con la lista vacía es terminal
+      - transiciones(s, a): {s': probabilidad} o lista de pares (s', probabilidad) (los repetidos se suman)
+      - recompensa(s, a): recompensa inmediata esperada de hacer a en s
+      - valor_terminal(s): valor de los estados terminales (por omisión 0)
+    """
+    por_estado = isinstance(acciones, dict)
+    if por_estado:
+        nombres_acciones = []
+        for s in estados:
+            for a in acciones[s]:
+                if a not in nombres_acciones:
+                    nombres_acciones.append(a)
+    else:
+        nombres_acciones = list(acciones)
+    indice_estado = {s: i for i, s in enumerate(estados)}
+    S, A = len(estados), len(nombres_acciones)
+
+    filas = [[] for _ in range(A)]
+    columnas = [[] for _ in range(A)]
+    probabilidades = [[] for _ in range(A)]
+    R = np.zeros((A, S))
+    disponibles = np.zeros((A, S), dtype=bool)
+    terminal = np.zeros(S)
+    for i, s in enumerate(estados):
+        disponibles_s = acciones[s] if por_estado else nombres_acciones
+        if not disponibles_s and valor_terminal is not None:
+            terminal[i] = valor_terminal(s)
+        for a in disponibles_s:
+            k = nombres_acciones.index(a)
+            disponibles[k, i] = True
+            R[k, i] = recompensa(s, a)
+            resultado = transiciones(s, a)
+            for s2, p in (resultado.items() if isinstance(resultado, dict) else resultado):
+                filas[k].append(i)
+                columnas[k].append(indice_estado[s2])
+                probabilidades[k].append(p)
+
+    # coo -> csr suma las entradas repetidas (dos desvíos que llevan al mismo estado)
+    P = [sparse.coo_matrix((probabilidades[k], (filas[k], columnas[k])), shape=(S, S)).tocsr() for k in range(A)]
+    return MDPDisperso(P, R, disponibles, terminal, estados=list(estados), acciones=nombres_acciones)
+
+
+def iteracion_valores(mdp, gamma=0.9, epsilon=0.001, max_iteraciones=None, U=None):
+    """
+    Iteración de valores sobre un MDPDisperso, con el mismo criterio de los scripts: se detiene cuando el
+    mayor cambio de un barrido es menor que 'epsilon'. Con epsilon=None hace exactamente
+    'max_iteraciones' barridos (como value_iteration del script 002 de aprendizaje por refuerzo).
+      - U: valores iniciales (por omisión 0 en todos los estados)
+    Devuelve ResultadoIteracion(U, politica, iteraciones, delta).
+    """
+    if epsilon is None and max_iteraciones is None:
+        raise ValueError("sin epsilon hay que indicar max_iteraciones")
+    U = np.zeros(mdp.num_estados) if U is None else np.array(U, dtype=np.float64)
+    iteraciones, delta = 0, np.inf
+    while max_iteraciones is None or iteraciones < max_iteraciones:
+        U_nuevo, _ = mdp.respaldo(U, gamma)
+        delta = float(np.abs(U_nuevo - U).max()) if mdp.num_estados else 0.0
+        U = U_nuevo
+        iteraciones += 1
+        if epsilon is not None and delta < epsilon:
+            break
+
+    # La política sale de los Q con los valores finales (un barrido más, sin actualizar U)
+    Q = mdp.q_valores(U, gamma)
+    politica = Q.argmax(axis=0) if mdp.num_acciones else np.zeros(mdp.num_estados, dtype=np.intp)
+    politica[mdp.terminales] = -1
+    return ResultadoIteracion(U, politica, iteraciones, delta)
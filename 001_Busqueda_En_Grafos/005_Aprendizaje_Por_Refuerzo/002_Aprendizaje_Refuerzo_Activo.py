@@ -38,6 +38,12 @@
 
 import copy # Necesario para copiar los diccionarios de valores
 import math 
+import os
+import sys
+
+# Motor de iteración de valores con matrices dispersas, compartido con los scripts de utilidad
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '004_Utilidad_Y_Toma_De_Desiciones'))
+from mdp_vectorizado import compilar_mdp, iteracion_valores
 
 # --- P1: Definición del Entorno (MDP - Mundo de Rejilla) ---
 
@@ -86,11 +92,21 @@ class GridWorld: # Define el entorno MDP
 
 # --- P2: Algoritmo de Aprendizaje Activo (Value Iteration) ---
 
-def value_iteration(grid, k=100): # Función principal del algoritmo
+def value_iteration(grid, k=100, vectorizado=False): # Función principal del algoritmo
     """
     Implementa el Aprendizaje Activo (Iteración de Valores)
     para encontrar la utilidad óptima V*(s).
+    Con vectorizado=True hace los mismos k barridos con mdp_vectorizado.py (matrices dispersas).
     """
+    if vectorizado:
+        # R(s) + gamma * max_a[...] = max_a[R(s) + gamma * ...]: la recompensa del estado va en cada acción,
+        # y los terminales (sin acciones) valen su recompensa
+        mdp = compilar_mdp(grid.states,
+                           {s: ([] if s in grid.terminal_states else grid.actions) for s in grid.states},
+                           lambda s, a: [(s2, p) for p, s2 in grid.get_transitions(s, a)],
+                           lambda s, a: grid.rewards[s],
+                           valor_terminal=lambda s: grid.rewards[s])
+        return mdp.nombrar(iteracion_valores(mdp, grid.gamma, epsilon=None, max_iteraciones=k).U)
     
     # 1. Inicializar V(s) = 0 para todos los estados
     V = {s: 0.0 for s in grid.states} # Diccionario de Utilidad/Valor, todo en 0.0
@@ -191,4 +207,10 @@ print_values_optimal(V_optimal, grid_active) # 3. Imprimir los V*
 
 print("\nExtrayendo la política óptima pi*(s)...") # Mensaje
 policy_optimal = extract_policy(grid_active, V_optimal) # 4. Ejecutar la Extracción de Política
-print_policy(policy_optimal, grid_active) # 5. Imprimir la política óptima (las flechas)
\ No newline at end of file
+print_policy(policy_optimal, grid_active) # 5. Imprimir la política óptima (las flechas)
+
+# --- La misma iteración con matrices dispersas (mdp_vectorizado.py) ---
+print("\nCon matrices dispersas:")
+V_vectorizado = value_iteration(grid_active, k=100, vectorizado=True)
+print_values_optimal(V_vectorizado, grid_active)
+print_policy(extract_policy(grid_active, V_vectorizado), grid_active)